@@ -0,0 +1,49 @@
+"""
+Benchmark Graph.bfs and Graph.breadth_first_search on random sparse graphs of growing size.
+
+With an O(1) Queue the time per vertex should stay roughly constant as the graph grows.
+
+Usage: python benchmarks/bfs_benchmark.py [max_vertices]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_graph(n: int, degree: int = 4) -> Graph:
+    rng = random.Random(n)
+    g = Graph()
+    for i in range(n):
+        g.add_vertex(i)
+    # A path guarantees a single component, random chords keep the frontier wide
+    for i in range(1, n):
+        g.add_edge(i - 1, i)
+    for _ in range(n * (degree - 2) // 2):
+        g.add_edge(rng.randrange(n), rng.randrange(n))
+    return g
+
+
+def main() -> None:
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n = 10_000
+    print(f"{'vertices':>10} {'bfs (s)':>10} {'us/vertex':>10} {'search (s)':>11} {'us/vertex':>10}")
+    while n <= max_n:
+        g = build_graph(n)
+        start = perf_counter()
+        g.bfs(0)
+        bfs_time = perf_counter() - start
+        start = perf_counter()
+        g.breadth_first_search(0)
+        search_time = perf_counter() - start
+        print(f"{n:>10} {bfs_time:>10.3f} {bfs_time / n * 1e6:>10.2f} {search_time:>11.3f} "
+              f"{search_time / n * 1e6:>10.2f}")
+        n *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark Graph.connected_components against finding components with one breadth first search per component,
+and same_component queries interleaved with add_edge on a growing graph.
+
+Graph.bfs resets every vertex before it starts, so one bfs per component is quadratic; that row is estimated from
+a single call rather than run in full.
+
+Usage: python benchmarks/components_benchmark.py [vertices]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_graph(n: int, m: int, seed: int) -> Graph:
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_vertex(i)
+    for _ in range(m):
+        g.add_edge(rng.randrange(n), rng.randrange(n))
+    return g
+
+
+def components_by_search(g: Graph) -> list:
+    seen = set()
+    components = []
+    for value in g.vertices:
+        if value not in seen:
+            component = list(g.breadth_first_search(value).distance)
+            seen.update(component)
+            components.append(component)
+    return components
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    # Below the n / 2 edge threshold a random graph falls apart into many small components
+    g = build_graph(n, n * 2 // 5, seed=1)
+
+    start = perf_counter()
+    expected = components_by_search(g)
+    search_time = perf_counter() - start
+    start = perf_counter()
+    components = g.connected_components()
+    union_find_time = perf_counter() - start
+    assert len(components) == len(expected)
+    start = perf_counter()
+    g.bfs(0)
+    reset_time = (perf_counter() - start) * len(components)
+    print(f"{n} vertices, {len(g.edges)} edges, {len(components)} components")
+    print(f"{'bfs per component (s)':>28} {reset_time:>8.1f} (estimated)")
+    print(f"{'breadth_first_search (s)':>28} {search_time:>8.3f}")
+    print(f"{'connected_components (s)':>28} {union_find_time:>8.3f}")
+
+    rng = random.Random(2)
+    g = build_graph(n, 0, seed=3)
+    g.same_component(0, 0)
+    start = perf_counter()
+    for _ in range(n):
+        g.add_edge(rng.randrange(n), rng.randrange(n))
+        g.same_component(rng.randrange(n), rng.randrange(n))
+    elapsed = perf_counter() - start
+    print(f"{'add_edge + same_component/s':>28} {n / elapsed:>8,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark Graph.dfs, topological_sort, has_cycle and the Kahn's algorithm orders on deep chains and wide DAGs.
+
+Deep chains used to raise RecursionError past ~1000 vertices.
+
+Usage: python benchmarks/dfs_benchmark.py [vertices]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def deep_chain(n: int) -> Graph:
+    g = Graph(directed=True)
+    for i in range(n):
+        g.add_vertex(i)
+    for i in range(1, n):
+        g.add_edge(i - 1, i)
+    return g
+
+
+def wide_dag(n: int, layers: int = 10, degree: int = 4) -> Graph:
+    rng = random.Random(n)
+    g = Graph(directed=True)
+    width = n // layers
+    for i in range(width * layers):
+        g.add_vertex(i)
+    for layer in range(layers - 1):
+        for i in range(layer * width, (layer + 1) * width):
+            for _ in range(degree):
+                g.add_edge(i, (layer + 1) * width + rng.randrange(width))
+    return g
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'graph':>12} {'vertices':>9} {'edges':>9} {'dfs':>8} {'topo':>8} {'cycle':>8} {'kahn':>8} {'waves':>8}")
+    for name, g in (('deep chain', deep_chain(n)), ('wide DAG', wide_dag(n))):
+        timings = []
+        operations = (g.dfs, g.topological_sort, g.has_cycle, lambda: list(g.topological_order()),
+                      lambda: list(g.topological_waves()))
+        for operation in operations:
+            start = perf_counter()
+            operation()
+            timings.append(perf_counter() - start)
+        print(f"{name:>12} {len(g.vertices):>9} {len(g.edges):>9} " + ' '.join(f"{t:>7.3f}s" for t in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark Graph.dijkstra and Graph.a_star against a plain heapq implementation with lazy deletion on grid road
+networks of growing size.
+
+The grid is a square lattice with random integer travel times, roughly the degree and shape of a road network.
+
+Usage: python benchmarks/dijkstra_benchmark.py [max_vertices]
+"""
+import os
+import sys
+import heapq
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_grid(side: int) -> Graph:
+    rng = random.Random(side)
+    g = Graph(weighted=True)
+    for x in range(side):
+        for y in range(side):
+            g.add_vertex((x, y))
+    for x in range(side):
+        for y in range(side):
+            if x + 1 < side:
+                g.add_edge((x, y), (x + 1, y), rng.randint(1, 10))
+            if y + 1 < side:
+                g.add_edge((x, y), (x, y + 1), rng.randint(1, 10))
+    return g
+
+
+def heapq_dijkstra(g: Graph, source) -> dict:
+    # Stale entries are left in the heap and skipped when popped
+    source = g.vertices[source]
+    distance = {source: 0}
+    heap = [(0, id(source), source)]
+    done = set()
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        for v, weight in g.adj[u].items():
+            nd = d + weight
+            if nd < distance.get(v, nd + 1):
+                distance[v] = nd
+                heapq.heappush(heap, (nd, id(v), v))
+    return distance
+
+
+def main() -> None:
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 250_000
+    side = 100
+    print(f"{'vertices':>10} {'dijkstra (s)':>13} {'heapq (s)':>10} {'a* corner (s)':>14}")
+    while side * side <= max_n:
+        g = build_grid(side)
+        target = (side - 1, side - 1)
+
+        start = perf_counter()
+        result = g.dijkstra((0, 0))
+        dijkstra_time = perf_counter() - start
+        start = perf_counter()
+        expected = heapq_dijkstra(g, (0, 0))
+        heapq_time = perf_counter() - start
+        start = perf_counter()
+        g.a_star((0, 0), target, lambda v: abs(target[0] - v[0]) + abs(target[1] - v[1]))
+        a_star_time = perf_counter() - start
+
+        assert result.distance[target] == expected[g.vertices[target]]
+        print(f"{side * side:>10} {dijkstra_time:>13.3f} {heapq_time:>10.3f} {a_star_time:>14.3f}")
+        side *= 2
+
+
+if __name__ == '__main__':
+    main()
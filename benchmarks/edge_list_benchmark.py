@@ -0,0 +1,57 @@
+"""
+Benchmark Graph.from_edge_list against building the same graph with add_vertex and add_edge, in edges per second.
+
+A random weighted edge list is written to a temporary file first, then loaded with buffered reads and with mmap.
+
+Usage: python benchmarks/edge_list_benchmark.py [edges]
+"""
+import os
+import sys
+import random
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def write_edges(path: str, edges: int) -> None:
+    rng = random.Random(edges)
+    vertices = max(edges // 8, 2)
+    with open(path, 'w') as file:
+        for _ in range(edges):
+            file.write(f"{rng.randrange(vertices)} {rng.randrange(vertices)} {rng.randint(1, 100)}\n")
+
+
+def add_edges(path: str) -> Graph:
+    # What loading looked like before from_edge_list
+    g = Graph(weighted=True)
+    with open(path) as file:
+        for line in file:
+            v, u, weight = line.split()
+            for value in (v, u):
+                if value not in g.vertices:
+                    g.add_vertex(value)
+            g.add_edge(v, u, float(weight))
+    return g
+
+
+def main() -> None:
+    edges = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'edges.txt')
+        write_edges(path, edges)
+        print(f"{edges} edges, {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"{'loader':>16} {'seconds':>8} {'edges/s':>12}")
+        for name, load in (('add_edge', lambda: add_edges(path)),
+                           ('from_edge_list', lambda: Graph.from_edge_list(path, weighted=True)),
+                           ('  with mmap', lambda: Graph.from_edge_list(path, weighted=True, use_mmap=True))):
+            start = perf_counter()
+            load()
+            elapsed = perf_counter() - start
+            print(f"{name:>16} {elapsed:>8.3f} {edges / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare memory use and traversal speed of Graph against the FrozenGraph returned by Graph.freeze().
+
+Usage: python benchmarks/frozen_graph_benchmark.py [vertices] [edges]
+"""
+import os
+import sys
+import random
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_graph(n: int, m: int) -> Graph:
+    rng = random.Random(n)
+    g = Graph(directed=True)
+    for i in range(n):
+        g.add_vertex(i)
+    for _ in range(m):
+        g.add_edge(rng.randrange(n), rng.randrange(n))
+    return g
+
+
+def timed(function) -> float:
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * n
+
+    tracemalloc.start()
+    g = build_graph(n, m)
+    graph_bytes = tracemalloc.get_traced_memory()[0]
+    frozen = g.freeze()
+    frozen_bytes = tracemalloc.get_traced_memory()[0] - graph_bytes
+    tracemalloc.stop()
+
+    print(f"{n} vertices, {len(g.edges)} edges")
+    print(f"{'':>16} {'Graph':>10} {'FrozenGraph':>12} {'ratio':>7}")
+    print(f"{'memory (MB)':>16} {graph_bytes / 2 ** 20:>10.1f} {frozen_bytes / 2 ** 20:>12.1f} "
+          f"{graph_bytes / frozen_bytes:>7.1f}")
+    for name, slow, fast in (('bfs', lambda: g.bfs(0), lambda: frozen.bfs(0)),
+                             ('dfs', g.dfs, frozen.dfs),
+                             ('topological_sort', g.topological_sort, frozen.topological_sort),
+                             ('is_bipartite', g.is_bipartite, frozen.is_bipartite)):
+        slow_time, fast_time = timed(slow), timed(fast)
+        print(f"{name + ' (s)':>16} {slow_time:>10.3f} {fast_time:>12.3f} {slow_time / fast_time:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
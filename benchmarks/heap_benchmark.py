@@ -0,0 +1,83 @@
+"""
+Benchmark insert, extract and set_priority throughput of the heaps module against heapq.
+
+heapq has no decrease-key, so its set_priority column pushes a new entry and leaves the old one to be skipped on
+extract (lazy deletion), which is how it is normally used.
+
+Usage: python benchmarks/heap_benchmark.py [operations]
+"""
+import os
+import sys
+import heapq
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from heaps import MaxHeap, MinHeap, DaryHeap  # noqa: E402
+
+
+def run_heap(heap, extract, priorities, updates) -> tuple:
+    start = perf_counter()
+    for item, priority in enumerate(priorities):
+        heap.insert(item, priority)
+    insert_time = perf_counter() - start
+
+    start = perf_counter()
+    for item, priority in updates:
+        heap.set_priority(item, priority)
+    update_time = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(len(priorities)):
+        extract()
+    return insert_time, update_time, perf_counter() - start
+
+
+def run_heapq(priorities, updates) -> tuple:
+    heap = []
+    current = {}
+    start = perf_counter()
+    for item, priority in enumerate(priorities):
+        current[item] = priority
+        heapq.heappush(heap, (priority, item))
+    insert_time = perf_counter() - start
+
+    start = perf_counter()
+    for item, priority in updates:
+        current[item] = priority
+        heapq.heappush(heap, (priority, item))
+    update_time = perf_counter() - start
+
+    start = perf_counter()
+    while heap:
+        priority, item = heapq.heappop(heap)
+        if current.get(item) == priority:
+            del current[item]
+    return insert_time, update_time, perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(0)
+    priorities = [rng.random() for _ in range(n)]
+    # Priorities only move towards the front of the heap so every variant can apply them with set_priority
+    updates = [(item, priorities[item] * rng.random()) for item in rng.sample(range(n), n // 2)]
+    max_updates = [(item, 2 - priority) for item, priority in updates]
+
+    print(f"{n} items, {len(updates)} updates")
+    print(f"{'heap':>12} {'insert/s':>12} {'update/s':>12} {'extract/s':>12}")
+    max_heap = MaxHeap()
+    rows = [('MaxHeap', run_heap(max_heap, max_heap.extract_max, [1 - p for p in priorities], max_updates))]
+    for name, heap in (('MinHeap', MinHeap()), ('DaryHeap(3)', DaryHeap(d=3)), ('DaryHeap(4)', DaryHeap(d=4)),
+                       ('DaryHeap(8)', DaryHeap(d=8))):
+        rows.append((name, run_heap(heap, heap.extract_min, priorities, updates)))
+    rows.append(('heapq', run_heapq(priorities, updates)))
+
+    for name, (insert_time, update_time, extract_time) in rows:
+        print(f"{name:>12} {n / insert_time:>12,.0f} {len(updates) / update_time:>12,.0f} "
+              f"{n / extract_time:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark the bulk operations of the heaps module: heapify against one insert per item, push_many against
+insert loops for small and large batches, and streaming nlargest against heapq.nlargest.
+
+Usage: python benchmarks/heap_bulk_benchmark.py [items]
+"""
+import os
+import sys
+import heapq
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from heaps import DaryHeap, nlargest  # noqa: E402
+
+
+def timed(function, *args) -> float:
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def insert_all(heap, pairs) -> None:
+    for item, priority in pairs:
+        heap.insert(item, priority)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    pairs = [(i, rng.random()) for i in range(n)]
+
+    print(f"{n} (item, priority) pairs")
+    print(f"{'inserts (s)':>20} {timed(insert_all, DaryHeap(), pairs):>8.3f}")
+    print(f"{'heapify (s)':>20} {timed(DaryHeap().heapify, pairs):>8.3f}")
+
+    for batch in (n // 100, n // 2):
+        base = pairs[:n - batch]
+        heap = DaryHeap()
+        heap.heapify(base)
+        loop_time = timed(insert_all, heap, pairs[n - batch:])
+        heap = DaryHeap()
+        heap.heapify(base)
+        many_time = timed(heap.push_many, pairs[n - batch:])
+        print(f"{f'batch {batch} loop (s)':>20} {loop_time:>8.3f}")
+        print(f"{f'batch {batch} many (s)':>20} {many_time:>8.3f}")
+
+    for k in (10, 1000):
+        print(f"{f'nlargest {k} (s)':>20} {timed(nlargest, k, iter(pairs)):>8.3f}")
+        print(f"{f'heapq.nlargest {k} (s)':>20} "
+              f"{timed(heapq.nlargest, k, iter(pairs), lambda pair: pair[1]):>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare the HeapNode layout of MinHeap and DaryHeap with the parallel array layout of ArrayMinHeap: bytes per
+entry, and insert, set_priority and extract throughput on float priorities.
+
+Usage: python benchmarks/heap_layout_benchmark.py [items]
+"""
+import os
+import sys
+import random
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from heaps import MinHeap, DaryHeap, ArrayMinHeap  # noqa: E402
+
+
+def bytes_per_entry(make, pairs) -> float:
+    # Priorities are created inside the measurement so the float objects held by HeapNode are counted
+    tracemalloc.start()
+    heap = make()
+    heap.heapify((item, priority * 1.0) for item, priority in pairs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del heap
+    return size / len(pairs)
+
+
+def throughput(make, pairs, updates) -> tuple:
+    heap = make()
+    start = perf_counter()
+    for item, priority in pairs:
+        heap.insert(item, priority)
+    insert_time = perf_counter() - start
+    start = perf_counter()
+    for item, priority in updates:
+        heap.set_priority(item, priority)
+    update_time = perf_counter() - start
+    start = perf_counter()
+    for _ in range(len(pairs)):
+        heap.extract_min()
+    extract_time = perf_counter() - start
+    return len(pairs) / insert_time, len(updates) / update_time, len(pairs) / extract_time
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(0)
+    pairs = [(i, rng.random()) for i in range(n)]
+    updates = [(item, rng.random()) for item in rng.sample(range(n), n // 2)]
+
+    print(f"{n} items, {len(updates)} updates")
+    print(f"{'heap':>16} {'bytes/entry':>12} {'insert/s':>12} {'update/s':>12} {'extract/s':>12}")
+    for name, make in (('MinHeap', MinHeap), ('ArrayMinHeap', ArrayMinHeap),
+                       ('DaryHeap(4)', lambda: DaryHeap(d=4)), ('ArrayMinHeap(4)', lambda: ArrayMinHeap(d=4))):
+        size = bytes_per_entry(make, pairs)
+        insert_rate, update_rate, extract_rate = throughput(make, pairs, updates)
+        print(f"{name:>16} {size:>12.1f} {insert_rate:>12,.0f} {update_rate:>12,.0f} {extract_rate:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark a heap used as a scheduler: a steady stream of new jobs, reprioritisations in both directions,
+cancellations and extractions, with the heap invariants and the positions index checked at the end.
+
+positions must stay the same size as the heap however many operations run, so its size is reported too.
+
+Usage: python benchmarks/heap_scheduler_benchmark.py [operations]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from heaps import MaxHeap, MinHeap, DaryHeap  # noqa: E402
+
+LIVE_JOBS = 10_000
+
+
+def run(heap, operations: int) -> float:
+    rng = random.Random(0)
+    live = []  # jobs in the heap, where[job] is the index of job in live
+    where = {}
+    next_job = 0
+    start = perf_counter()
+    for _ in range(operations):
+        operation = rng.random()
+        if operation < 0.3 or len(live) < LIVE_JOBS // 2:
+            heap.insert(next_job, rng.random())
+            where[next_job] = len(live)
+            live.append(next_job)
+            next_job += 1
+            continue
+        if operation < 0.7:
+            heap.set_priority(live[rng.randrange(len(live))], rng.random())
+            continue
+        if operation < 0.85:
+            job = live[rng.randrange(len(live))]
+            heap.remove(job)
+        else:
+            [job] = heap.pop_many(1)
+        i = where.pop(job)
+        last = live.pop()
+        if last != job:
+            live[i] = last
+            where[last] = i
+    elapsed = perf_counter() - start
+
+    assert len(heap.positions) == len(heap.heap) == len(live)
+    for item, i in heap.positions.items():
+        assert heap.heap[i].value == item
+    for i in range(1, len(heap.heap)):
+        parent, child = heap.heap[(i - 1) // heap.d].priority, heap.heap[i].priority
+        assert parent >= child if isinstance(heap, MaxHeap) else parent <= child
+    return elapsed
+
+
+def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    print(f"{operations} mixed operations")
+    print(f"{'heap':>12} {'ops/s':>12} {'positions':>10}")
+    for name, heap in (('MaxHeap', MaxHeap()), ('MinHeap', MinHeap()), ('DaryHeap(4)', DaryHeap(d=4))):
+        elapsed = run(heap, operations)
+        print(f"{name:>12} {operations / elapsed:>12,.0f} {len(heap.positions):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark point-to-point hop queries on random sparse graphs against a full breadth first search per query.
+
+Graph.shortest_path and Graph.within_hops stop as soon as the answer is known, so their cost depends on the
+neighbourhoods of the two endpoints rather than on the size of the graph.
+
+Usage: python benchmarks/hop_query_benchmark.py [max_vertices]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+from bfs_benchmark import build_graph  # noqa: E402
+
+QUERIES = 200
+
+
+def time_queries(g: Graph, pairs, query) -> float:
+    start = perf_counter()
+    for source, target in pairs:
+        query(g, source, target)
+    return (perf_counter() - start) / len(pairs)
+
+
+def main() -> None:
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n = 10_000
+    print(f"{'vertices':>10} {'full bfs (ms)':>14} {'path (ms)':>10} {'3 hops (ms)':>12}")
+    while n <= max_n:
+        g = build_graph(n)
+        rng = random.Random(0)
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(QUERIES)]
+        full = time_queries(g, pairs[:10], lambda g, s, t: g.breadth_first_search(s).path_to(t))
+        path = time_queries(g, pairs, Graph.shortest_path)
+        near = time_queries(g, pairs, lambda g, s, t: g.within_hops(s, t, 3))
+        print(f"{n:>10} {full * 1e3:>14.3f} {path * 1e3:>10.3f} {near * 1e3:>12.3f}")
+        n *= 2
+
+
+if __name__ == '__main__':
+    main()
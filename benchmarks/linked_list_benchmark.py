@@ -0,0 +1,62 @@
+"""
+Micro-benchmarks for the LinkedList methods that walk the whole list.
+
+The first row compares the old LinkedListIterator object against the generator now returned by __iter__,
+the remaining rows time each method and report the cost per element.
+
+Usage: python benchmarks/linked_list_benchmark.py [elements]
+"""
+import os
+import sys
+from time import perf_counter
+from timeit import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from linked_list import LinkedList, LinkedListIterator  # noqa: E402
+
+
+def report(name: str, seconds: float, n: int) -> None:
+    print(f"{name:>28} {seconds * 1e3:>10.2f} ms {seconds / n * 1e9:>10.1f} ns/elem")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    linked_list = LinkedList(range(n))
+    other = LinkedList(range(n))
+    repeats = 5
+
+    def best(statement) -> float:
+        return min(timeit(statement, number=1) for _ in range(repeats))
+
+    print(f"{n} elements, best of {repeats}")
+    report('LinkedListIterator', best(lambda: sum(1 for _ in LinkedListIterator(linked_list.head, False, False))), n)
+    report('__iter__', best(lambda: sum(1 for _ in linked_list)), n)
+    report('iter_nodes', best(lambda: sum(1 for _ in linked_list.iter_nodes())), n)
+    report('iter_node_pairs', best(lambda: sum(1 for _ in linked_list.iter_node_pairs())), n)
+    report('__contains__ (miss)', best(lambda: -1 in linked_list), n)
+    report('count', best(lambda: linked_list.count(0)), n)
+    report('__str__', best(lambda: str(linked_list)), n)
+    report('__getitem__ (middle)', best(lambda: linked_list[n // 2]), n // 2)
+    report('__eq__', best(lambda: linked_list == other), n)
+    report('__lt__', best(lambda: linked_list < other), n)
+    linked_list.build_index()
+    report('__getitem__ (indexed)', best(lambda: [linked_list[i] for i in range(0, n, n // 100)]), 100)
+    linked_list.drop_index()
+    report('_get_slice [::2]', best(lambda: linked_list[::2]), n)
+    report('__add__', best(lambda: linked_list + other), 2 * n)
+    report('copy', best(linked_list.copy), n)
+    report('__mul__ (x3)', best(lambda: linked_list * 3), 3 * n)
+    report('extend', best(lambda: LinkedList().extend(other)), n)
+
+    def splice() -> float:
+        left, right = LinkedList(range(n)), LinkedList(range(n))
+        start = perf_counter()
+        left.splice(right)
+        return perf_counter() - start
+
+    report('splice', min(splice() for _ in range(repeats)), 2 * n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Report bytes per element for linked lists, graphs and heaps.
+
+Each structure is measured twice: once with the library's slotted node types and once with a dict-backed
+subclass of the same node type, which is how the nodes were laid out before they gained __slots__.
+
+Usage: python benchmarks/memory_benchmark.py [elements]
+"""
+import os
+import sys
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+import graph  # noqa: E402
+import heaps  # noqa: E402
+import linked_list  # noqa: E402
+
+
+class DictNode(linked_list.Node):
+    pass
+
+
+class DictVertex(graph.Vertex):
+    pass
+
+
+class DictHeapNode(heaps.HeapNode):
+    pass
+
+
+def measure(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    structure = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size
+
+
+def build_list(n: int) -> Callable[[], object]:
+    return lambda: linked_list.LinkedList(range(n))
+
+
+def build_graph(n: int) -> Callable[[], object]:
+    def build():
+        g = graph.Graph(directed=True)
+        for i in range(n):
+            g.add_vertex(i)
+        for i in range(1, n):
+            g.add_edge(i - 1, i)
+        return g
+    return build
+
+
+def build_heap(n: int) -> Callable[[], object]:
+    return lambda: heaps.MaxHeap(range(n))
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cases = [
+        ('LinkedList', build_list, linked_list, 'Node', DictNode),
+        ('Graph', build_graph, graph, 'Vertex', DictVertex),
+        ('MaxHeap', build_heap, heaps, 'HeapNode', DictHeapNode),
+    ]
+    print(f"{n} elements")
+    print(f"{'structure':>12} {'dict B/elem':>12} {'slots B/elem':>13} {'saved':>7}")
+    for name, builder, module, node_name, dict_type in cases:
+        slotted_type = getattr(module, node_name)
+        setattr(module, node_name, dict_type)
+        try:
+            before = measure(builder(n))
+        finally:
+            setattr(module, node_name, slotted_type)
+        after = measure(builder(n))
+        print(f"{name:>12} {before / n:>12.1f} {after / n:>13.1f} {1 - after / before:>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Multi-producer, multi-consumer throughput of ConcurrentQueue against the standard library queue.Queue, for single
+gets and batched get_many, plus AsyncQueue against asyncio.Queue with producer and consumer tasks.
+
+Usage: python benchmarks/mpmc_queue_benchmark.py [items]
+"""
+import os
+import sys
+import queue
+import asyncio
+import threading
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from queues import ConcurrentQueue, ConcurrentPriorityQueue, AsyncQueue  # noqa: E402
+
+PRODUCERS = 4
+CONSUMERS = 4
+MAXSIZE = 1024
+BATCH = 64
+
+
+def run_threads(q, items: int, batch: int) -> float:
+    per_producer = items // PRODUCERS
+
+    def produce():
+        for i in range(per_producer):
+            q.put(i)
+
+    def consume():
+        if batch > 1:
+            while None not in q.get_many(batch):
+                pass
+        else:
+            while q.get() is not None:
+                pass
+
+    threads = [threading.Thread(target=produce) for _ in range(PRODUCERS)]
+    consumers = [threading.Thread(target=consume) for _ in range(CONSUMERS)]
+    start = perf_counter()
+    for thread in threads + consumers:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Batched consumers may take several stop markers at once, keep adding them until every consumer has stopped
+    while any(thread.is_alive() for thread in consumers):
+        q.put(None)
+        for thread in consumers:
+            thread.join(0.001)
+    return perf_counter() - start
+
+
+def run_tasks(q, items: int) -> float:
+    per_producer = items // PRODUCERS
+
+    async def produce():
+        for i in range(per_producer):
+            await q.put(i)
+
+    async def consume():
+        while await q.get() is not None:
+            pass
+
+    async def main():
+        consumers = [asyncio.create_task(consume()) for _ in range(CONSUMERS)]
+        await asyncio.gather(*(produce() for _ in range(PRODUCERS)))
+        for _ in consumers:
+            await q.put(None)
+        await asyncio.gather(*consumers)
+
+    start = perf_counter()
+    asyncio.run(main())
+    return perf_counter() - start
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{items} items, {PRODUCERS} producers, {CONSUMERS} consumers, capacity {MAXSIZE}")
+    print(f"{'queue':>28} {'items/s':>12}")
+    rows = [
+        ('queue.Queue', run_threads(queue.Queue(MAXSIZE), items, 1)),
+        ('ConcurrentQueue', run_threads(ConcurrentQueue(MAXSIZE), items, 1)),
+        (f'ConcurrentQueue get_many {BATCH}', run_threads(ConcurrentQueue(MAXSIZE), items, BATCH)),
+        ('ConcurrentPriorityQueue', run_threads(ConcurrentPriorityQueue(MAXSIZE), items, 1)),
+        ('asyncio.Queue', run_tasks(asyncio.Queue(MAXSIZE), items)),
+        ('AsyncQueue', run_tasks(AsyncQueue(MAXSIZE), items)),
+    ]
+    for name, elapsed in rows:
+        print(f"{name:>28} {items / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
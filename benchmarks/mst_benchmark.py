@@ -0,0 +1,48 @@
+"""
+Benchmark Graph.kruskal against Graph.prim on sparse and dense random weighted graphs.
+
+Kruskal sorts every edge once, O(m log m), while Prim keeps at most one heap entry per vertex, O(m log n), so Prim
+is expected to pull ahead as the average degree grows.
+
+Usage: python benchmarks/mst_benchmark.py [vertices]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_graph(n: int, m: int) -> Graph:
+    rng = random.Random(m)
+    g = Graph(weighted=True)
+    for i in range(n):
+        g.add_vertex(i)
+    # A path keeps the graph connected so both algorithms build a single tree
+    for i in range(1, n):
+        g.add_edge(i - 1, i, rng.random())
+    for _ in range(m - n + 1):
+        g.add_edge(rng.randrange(n), rng.randrange(n), rng.random())
+    return g
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    print(f"{'vertices':>10} {'edges':>10} {'degree':>7} {'kruskal (s)':>12} {'prim (s)':>10}")
+    for m in (4 * n, 16 * n, n * n // 8, n * n // 2):
+        g = build_graph(n, m)
+        start = perf_counter()
+        _, kruskal_total = g.kruskal()
+        kruskal_time = perf_counter() - start
+        start = perf_counter()
+        _, prim_total = g.prim()
+        prim_time = perf_counter() - start
+        assert abs(kruskal_total - prim_total) < 1e-6
+        print(f"{n:>10} {len(g.edges):>10} {2 * len(g.edges) / n:>7.0f} {kruskal_time:>12.3f} {prim_time:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
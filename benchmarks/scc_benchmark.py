@@ -0,0 +1,60 @@
+"""
+Benchmark strongly connected components and the condensation DAG on a synthetic dependency graph.
+
+Every module depends on a few earlier modules, and a fraction of dependencies point forward instead, which closes
+cycles of varying size the way real dependency graphs pick them up.
+
+Usage: python benchmarks/scc_benchmark.py [modules]
+"""
+import os
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from graph import Graph  # noqa: E402
+
+
+def build_dependencies(n: int, degree: int = 3, forward: float = 0.02) -> Graph:
+    rng = random.Random(n)
+    g = Graph(directed=True)
+    for i in range(n):
+        g.add_vertex(i)
+    for i in range(1, n):
+        for _ in range(degree):
+            if rng.random() < forward:
+                g.add_edge(i, rng.randrange(i, min(n, i + 1000)))
+            else:
+                g.add_edge(i, rng.randrange(max(0, i - 1000), i))
+    return g
+
+
+def timed(function):
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    g = build_dependencies(n)
+    print(f"{n} modules, {len(g.edges)} dependencies")
+
+    freeze_time, frozen = timed(g.freeze)
+    scc_time, (component, count) = timed(frozen.strongly_connected_components)
+    condensation_time, (dag, _) = timed(frozen.condensation)
+    graph_time, components = timed(g.strongly_connected_components)
+    assert len(components) == count
+
+    largest = max(len(members) for members in components)
+    print(f"{count} components, largest {largest}, condensation has {dag.edge_count()} edges")
+    print(f"{'freeze (s)':>40} {freeze_time:>8.3f}")
+    print(f"{'FrozenGraph scc (s)':>40} {scc_time:>8.3f}")
+    print(f"{'FrozenGraph condensation (s)':>40} {condensation_time:>8.3f}")
+    print(f"{'Graph.strongly_connected_components (s)':>40} {graph_time:>8.3f}")
+    print(f"{'us per vertex + edge':>40} {scc_time / (n + len(g.edges)) * 1e6:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
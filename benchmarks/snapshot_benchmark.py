@@ -0,0 +1,52 @@
+"""
+Benchmark FrozenGraph snapshots: rebuilding the graph from scratch against saving it once and loading the snapshot,
+with and without mmap, and the time until the loaded graph has answered its first bfs.
+
+Usage: python benchmarks/snapshot_benchmark.py [vertices] [edges]
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from frozen_graph import FrozenGraph  # noqa: E402
+from frozen_graph_benchmark import build_graph  # noqa: E402
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * n
+
+    start = perf_counter()
+    frozen = build_graph(n, m).freeze()
+    rebuild_time = perf_counter() - start
+    print(f"{n} vertices, {len(frozen.targets)} edge entries")
+    print(f"{'rebuild + freeze (s)':>28} {rebuild_time:>8.3f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.pysg')
+        start = perf_counter()
+        frozen.save(path)
+        print(f"{'save (s)':>28} {perf_counter() - start:>8.3f}")
+        print(f"{'file size (MB)':>28} {os.path.getsize(path) / 2 ** 20:>8.1f}")
+
+        for use_mmap in (True, False):
+            start = perf_counter()
+            loaded = FrozenGraph.load(path, use_mmap=use_mmap)
+            load_time = perf_counter() - start
+            loaded.neighbours(loaded.values[0])
+            first_query = perf_counter() - start
+            loaded.bfs(loaded.values[0])
+            first_bfs = perf_counter() - start
+            name = 'mmap' if use_mmap else 'read'
+            print(f"{f'load, {name} (s)':>28} {load_time:>8.3f}")
+            print(f"{f'first neighbours, {name} (s)':>28} {first_query:>8.3f}")
+            print(f"{f'first bfs, {name} (s)':>28} {first_bfs:>8.3f}")
+            assert loaded.bfs(frozen.values[0]) == frozen.bfs(frozen.values[0])
+            del loaded
+
+
+if __name__ == '__main__':
+    main()
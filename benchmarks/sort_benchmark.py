@@ -0,0 +1,65 @@
+"""
+Benchmark LinkedList.sort against sorted() on a Python list.
+
+Usage: python benchmarks/sort_benchmark.py [max_elements]
+Sizes grow by 10x from 10,000 up to max_elements (1,000,000 by default, pass 10000000 for the full run).
+"""
+import os
+import sys
+import random
+from time import perf_counter
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'pystructs'))
+
+from linked_list import LinkedList  # noqa: E402
+
+
+def random_data(n: int) -> List[int]:
+    rng = random.Random(n)
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_data(n: int) -> List[int]:
+    return list(range(n))
+
+
+def reverse_data(n: int) -> List[int]:
+    return list(range(n, 0, -1))
+
+
+def nearly_sorted_data(n: int) -> List[int]:
+    rng = random.Random(n)
+    data = list(range(n))
+    for _ in range(max(1, n // 1000)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def time_it(function: Callable[[], object]) -> float:
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def main() -> None:
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    generators = [('random', random_data), ('sorted', sorted_data), ('reverse', reverse_data),
+                  ('nearly sorted', nearly_sorted_data)]
+    print(f"{'data':>14} {'n':>10} {'sorted(list)':>13} {'LinkedList':>11} {'ratio':>7}")
+    n = 10_000
+    while n <= max_n:
+        for name, generator in generators:
+            data = generator(n)
+            list_time = time_it(lambda: sorted(data))
+            linked_list = LinkedList(data)
+            linked_list_time = time_it(linked_list.sort)
+            print(f"{name:>14} {n:>10} {list_time:>12.3f}s {linked_list_time:>10.3f}s "
+                  f"{linked_list_time / list_time:>7.1f}")
+            del linked_list
+        n *= 10
+
+
+if __name__ == '__main__':
+    main()
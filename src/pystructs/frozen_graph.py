@@ -0,0 +1,378 @@
+from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from linked_list import LinkedList
+import os
+import sys
+import mmap
+import pickle
+import struct
+
+# Vertex states used by dfs, equivalent to the 'white', 'gray' and 'black' colours of Graph
+WHITE, GRAY, BLACK = 0, 1, 2
+
+# Snapshot files start with a fixed header: magic, format version, flags, vertex count, edge entry count and the byte
+# offset of the pickled vertex values. offsets, targets and weights follow it as raw native-endian 8 byte values,
+# then the vertex values.
+SNAPSHOT_MAGIC = b'PYSG'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sHHqqq')
+DIRECTED, WEIGHTED, BIG_ENDIAN = 1, 2, 4
+
+
+class FrozenGraph:
+    # Immutable compressed sparse row (CSR) graph. Vertex values are mapped to dense ids 0..n-1 and the
+    # neighbours of vertex i are the ids targets[offsets[i]:offsets[i + 1]], with matching weights if weighted.
+    # The id arrays are memoryviews over the file instead when the graph was loaded from a memory-mapped snapshot.
+    values: List[Any]
+    ids: Dict[Any, int]
+    offsets: array | memoryview
+    targets: array | memoryview
+    weights: Optional[array | memoryview]
+
+    directed: bool
+
+    _reverse: Optional[Tuple[array, array]]
+
+    def __init__(self, values: List[Any], offsets: array | memoryview, targets: array | memoryview,
+                 weights: Optional[array | memoryview] = None, directed: bool = False) -> None:
+        if len(offsets) != len(values) + 1:
+            raise ValueError("offsets must have one more entry than there are vertices")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must have one entry per target")
+
+        self.values = values
+        self.ids = {value: i for i, value in enumerate(values)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self._reverse = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __str__(self) -> str:
+        return_string = ''
+        for i, value in enumerate(self.values):
+            return_string += f"{str(value)}: "
+            for j in range(self.offsets[i], self.offsets[i + 1]):
+                return_string += str(self.values[self.targets[j]]) + " "
+            return_string += '\n'
+
+        return return_string
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, use_mmap: bool = True) -> 'FrozenGraph':
+        # Read a snapshot written by save. With use_mmap the id arrays are views straight onto the mapped file, so
+        # loading only reads the header and vertex values and processes mapping the same file share its pages.
+        # The vertex values are unpickled, only load snapshots from trusted sources.
+        with open(path, 'rb') as file:
+            if use_mmap:
+                data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(file.read())
+
+        if len(data) < SNAPSHOT_HEADER.size:
+            raise ValueError("File is too short to be a graph snapshot")
+        magic, version, flags, n, m, values_start = SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("File is not a graph snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported graph snapshot version {version}")
+        if bool(flags & BIG_ENDIAN) != (sys.byteorder == 'big'):
+            raise ValueError("Graph snapshot was written on a machine with a different byte order")
+        weighted = bool(flags & WEIGHTED)
+        if values_start != SNAPSHOT_HEADER.size + 8 * (n + 1 + m * (2 if weighted else 1)):
+            raise ValueError("Graph snapshot header does not match its arrays")
+        if len(data) < values_start:
+            raise ValueError("Graph snapshot is truncated")
+
+        start = SNAPSHOT_HEADER.size
+        offsets = data[start:start + 8 * (n + 1)].cast('q')
+        start += 8 * (n + 1)
+        targets = data[start:start + 8 * m].cast('q')
+        start += 8 * m
+        weights = data[start:start + 8 * m].cast('d') if weighted else None
+        values = pickle.loads(data[values_start:])
+        return cls(values, offsets, targets, weights, directed=bool(flags & DIRECTED))
+
+    def save(self, path: str | os.PathLike) -> None:
+        flags = (DIRECTED if self.directed else 0) | (WEIGHTED if self.weighted else 0) \
+            | (BIG_ENDIAN if sys.byteorder == 'big' else 0)
+        n = len(self.values)
+        m = len(self.targets)
+        values_start = SNAPSHOT_HEADER.size + 8 * (n + 1 + m * (2 if self.weighted else 1))
+        # The snapshot is written to a new file next to path and renamed over it, so processes that have the old
+        # snapshot mapped keep reading it, even when self is that mapping, instead of seeing it truncated
+        directory, name = os.path.split(os.fspath(path))
+        temp_path = os.path.join(directory, f'.{name}.{os.urandom(6).hex()}.tmp')
+        try:
+            with open(temp_path, 'xb') as file:
+                file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, n, m, values_start))
+                file.write(self.offsets)
+                file.write(self.targets)
+                if self.weighted:
+                    file.write(self.weights)
+                pickle.dump(self.values, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @property
+    def weighted(self) -> bool:
+        return self.weights is not None
+
+    def edge_count(self) -> int:
+        # Undirected edges are stored once in each direction
+        return len(self.targets) if self.directed else len(self.targets) // 2
+
+    def neighbours(self, value: Any) -> List[Any]:
+        i = self.ids[value]
+        return [self.values[u] for u in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def bfs(self, source: Any) -> Tuple[array, array]:
+        # Returns (distance, parent) indexed by vertex id, -1 marks unreachable vertices and missing parents
+        n = len(self.values)
+        offsets = self.offsets
+        targets = self.targets
+        distance = array('q', [-1]) * n
+        parent = array('q', [-1]) * n
+
+        source = self.ids[source]
+        distance[source] = 0
+        frontier = [source]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for v in frontier:
+                for u in targets[offsets[v]:offsets[v + 1]]:
+                    if distance[u] == -1:
+                        distance[u] = level
+                        parent[u] = v
+                        next_frontier.append(u)
+            frontier = next_frontier
+        return distance, parent
+
+    def dfs(self) -> Tuple[array, array, array]:
+        # Returns (discovery time, finish time, parent) indexed by vertex id, -1 marks missing parents
+        discovery, finish, parent, _ = self._dfs()
+        return discovery, finish, parent
+
+    def has_cycle(self) -> bool:
+        return self._dfs()[3]
+
+    def topological_sort(self) -> LinkedList:
+        # Kahn's algorithm over the id arrays, an empty list is returned if the graph has a cycle
+        n = len(self.values)
+        offsets = self.offsets
+        targets = self.targets
+        in_degree = array('q', [0]) * n
+        for u in targets:
+            in_degree[u] += 1
+
+        order = [v for v in range(n) if in_degree[v] == 0]
+        for v in order:
+            for u in targets[offsets[v]:offsets[v + 1]]:
+                in_degree[u] -= 1
+                if in_degree[u] == 0:
+                    order.append(u)
+
+        if len(order) < n:
+            return LinkedList()
+        return LinkedList(self.values[v] for v in order)
+
+    def is_bipartite(self) -> bool:
+        # Two-colour every component, edges are followed in both directions for directed graphs
+        n = len(self.values)
+        neighbour_lists = [(self.offsets, self.targets)]
+        if self.directed:
+            neighbour_lists.append(self._reversed())
+
+        colour = bytearray(n)  # 0 uncoloured, 1 and 2 are the two sides
+        for root in range(n):
+            if colour[root]:
+                continue
+            colour[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for v in frontier:
+                    opposite = 3 - colour[v]
+                    for offsets, targets in neighbour_lists:
+                        for u in targets[offsets[v]:offsets[v + 1]]:
+                            if not colour[u]:
+                                colour[u] = opposite
+                                next_frontier.append(u)
+                            elif colour[u] != opposite:
+                                return False
+                frontier = next_frontier
+        return True
+
+    def strongly_connected_components(self) -> Tuple[array, int]:
+        # Returns (component, count), component[v] is the strongly connected component of vertex id v. Components
+        # are numbered in topological order of the condensation, so every edge between two components goes from a
+        # lower number to a higher one. Undirected graphs have their connected components as the result.
+        n = len(self.values)
+        offsets = self.offsets
+        targets = self.targets
+        index = array('q', [-1]) * n
+        low = array('q', [0]) * n
+        component = array('q', [-1]) * n
+        on_stack = bytearray(n)
+        next_edge = array('q', offsets)
+
+        # Iterative Tarjan, call is the depth first search path and stack holds visited vertices that are not yet
+        # assigned to a component. Components complete sinks first, so they are numbered down from n - 1 and
+        # shifted to start at 0 at the end.
+        counter = 0
+        last = n
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack = [root]
+            on_stack[root] = 1
+            call = [root]
+            while call:
+                v = call[-1]
+                j = next_edge[v]
+                end = offsets[v + 1]
+                while j < end:
+                    u = targets[j]
+                    j += 1
+                    if index[u] == -1:
+                        index[u] = low[u] = counter
+                        counter += 1
+                        stack.append(u)
+                        on_stack[u] = 1
+                        call.append(u)
+                        break
+                    if on_stack[u] and index[u] < low[v]:
+                        low[v] = index[u]
+                else:
+                    call.pop()
+                    if call and low[v] < low[call[-1]]:
+                        low[call[-1]] = low[v]
+                    if low[v] == index[v]:
+                        last -= 1
+                        while True:
+                            u = stack.pop()
+                            on_stack[u] = 0
+                            component[u] = last
+                            if u == v:
+                                break
+                next_edge[v] = j
+
+        count = n - last
+        if last:
+            for v in range(n):
+                component[v] -= last
+        return component, count
+
+    def condensation(self) -> Tuple['FrozenGraph', array]:
+        # Returns (dag, component) where dag has one vertex per strongly connected component, its values are the
+        # component numbers 0..count - 1 in topological order, and an edge wherever the graph has at least one
+        # edge between the two components. component is as returned by strongly_connected_components.
+        component, count = self.strongly_connected_components()
+        offsets = self.offsets
+        targets = self.targets
+
+        # Group vertex ids by component with a counting sort
+        start = array('q', [0]) * (count + 1)
+        for c in component:
+            start[c + 1] += 1
+        for c in range(count):
+            start[c + 1] += start[c]
+        members = array('q', [0]) * len(component)
+        position = array('q', start)
+        for v, c in enumerate(component):
+            members[position[c]] = v
+            position[c] += 1
+
+        dag_offsets = array('q', [0])
+        dag_targets = array('q')
+        seen = array('q', [-1]) * count  # seen[d] == c once the edge c -> d has been added
+        for c in range(count):
+            for k in range(start[c], start[c + 1]):
+                v = members[k]
+                for u in targets[offsets[v]:offsets[v + 1]]:
+                    d = component[u]
+                    if d != c and seen[d] != c:
+                        seen[d] = c
+                        dag_targets.append(d)
+            dag_offsets.append(len(dag_targets))
+        return FrozenGraph(list(range(count)), dag_offsets, dag_targets, directed=True), component
+
+    def _dfs(self) -> Tuple[array, array, array, bool]:
+        # Returns (discovery, finish, parent, has cycle)
+        n = len(self.values)
+        offsets = self.offsets
+        targets = self.targets
+        directed = self.directed
+        discovery = array('q', [-1]) * n
+        finish = array('q', [-1]) * n
+        parent = array('q', [-1]) * n
+        state = bytearray(n)
+        next_edge = array('q', offsets)
+        has_cycle = False
+
+        # Explicit stack of vertex ids instead of recursion, next_edge[v] is the next neighbour of v to look at. Only
+        # ints are pushed so deep searches do not allocate tracked objects and trigger garbage collection.
+        time = 0
+        for root in range(n):
+            if state[root] != WHITE:
+                continue
+            time += 1
+            discovery[root] = time
+            state[root] = GRAY
+            stack = [root]
+            while stack:
+                v = stack[-1]
+                j = next_edge[v]
+                end = offsets[v + 1]
+                while j < end:
+                    u = targets[j]
+                    j += 1
+                    if state[u] == WHITE:
+                        parent[u] = v
+                        time += 1
+                        discovery[u] = time
+                        state[u] = GRAY
+                        stack.append(u)
+                        break
+                    # In undirected graphs the edge back to the parent is the tree edge itself, not a cycle
+                    if state[u] == GRAY and (directed or u != parent[v]):
+                        has_cycle = True
+                else:
+                    stack.pop()
+                    state[v] = BLACK
+                    time += 1
+                    finish[v] = time
+                next_edge[v] = j
+        return discovery, finish, parent, has_cycle
+
+    def _reversed(self) -> Tuple[array, array]:
+        # CSR arrays of the reversed edges, built on first use
+        if self._reverse is None:
+            n = len(self.values)
+            offsets = self.offsets
+            targets = self.targets
+            reverse_offsets = array('q', [0]) * (n + 1)
+            for u in targets:
+                reverse_offsets[u + 1] += 1
+            for i in range(n):
+                reverse_offsets[i + 1] += reverse_offsets[i]
+
+            position = array('q', reverse_offsets)
+            reverse_targets = array('q', [0]) * len(targets)
+            for v in range(n):
+                for j in range(offsets[v], offsets[v + 1]):
+                    u = targets[j]
+                    reverse_targets[position[u]] = v
+                    position[u] += 1
+            self._reverse = (reverse_offsets, reverse_targets)
+        return self._reverse
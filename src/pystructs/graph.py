@@ -1,10 +1,18 @@
-from typing import Any, Set, Dict, Optional, Tuple, List
+from typing import Any, Set, Dict, Optional, Tuple, List, Iterator, Iterable, Callable, IO
+import os
+import mmap
+import threading
 from math import inf
+from array import array
 from queues import Queue
 from linked_list import LinkedList
+from frozen_graph import FrozenGraph
+from heaps import DaryHeap
+from union_find import DisjointSet
 
 
 class Vertex(object):
+    __slots__ = ('value', 'colour', 'distance', 'parent', 'finish_time')
     value: Any
     colour: Optional[str]
     distance: Optional[int | float]
@@ -22,15 +30,70 @@ class Vertex(object):
         return f"Vertex: {self.value}"
 
 
+class CycleError(ValueError):
+    cycle: List[Any]
+
+    def __init__(self, cycle: List[Any]) -> None:
+        super().__init__(f"graph contains a cycle: {' -> '.join(str(value) for value in cycle + cycle[:1])}")
+        self.cycle = cycle
+
+
+class SearchResult:
+    # Distances and parents found by a search from source, keyed by vertex value. Only reached vertices appear in
+    # distance, and every reached vertex except source appears in parent.
+    source: Any
+    distance: Dict[Any, int | float]
+    parent: Dict[Any, Any]
+
+    def __init__(self, source: Any, distance: Dict[Any, int | float], parent: Dict[Any, Any]) -> None:
+        self.source = source
+        self.distance = distance
+        self.parent = parent
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.distance
+
+    def path_to(self, target: Any) -> Optional[LinkedList]:
+        if target not in self.distance:
+            return None
+        path = LinkedList([target])
+        while target in self.parent:
+            target = self.parent[target]
+            path.insert(0, target)
+        return path
+
+
+class DFSResult:
+    # Discovery and finish times and parents of a full depth first search, keyed by vertex value. Roots of the
+    # search forest have no entry in parent.
+    discovery: Dict[Any, int]
+    finish: Dict[Any, int]
+    parent: Dict[Any, Any]
+    has_cycle: bool
+
+    def __init__(self, discovery: Dict[Any, int], finish: Dict[Any, int], parent: Dict[Any, Any],
+                 has_cycle: bool) -> None:
+        self.discovery = discovery
+        self.finish = finish
+        self.parent = parent
+        self.has_cycle = has_cycle
+
+
 class Graph:
     vertices: Dict[Any, Vertex]
     edges: Set[Tuple[Vertex, Vertex]]
-    adj: Dict[Vertex, Set[Vertex]]
+    adj: Dict[Vertex, Dict[Vertex, int | float]]  # neighbour -> edge weight
 
     directed: bool
     weighted: bool
 
     _has_cycle: bool
+    # Connected components kept up to date by add_vertex and add_edge once something has asked for them. The first
+    # query builds them under _components_lock, so queries may come from several threads at once, but changing the
+    # graph while other threads read it still needs the caller's own locking.
+    _components: Optional[DisjointSet]
+    _component_ids: Dict[Vertex, int]
+    _components_lock: threading.Lock
 
     def __init__(self, directed: bool = False, weighted: bool = False) -> None:
 
@@ -40,6 +103,19 @@ class Graph:
         self.directed = directed
         self.weighted = weighted
         self._has_cycle = False
+        self._components = None
+        self._component_ids = {}
+        self._components_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled or copied, the copy gets a fresh one
+        state = self.__dict__.copy()
+        del state['_components_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._components_lock = threading.Lock()
 
     def __str__(self) -> str:
         return_string = ''
@@ -53,7 +129,9 @@ class Graph:
 
     def add_vertex(self, value: Any) -> None:
         self.vertices[value] = Vertex(value)
-        self.adj[self.vertices[value]] = set()
+        self.adj[self.vertices[value]] = {}
+        if self._components is not None:
+            self._component_ids[self.vertices[value]] = self._components.add()
 
     def add_edge(self, v: Any, u: Any, weight: int | float = 1) -> None:
         v = self.vertices[v]
@@ -61,10 +139,82 @@ class Graph:
         self.edges.add((v, u))
 
         if self.directed:
-            self.adj[v].add(u)
+            self.adj[v][u] = weight
         else:
-            self.adj[v].add(u)
-            self.adj[u].add(v)
+            self.adj[v][u] = weight
+            self.adj[u][v] = weight
+        if self._components is not None:
+            self._components.union(self._component_ids[v], self._component_ids[u])
+
+    @classmethod
+    def from_edge_list(cls, source: str | os.PathLike | IO, directed: bool = False, weighted: bool = False,
+                       delimiter: Optional[str] = None, comment: Optional[str] = '#',
+                       vertex_type: Callable[[str], Any] = str, duplicates: str = 'last', use_mmap: bool = False,
+                       chunk_size: int = 1 << 22, encoding: str = 'utf-8') -> 'Graph':
+        # Build a graph from a path or open file with one edge per line, 'v u' or 'v u weight' if weighted, split
+        # on delimiter (whitespace by default). Vertices are created as they appear, their values are the fields
+        # passed through vertex_type. The file is read chunk_size bytes at a time, or through mmap if use_mmap is
+        # set and source is a path, and the adjacency dicts are filled directly rather than through add_edge. Bytes
+        # are decoded with encoding, lines end at '\n' with an optional '\r' before it.
+        # Blank lines are skipped. Repeated edges are stored once and duplicates picks the weight kept: 'first',
+        # 'last' or 'min'.
+        if duplicates not in ('first', 'last', 'min'):
+            raise ValueError("duplicates must be 'first', 'last' or 'min'")
+        g = cls(directed=directed, weighted=weighted)
+        vertices = g.vertices
+        adj = g.adj
+        edges = g.edges
+        fields = 3 if weighted else 2
+        weight = 1
+        convert = vertex_type is not str
+        find = vertices.get
+
+        for lines in _read_lines(source, chunk_size, use_mmap, encoding):
+            for line in lines:
+                if not line or line.isspace():
+                    continue
+                parts = line.split(delimiter)
+                if comment is not None and parts[0].startswith(comment):
+                    continue
+                if len(parts) < fields:
+                    raise ValueError(f"Expected {fields} fields in edge line: {line!r}")
+
+                v_value = vertex_type(parts[0]) if convert else parts[0]
+                v = find(v_value)
+                if v is None:
+                    v = vertices[v_value] = Vertex(v_value)
+                    adj[v] = {}
+                u_value = vertex_type(parts[1]) if convert else parts[1]
+                u = find(u_value)
+                if u is None:
+                    u = vertices[u_value] = Vertex(u_value)
+                    adj[u] = {}
+                if weighted:
+                    weight = float(parts[2])
+
+                neighbours = adj[v]
+                if u in neighbours:
+                    if duplicates == 'first' or (duplicates == 'min' and neighbours[u] <= weight):
+                        continue
+                else:
+                    edges.add((v, u))
+                neighbours[u] = weight
+                if not directed:
+                    adj[u][v] = weight
+        return g
+
+    def freeze(self) -> FrozenGraph:
+        # Snapshot of the current graph as flat id arrays, later changes to self are not reflected
+        ids = {vertex: i for i, vertex in enumerate(self.adj)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d') if self.weighted else None
+        for vertex, neighbours in self.adj.items():
+            targets.extend([ids[u] for u in neighbours])
+            if weights is not None:
+                weights.extend(neighbours.values())
+            offsets.append(len(targets))
+        return FrozenGraph([vertex.value for vertex in self.adj], offsets, targets, weights, directed=self.directed)
 
     def bfs(self, source: Any) -> None:
         for vertex in self.vertices.values():
@@ -97,32 +247,319 @@ class Graph:
         if topological_sort:
             topological_order = LinkedList()
 
-        def _dfs_visit(source: Vertex, time: int):
+        # Explicit stack of (vertex, iterator over its unvisited neighbours) instead of recursion, so deep graphs do
+        # not hit the recursion limit. As in CLRS, distance holds the discovery time.
+        time = 0
+        for root in self.vertices.values():
+            if root.colour != 'white':
+                continue
             time += 1
-            source.distance = time
-            source.colour = 'gray'
-            for v in self.adj[source]:
-                if v.colour == 'white':
-                    v.parent = source
-                    _dfs_visit(v, time)
-                if v.colour == 'gray':
-                    self._has_cycle = True
-            source.colour = 'black'
-            time += 1
-            source.finish_time = time
-            if topological_sort:
-                topological_order.insert(0, source.value)
-            return
-
-        for vertex in self.vertices.values():
-            if vertex.colour == 'white':
-                _dfs_visit(vertex, 0)
+            root.distance = time
+            root.colour = 'gray'
+            stack = [(root, iter(self.adj[root]))]
+            while stack:
+                source, neighbours = stack[-1]
+                for v in neighbours:
+                    if v.colour == 'white':
+                        v.parent = source
+                        time += 1
+                        v.distance = time
+                        v.colour = 'gray'
+                        stack.append((v, iter(self.adj[v])))
+                        break
+                    # In undirected graphs the edge back to the parent is the tree edge itself, not a cycle
+                    if v.colour == 'gray' and (self.directed or v is not source.parent):
+                        self._has_cycle = True
+                else:
+                    stack.pop()
+                    source.colour = 'black'
+                    time += 1
+                    source.finish_time = time
+                    if topological_sort:
+                        topological_order.insert(0, source.value)
 
         if topological_sort and self._has_cycle:
             return LinkedList()
         elif topological_sort:
             return topological_order
 
+    def breadth_first_search(self, source: Any, max_depth: Optional[int] = None) -> SearchResult:
+        # Same search as bfs, but the results are returned instead of written to the vertices, so several searches
+        # can run concurrently and only the reached vertices are touched. With max_depth the search stops after that
+        # many levels and only vertices within max_depth edges of source are touched.
+        source_vertex = self.vertices[source]
+        distance = {source_vertex: 0}
+        parent = {}
+        frontier = [source_vertex]
+        level = 0
+        while frontier and (max_depth is None or level < max_depth):
+            level += 1
+            next_frontier = []
+            for u in frontier:
+                for vertex in self.adj[u]:
+                    if vertex not in distance:
+                        distance[vertex] = level
+                        parent[vertex] = u
+                        next_frontier.append(vertex)
+            frontier = next_frontier
+
+        return SearchResult(source,
+                            {vertex.value: d for vertex, d in distance.items()},
+                            {vertex.value: u.value for vertex, u in parent.items()})
+
+    def k_hop(self, source: Any, k: int) -> SearchResult:
+        # Vertices within k edges of source
+        return self.breadth_first_search(source, max_depth=k)
+
+    def shortest_path(self, source: Any, target: Any, max_hops: Optional[int] = None) -> Optional[LinkedList]:
+        # Fewest-edges path from source to target, or None if there is none with at most max_hops edges.
+        # Undirected graphs are searched from both ends at once, always growing the smaller frontier by a level,
+        # and the search stops as soon as the two sides meet.
+        source_vertex = self.vertices[source]
+        target_vertex = self.vertices[target]
+        forward = {source_vertex: None}
+        backward = {target_vertex: None}
+        forward_frontier = [source_vertex]
+        backward_frontier = [target_vertex]
+
+        meeting = source_vertex if source_vertex is target_vertex else None
+        hops = 0
+        while meeting is None and forward_frontier and backward_frontier and (max_hops is None or hops < max_hops):
+            hops += 1
+            if self.directed or len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand_frontier(forward_frontier, forward, backward)
+            else:
+                backward_frontier, meeting = self._expand_frontier(backward_frontier, backward, forward)
+
+        if meeting is None:
+            return None
+        path = LinkedList()
+        vertex = meeting
+        while vertex is not None:
+            path.insert(0, vertex.value)
+            vertex = forward[vertex]
+        vertex = backward[meeting]
+        while vertex is not None:
+            path.append(vertex.value)
+            vertex = backward[vertex]
+        return path
+
+    def within_hops(self, source: Any, target: Any, k: int) -> bool:
+        return self.shortest_path(source, target, max_hops=k) is not None
+
+    def dijkstra(self, source: Any, target: Optional[Any] = None) -> SearchResult:
+        # Weighted shortest paths from source. If target is given the search stops once its distance is final and
+        # only vertices settled up to that point are in the result.
+        return self._best_first_search(source, target, None)
+
+    def a_star(self, source: Any, target: Any, heuristic: Callable[[Any], int | float]) -> SearchResult:
+        # Dijkstra's algorithm ordered by distance + heuristic(value). The heuristic must never overestimate the
+        # remaining distance to target and must be consistent (h(v) <= weight(v, u) + h(u)) for the result to be exact.
+        return self._best_first_search(source, target, heuristic)
+
+    def _best_first_search(self, source: Any, target: Optional[Any],
+                           heuristic: Optional[Callable[[Any], int | float]]) -> SearchResult:
+        source_vertex = self.vertices[source]
+        target_vertex = None if target is None else self.vertices[target]
+        distance = {source_vertex: 0}
+        parent = {}
+        settled = {}
+
+        # A shorter path found to a vertex still in the heap lowers its priority in place (decrease-key) instead of
+        # inserting it again
+        heap = DaryHeap(d=4)
+        heap.insert(source_vertex, heuristic(source) if heuristic else 0)
+        while heap.heap:
+            u = heap.extract_min()
+            settled[u] = distance[u]
+            if u is target_vertex:
+                break
+            for vertex, weight in self.adj[u].items():
+                if weight < 0:
+                    raise ValueError("Edge weights must be non-negative")
+                if vertex in settled:
+                    continue
+                d = settled[u] + weight
+                if vertex not in distance:
+                    distance[vertex] = d
+                    parent[vertex] = u
+                    heap.insert(vertex, d + heuristic(vertex.value) if heuristic else d)
+                elif d < distance[vertex]:
+                    distance[vertex] = d
+                    parent[vertex] = u
+                    heap.set_priority(vertex, d + heuristic(vertex.value) if heuristic else d)
+
+        return SearchResult(source,
+                            {vertex.value: d for vertex, d in settled.items()},
+                            {vertex.value: parent[vertex].value for vertex in settled if vertex in parent})
+
+    def kruskal(self) -> Tuple[List[Tuple[Any, Any, int | float]], int | float]:
+        # Minimum spanning forest as ([(v, u, weight), ...], total weight). Edges are taken cheapest first and kept
+        # unless a DisjointSet shows their ends already connected. O(m log m) for the sort, best on sparse graphs.
+        self._require_undirected()
+        ids = {vertex: i for i, vertex in enumerate(self.adj)}
+        components = DisjointSet(len(ids))
+        adj = self.adj
+        tree = []
+        total = 0
+        for weight, v, u in sorted(((adj[v][u], v, u) for v, u in self.edges), key=lambda edge: edge[0]):
+            if components.union(ids[v], ids[u]):
+                tree.append((v.value, u.value, weight))
+                total += weight
+                if components.count == 1:
+                    break
+        return tree, total
+
+    def prim(self) -> Tuple[List[Tuple[Any, Any, int | float]], int | float]:
+        # Minimum spanning forest as ([(v, u, weight), ...], total weight), grown one tree at a time from the
+        # vertex closest to it. Every vertex is in the heap at most once and a cheaper edge found to it lowers its
+        # priority in place, O(m log n) and no sort over all edges, best on dense graphs.
+        self._require_undirected()
+        adj = self.adj
+        tree = []
+        total = 0
+        in_tree = set()
+        best = {}
+        parent = {}
+        heap = DaryHeap(d=4)
+        for root in adj:
+            if root in in_tree:
+                continue
+            heap.insert(root, 0)
+            while heap.heap:
+                v = heap.extract_min()
+                in_tree.add(v)
+                if v in parent:
+                    tree.append((parent[v].value, v.value, best[v]))
+                    total += best[v]
+                for u, weight in adj[v].items():
+                    if u in in_tree:
+                        continue
+                    if u not in best:
+                        best[u] = weight
+                        parent[u] = v
+                        heap.insert(u, weight)
+                    elif weight < best[u]:
+                        best[u] = weight
+                        parent[u] = v
+                        heap.set_priority(u, weight)
+        return tree, total
+
+    def _require_undirected(self) -> None:
+        if self.directed:
+            raise ValueError("Minimum spanning trees are only defined for undirected graphs")
+
+    def strongly_connected_components(self) -> List[List[Any]]:
+        # Vertex values grouped by strongly connected component, components in topological order of the
+        # condensation so no edge leads from a later component back to an earlier one
+        frozen = self._frozen_directed()
+        component, count = frozen.strongly_connected_components()
+        groups = [[] for _ in range(count)]
+        for value, c in zip(frozen.values, component):
+            groups[c].append(value)
+        return groups
+
+    def condensation(self) -> Tuple['Graph', Dict[Any, int]]:
+        # Returns (dag, component). dag has a vertex per strongly connected component, numbered 0..count - 1 in
+        # topological order, and component maps each vertex value to its component. Cyclic graphs can be
+        # processed in dependency order through it, e.g. with dag.topological_order().
+        frozen = self._frozen_directed()
+        frozen_dag, component = frozen.condensation()
+        dag = Graph(directed=True)
+        for c in frozen_dag.values:
+            dag.add_vertex(c)
+        offsets = frozen_dag.offsets
+        for c in frozen_dag.values:
+            for d in frozen_dag.targets[offsets[c]:offsets[c + 1]]:
+                dag.add_edge(c, d)
+        return dag, dict(zip(frozen.values, component))
+
+    def _frozen_directed(self) -> FrozenGraph:
+        if not self.directed:
+            raise ValueError("Strongly connected components are only defined for directed graphs")
+        return self.freeze()
+
+    def connected_components(self) -> List[List[Any]]:
+        # Vertex values grouped by component, edges of a directed graph are taken in both directions
+        groups = self._component_index().groups()
+        values = [None] * len(self._component_ids)
+        for vertex, i in self._component_ids.items():
+            values[i] = vertex.value
+        return [[values[i] for i in members] for members in groups.values()]
+
+    def same_component(self, v: Any, u: Any) -> bool:
+        components = self._component_index()
+        ids = self._component_ids
+        return components.same(ids[self.vertices[v]], ids[self.vertices[u]])
+
+    def component_count(self) -> int:
+        return self._component_index().count
+
+    def _component_index(self) -> DisjointSet:
+        # Built from the current edges on first use, add_vertex and add_edge keep it current after that. The index is
+        # built in locals and published whole, ids first, so a reader never sees it half built.
+        components = self._components
+        if components is None:
+            with self._components_lock:
+                if self._components is None:
+                    ids = {vertex: i for i, vertex in enumerate(self.adj)}
+                    components = DisjointSet(len(ids))
+                    for v, u in self.edges:
+                        components.union(ids[v], ids[u])
+                    self._component_ids = ids
+                    self._components = components
+                components = self._components
+        return components
+
+    def _expand_frontier(self, frontier: List[Vertex], parent: Dict[Vertex, Optional[Vertex]],
+                         other_side: Dict[Vertex, Optional[Vertex]]) -> Tuple[List[Vertex], Optional[Vertex]]:
+        # Visit the next level of a search, returning it along with the first vertex also reached by other_side
+        next_frontier = []
+        for u in frontier:
+            for vertex in self.adj[u]:
+                if vertex not in parent:
+                    parent[vertex] = u
+                    if vertex in other_side:
+                        return next_frontier, vertex
+                    next_frontier.append(vertex)
+        return next_frontier, None
+
+    def depth_first_search(self) -> DFSResult:
+        # Same search as dfs, but the results are returned instead of written to the vertices
+        discovery = {}
+        finish = {}
+        parent = {}
+        has_cycle = False
+
+        time = 0
+        for root in self.adj:
+            if root in discovery:
+                continue
+            time += 1
+            discovery[root] = time
+            stack = [(root, iter(self.adj[root]))]
+            while stack:
+                source, neighbours = stack[-1]
+                for v in neighbours:
+                    if v not in discovery:
+                        parent[v] = source
+                        time += 1
+                        discovery[v] = time
+                        stack.append((v, iter(self.adj[v])))
+                        break
+                    # In undirected graphs the edge back to the parent is the tree edge itself, not a cycle
+                    if v not in finish and (self.directed or v is not parent.get(source)):
+                        has_cycle = True
+                else:
+                    stack.pop()
+                    time += 1
+                    finish[source] = time
+
+        return DFSResult({vertex.value: t for vertex, t in discovery.items()},
+                         {vertex.value: t for vertex, t in finish.items()},
+                         {vertex.value: u.value for vertex, u in parent.items()},
+                         has_cycle)
+
     def has_cycle(self):
         self.dfs()
         return self._has_cycle
@@ -131,6 +568,80 @@ class Graph:
         topological_order = self.dfs(topological_sort=True)
         return topological_order
 
+    def topological_order(self) -> Iterator[Any]:
+        # Kahn's algorithm, each vertex is yielded as soon as all of its predecessors have been yielded
+        in_degree = self._in_degrees()
+        ready = Queue()
+        for vertex, degree in in_degree.items():
+            if degree == 0:
+                ready.enqueue(vertex)
+
+        visited = 0
+        while not ready.is_empty():
+            vertex = ready.dequeue()
+            visited += 1
+            yield vertex.value
+            for u in self.adj[vertex]:
+                in_degree[u] -= 1
+                if in_degree[u] == 0:
+                    ready.enqueue(u)
+
+        if visited < len(in_degree):
+            raise CycleError(self._find_cycle(in_degree))
+
+    def topological_waves(self) -> Iterator[List[Any]]:
+        # Every vertex in a wave only depends on vertices of earlier waves, so a wave can be processed in parallel
+        in_degree = self._in_degrees()
+        wave = [vertex for vertex, degree in in_degree.items() if degree == 0]
+
+        visited = 0
+        while wave:
+            visited += len(wave)
+            yield [vertex.value for vertex in wave]
+            next_wave = []
+            for vertex in wave:
+                for u in self.adj[vertex]:
+                    in_degree[u] -= 1
+                    if in_degree[u] == 0:
+                        next_wave.append(u)
+            wave = next_wave
+
+        if visited < len(in_degree):
+            raise CycleError(self._find_cycle(in_degree))
+
+    def _in_degrees(self) -> Dict[Vertex, int]:
+        if not self.directed:
+            raise ValueError("topological order is only defined for directed graphs")
+        in_degree = dict.fromkeys(self.adj, 0)
+        for neighbours in self.adj.values():
+            for u in neighbours:
+                in_degree[u] += 1
+        return in_degree
+
+    def _find_cycle(self, in_degree: Dict[Vertex, int]) -> List[Any]:
+        # Vertices Kahn's algorithm could not visit each keep an unvisited predecessor, so walking predecessors
+        # from any of them must eventually repeat a vertex
+        remaining = {vertex for vertex, degree in in_degree.items() if degree > 0}
+        predecessor = {}
+        for vertex in remaining:
+            for u in self.adj[vertex]:
+                if u in remaining:
+                    predecessor[u] = vertex
+
+        vertex = next(iter(remaining))
+        seen = set()
+        while vertex not in seen:
+            seen.add(vertex)
+            vertex = predecessor[vertex]
+
+        cycle = [vertex.value]
+        u = predecessor[vertex]
+        while u is not vertex:
+            cycle.append(u.value)
+            u = predecessor[u]
+        cycle.reverse()
+        return cycle
+
     def is_bipartite(self) -> bool:
         if len(self.vertices) == 0:
             return True
@@ -145,4 +656,48 @@ class Graph:
         return True
 
     def print_tree(self):
-        pass
\ No newline at end of file
+        pass
+
+
+def _read_lines(source: str | os.PathLike | IO, chunk_size: int, use_mmap: bool,
+                encoding: str) -> Iterator[List[str]]:
+    # Lists of complete lines from source, read a chunk at a time
+    if not isinstance(source, (str, os.PathLike)):
+        yield from _split_chunks(iter(lambda: source.read(chunk_size), source.read(0)), encoding)
+        return
+    with open(source, 'rb') as file:
+        if not use_mmap:
+            yield from _split_chunks(iter(lambda: file.read(chunk_size), b''), encoding)
+            return
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _split_chunks((mapped[start:start + chunk_size] for start in range(0, size, chunk_size)),
+                                     encoding)
+
+
+def _split_chunks(chunks: Iterable[str | bytes], encoding: str) -> Iterator[List[str]]:
+    # Chunks are cut at their last newline and the partial line carried into the next one, bytes are only decoded
+    # once cut so a multi-byte character split between two chunks is put back together first
+    rest = None
+    for chunk in chunks:
+        data = rest + chunk if rest else chunk
+        newline = b'\n' if isinstance(data, bytes) else '\n'
+        end = data.rfind(newline)
+        if end == -1:
+            rest = data
+            continue
+        rest = data[end + 1:]
+        yield _split_lines(data[:end], encoding)
+    if rest:
+        yield _split_lines(rest, encoding)
+
+
+def _split_lines(data: str | bytes, encoding: str) -> List[str]:
+    # Only '\n' ends a line, unlike str.splitlines which also splits on form feeds, '\x1c' and other separators
+    text = data.decode(encoding) if isinstance(data, bytes) else data
+    lines = text.split('\n')
+    if '\r' in text:
+        lines = [line[:-1] if line.endswith('\r') else line for line in lines]
+    return lines
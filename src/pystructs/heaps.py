@@ -1,55 +1,174 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 from abc import ABC, abstractmethod
+from array import array
 
 
 class Heap(ABC):
-    def __init__(self, array: list[Any] = None) -> None:
-        if array is None:
-            self.heap = []
-            self.positions = {}
-        else:
-            self.positions = {}
+    heap: list[Any]
+    positions: Dict[Any, int]
+    d: int = 2  # children per node
+
+    def __init__(self, array: list[Any] = None, pairs: Iterable[Tuple[Any, Any]] = None) -> None:
+        # Start from items that are their own priority, or from (item, priority) pairs, every layout accepts both
+        if array is not None and pairs is not None:
+            raise ValueError("Pass either array or pairs, not both")
+        self._clear()
+        if array is not None:
             self.build_max_heap(array)
+        elif pairs is not None:
+            self.heapify(pairs)
 
     def __str__(self):
-        if not self.heap:
+        if not len(self):
             return "Heap is empty"
 
+        # The tree is printed on its side, root on the left. A node's last children are printed above it and its
+        # first children below it, so with d = 2 the right child is above and the left child below.
         def print_tree(index, level):
+            first_child_index = self.d * index + 1
+            middle = first_child_index + self.d // 2
+            end = min(first_child_index + self.d, len(self))
             tree_str = ""
-            if index < len(self.heap):
-                tree_str += print_tree(2 * index + 2, level + 1)
-                tree_str += "  " * level + str(self.heap[index]) + "\n"
-                tree_str += print_tree(2 * index + 1, level + 1)
+            for child_index in range(end - 1, middle - 1, -1):
+                tree_str += print_tree(child_index, level + 1)
+            tree_str += "  " * level + str(self._item(index)) + "\n"
+            for child_index in range(min(middle, end) - 1, first_child_index - 1, -1):
+                tree_str += print_tree(child_index, level + 1)
             return tree_str
 
         return print_tree(0, 0)
 
+    def __len__(self) -> int:
+        return len(self.heap)
+
     def build_max_heap(self, array) -> None:
-        self.heap = []
-        for item in array:
-            new_heap_node = HeapNode(item, item)
-            self.heap.append(new_heap_node)
-            self.positions[item] = len(self.heap) - 1
+        self.heapify((item, item) for item in array)
 
-        n = (len(self.heap) - 1) // 2
-        for i in range(n, -1, -1):
+    def heapify(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        # Replace the contents with (item, priority) pairs in O(n) by sifting down every parent, last one first
+        self._clear()
+        self._extend(pairs)
+        for i in range((len(self) - 2) // self.d, -1, -1):
             self.bubble_down(i)
 
+    def push_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        # Inserting k items one at a time costs up to k * log(n + k) while rebuilding the whole heap costs n + k,
+        # so a batch larger than the heap is appended and the heap is rebuilt
+        n = len(self)
+        self._extend(pairs)
+        size = len(self)
+        if size - n > n:
+            for i in range((size - 2) // self.d, -1, -1):
+                self.bubble_down(i)
+        else:
+            for i in range(n, size):
+                self.bubble_up(i)
+
+    def pop_many(self, k: int) -> List[Any]:
+        # Up to k items from the top of the heap, in order
+        return [self._extract_root() for _ in range(min(k, len(self)))]
+
+    def pushpop(self, item: Any, priority=None) -> Any:
+        # Insert item and extract the top in one sift, if item would itself be on top it is returned straight away
+        if priority is None:
+            priority = item
+        if not len(self) or not self._precedes(self._priority(0), priority):
+            return item
+        root = self._item(0)
+        del self.positions[root]
+        self._put(0, item, priority)
+        self.bubble_down(0)
+        return root
+
     def insert(self, item: Any, priority=None) -> None:
         if priority is None:
             priority = item
+        self._append(item, priority)
+        self.bubble_up(len(self) - 1)
 
-        new_heap_node = HeapNode(item, priority)
-        self.positions[item] = len(self.heap)
-        self.heap.append(new_heap_node)
-        self.bubble_up(len(self.heap) - 1)
+    def __contains__(self, item: Any) -> bool:
+        return item in self.positions
+
+    def priority(self, item: Any) -> Any:
+        return self._priority(self.positions[item])
 
     def set_priority(self, item: int, priority: int) -> None:
         if item not in self.positions:
             raise ValueError("Item in not in heap")
-        self.heap[self.positions[item]].priority = priority
-        self.bubble_up(self.positions[item])
+        i = self.positions[item]
+        moves_up = self._precedes(priority, self._priority(i))
+        self._put(i, item, priority)
+        if moves_up:
+            self.bubble_up(i)
+        else:
+            self.bubble_down(i)
+
+    def remove(self, item: Any) -> None:
+        # Fill the hole with the last entry and sift it whichever way it belongs
+        if item not in self.positions:
+            raise ValueError("Item in not in heap")
+        i = self.positions.pop(item)
+        last_item, last_priority = self._pop_last()
+        if i == len(self):
+            return
+        self._put(i, last_item, last_priority)
+        if i > 0 and self._precedes(last_priority, self._priority((i - 1) // self.d)):
+            self.bubble_up(i)
+        else:
+            self.bubble_down(i)
+
+    def _extract_root(self) -> Any:
+        if not len(self):
+            raise IndexError("extract from empty heap")
+        root = self._item(0)
+        del self.positions[root]
+        last_item, last_priority = self._pop_last()
+        if len(self):
+            self._put(0, last_item, last_priority)
+            self.bubble_down(0)
+        return root
+
+    # Storage access. The operations above only reach the entries through these, so a subclass can lay the heap
+    # out differently by overriding them along with __len__, bubble_up and bubble_down. Here every entry is a
+    # HeapNode in self.heap.
+    def _clear(self) -> None:
+        self.heap = []
+        self.positions = {}
+
+    def _extend(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        # Append (item, priority) pairs at the end without sifting
+        heap = self.heap
+        positions = self.positions
+        for item, priority in pairs:
+            positions[item] = len(heap)
+            heap.append(HeapNode(item, priority))
+
+    def _append(self, item: Any, priority: Any) -> None:
+        self.positions[item] = len(self.heap)
+        self.heap.append(HeapNode(item, priority))
+
+    def _pop_last(self) -> Tuple[Any, Any]:
+        # Remove the last entry, its item stays in positions
+        node = self.heap.pop()
+        return node.value, node.priority
+
+    def _put(self, i: int, item: Any, priority: Any) -> None:
+        node = self.heap[i]
+        node.value = item
+        node.priority = priority
+        self.positions[item] = i
+
+    def _item(self, i: int) -> Any:
+        return self.heap[i].value
+
+    def _priority(self, i: int) -> Any:
+        return self.heap[i].priority
+
+    @staticmethod
+    @abstractmethod
+    def _precedes(priority: Any, other: Any) -> bool:
+        # True if priority belongs strictly closer to the top of the heap than other
+        pass
 
     @abstractmethod
     def bubble_up(self, i: int) -> None:
@@ -61,6 +180,7 @@ class Heap(ABC):
 
 
 class HeapNode:
+    __slots__ = ('value', 'priority')
 
     def __init__(self, value: Any, priority) -> None:
         self.value = value
@@ -83,56 +203,287 @@ class HeapNode:
 
 
 class MaxHeap(Heap):
-    heap: list[Any]
-    positions: Dict[int, Any]
+    @staticmethod
+    def _precedes(priority: Any, other: Any) -> bool:
+        return priority > other
 
     def bubble_up(self, i: int) -> None:
-        if i == 0:
-            return
+        # Move the node at i up past every parent with a lower priority. Parents are shifted down into the hole
+        # and the node is written once at the end, comparing raw priorities rather than through HeapNode.
+        heap = self.heap
+        positions = self.positions
+        node = heap[i]
+        priority = node.priority
+        while i > 0:
+            parent_index = (i - 1) // 2
+            parent = heap[parent_index]
+            if parent.priority > priority:
+                break
+            heap[i] = parent
+            positions[parent.value] = i
+            i = parent_index
+        heap[i] = node
+        positions[node.value] = i
 
-        parent_index = (i - 1) // 2
+    def bubble_down(self, i: int) -> None:
+        heap = self.heap
+        positions = self.positions
+        n = len(heap)
+        node = heap[i]
+        priority = node.priority
+        while True:
+            largest = 2 * i + 1
+            if largest >= n:
+                break
+            largest_priority = heap[largest].priority
+            right_child_index = largest + 1
+            if right_child_index < n and heap[right_child_index].priority > largest_priority:
+                largest = right_child_index
+                largest_priority = heap[largest].priority
+            if largest_priority <= priority:
+                break
+            heap[i] = heap[largest]
+            positions[heap[i].value] = i
+            i = largest
+        heap[i] = node
+        positions[node.value] = i
 
-        while i > 0 and self.heap[i] >= self.heap[parent_index]:
-            self.heap[i], self.heap[parent_index] = self.heap[parent_index], self.heap[i]
+    def extract_max(self) -> Any:
+        return self._extract_root()
 
-            self.positions[self.heap[i].value], self.positions[self.heap[parent_index].value] \
-                = self.positions[self.heap[parent_index].value], self.positions[self.heap[i].value]
+    def max(self) -> Any:
+        return self.heap[0]
 
+
+class MinHeap(Heap):
+    # Smallest priority first. Each node has d children, d = 2 is a binary heap, and a larger d makes the tree
+    # shallower so bubble_up (insert and lowering a priority) does fewer steps at the cost of more comparisons
+    # in bubble_down.
+    @staticmethod
+    def _precedes(priority: Any, other: Any) -> bool:
+        return priority < other
+
+    def bubble_up(self, i: int) -> None:
+        heap = self.heap
+        positions = self.positions
+        d = self.d
+        node = heap[i]
+        priority = node.priority
+        while i > 0:
+            parent_index = (i - 1) // d
+            parent = heap[parent_index]
+            if parent.priority <= priority:
+                break
+            heap[i] = parent
+            positions[parent.value] = i
             i = parent_index
-            parent_index = (i - 1) // 2
+        heap[i] = node
+        positions[node.value] = i
 
     def bubble_down(self, i: int) -> None:
-        n = len(self.heap)
-        left_child_index = 2 * i + 1
-        right_child_index = 2 * i + 2
-        largest = i
-
-        if left_child_index < n and self.heap[left_child_index] > self.heap[largest]:
-            largest = left_child_index
+        heap = self.heap
+        positions = self.positions
+        d = self.d
+        n = len(heap)
+        node = heap[i]
+        priority = node.priority
+        while True:
+            first_child_index = d * i + 1
+            if first_child_index >= n:
+                break
+            smallest = first_child_index
+            smallest_priority = heap[smallest].priority
+            end = first_child_index + d
+            if end > n:
+                end = n
+            child_index = first_child_index + 1
+            while child_index < end:
+                child_priority = heap[child_index].priority
+                if child_priority < smallest_priority:
+                    smallest = child_index
+                    smallest_priority = child_priority
+                child_index += 1
+            if smallest_priority >= priority:
+                break
+            heap[i] = heap[smallest]
+            positions[heap[i].value] = i
+            i = smallest
+        heap[i] = node
+        positions[node.value] = i
+
+    def extract_min(self) -> Any:
+        return self._extract_root()
+
+    def min(self) -> Any:
+        return self.heap[0]
 
-        if right_child_index < n and self.heap[right_child_index] > self.heap[largest]:
-            largest = right_child_index
 
-        if largest != i:
-            self.heap[i], self.heap[largest] = self.heap[largest], self.heap[i]
+class DaryHeap(MinHeap):
+    # MinHeap with a configurable number of children per node, 4 is usually fastest for decrease-key heavy use
+    def __init__(self, array: list[Any] = None, d: int = 4, pairs: Iterable[Tuple[Any, Any]] = None) -> None:
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        super().__init__(array, pairs)
+
+
+class ArrayHeap(Heap):
+    # MinHeap that keeps its entries in parallel arrays instead of HeapNode objects: items[i] and priorities[i]
+    # describe the same entry, with priorities packed in an array('d'). The operations are Heap's, only storage
+    # access and the sifts, which index the arrays directly, are overridden. Priorities are stored multiplied by
+    # _sign so the sifts are always a min-heap, ArrayMaxHeap negates them. The constructor and min/max match
+    # MinHeap and MaxHeap, min and max build a HeapNode copy of the top entry since there is none stored.
+    # The gain is memory only: an entry costs about 100 bytes instead of about 163, most of it the positions dict.
+    # It is not meaningfully faster, every read from array('d') still boxes a float, and priorities must be numbers.
+    items: List[Any]
+    priorities: array
+
+    _sign: int = 1
+
+    def __init__(self, array: list[float] = None, d: int = 2, pairs: Iterable[Tuple[Any, float]] = None) -> None:
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        super().__init__(array, pairs)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @staticmethod
+    def _precedes(priority: Any, other: Any) -> bool:
+        return priority < other
+
+    def _clear(self) -> None:
+        self.items = []
+        self.priorities = array('d')
+        self.positions = {}
+
+    def _extend(self, pairs: Iterable[Tuple[Any, float]]) -> None:
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        sign = self._sign
+        for item, priority in pairs:
+            positions[item] = len(items)
+            items.append(item)
+            priorities.append(sign * priority)
+
+    def _append(self, item: Any, priority: float) -> None:
+        self.positions[item] = len(self.items)
+        self.items.append(item)
+        self.priorities.append(self._sign * priority)
+
+    def _pop_last(self) -> Tuple[Any, float]:
+        return self.items.pop(), self._sign * self.priorities.pop()
+
+    def _put(self, i: int, item: Any, priority: float) -> None:
+        self.items[i] = item
+        self.priorities[i] = self._sign * priority
+        self.positions[item] = i
+
+    def _item(self, i: int) -> Any:
+        return self.items[i]
+
+    def _priority(self, i: int) -> float:
+        return self._sign * self.priorities[i]
 
-            self.positions[self.heap[i].value], self.positions[self.heap[largest].value] \
-                = self.positions[self.heap[largest].value], self.positions[self.heap[i].value]
+    def bubble_up(self, i: int) -> None:
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        d = self.d
+        item = items[i]
+        priority = priorities[i]
+        while i > 0:
+            parent_index = (i - 1) // d
+            parent_priority = priorities[parent_index]
+            if parent_priority <= priority:
+                break
+            parent = items[parent_index]
+            items[i] = parent
+            priorities[i] = parent_priority
+            positions[parent] = i
+            i = parent_index
+        items[i] = item
+        priorities[i] = priority
+        positions[item] = i
 
-            self.bubble_down(largest)
+    def bubble_down(self, i: int) -> None:
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        d = self.d
+        n = len(items)
+        item = items[i]
+        priority = priorities[i]
+        while True:
+            first_child_index = d * i + 1
+            if first_child_index >= n:
+                break
+            smallest = first_child_index
+            smallest_priority = priorities[smallest]
+            end = first_child_index + d
+            if end > n:
+                end = n
+            child_index = first_child_index + 1
+            while child_index < end:
+                child_priority = priorities[child_index]
+                if child_priority < smallest_priority:
+                    smallest = child_index
+                    smallest_priority = child_priority
+                child_index += 1
+            if smallest_priority >= priority:
+                break
+            child = items[smallest]
+            items[i] = child
+            priorities[i] = smallest_priority
+            positions[child] = i
+            i = smallest
+        items[i] = item
+        priorities[i] = priority
+        positions[item] = i
+
+
+class ArrayMinHeap(ArrayHeap):
+    def extract_min(self) -> Any:
+        return self._extract_root()
+
+    def min(self) -> Any:
+        return HeapNode(self.items[0], self.priorities[0])
+
+
+class ArrayMaxHeap(ArrayHeap):
+    _sign = -1
+
+    @staticmethod
+    def _precedes(priority: Any, other: Any) -> bool:
+        return priority > other
 
     def extract_max(self) -> Any:
-        self.heap[0], self.heap[-1] = self.heap[-1], self.heap[0]
-        self.positions[self.heap[0]] = 0
-        heap_max = self.heap.pop()
-        self.bubble_down(0)
-        return heap_max.value
-
-    def remove(self, item: Any) -> None:
-        pass
+        return self._extract_root()
 
     def max(self) -> Any:
-        return self.heap[0]
+        return HeapNode(self.items[0], -self.priorities[0])
+
 
+def nlargest(k: int, pairs: Iterable[Tuple[Any, Any]]) -> List[Any]:
+    # The k items with the highest priorities, highest first. pairs is consumed one at a time and only the best k
+    # seen so far are kept, in a MinHeap whose top is the one to drop next.
+    return _top_k(k, pairs, MinHeap())
 
 
+def nsmallest(k: int, pairs: Iterable[Tuple[Any, Any]]) -> List[Any]:
+    return _top_k(k, pairs, MaxHeap())
+
+
+def _top_k(k: int, pairs: Iterable[Tuple[Any, Any]], heap: Heap) -> List[Any]:
+    if k <= 0:
+        return []
+    for item, priority in pairs:
+        if len(heap) < k:
+            heap.insert(item, priority)
+        else:
+            heap.pushpop(item, priority)
+    best = heap.pop_many(k)
+    best.reverse()
+    return best
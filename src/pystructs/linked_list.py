@@ -1,4 +1,8 @@
-from typing import Any, Optional, Iterable, Callable
+from typing import Any, Optional, Iterable, Iterator, Callable
+from itertools import chain, repeat
+from math import isqrt
+from bisect import bisect_left, bisect_right
+from operator import lt
 
 
 class Node:
@@ -9,6 +13,7 @@ class Node:
      - value (Any): value stored in the node
      - next (Optional[Node]): next node or None if there is no next node
     """
+    __slots__ = ('value', 'next')
     value: Any
     next: Optional['Node']
 
@@ -38,6 +43,58 @@ class Node:
         return ' -> '.join(elements)
 
 
+class DoublyNode(Node):
+    """
+    Node used in doubly linked lists
+
+    Instance Attributes:
+     - value (Any): value stored in the node
+     - next (Optional[DoublyNode]): next node or None if there is no next node
+     - prev (Optional[DoublyNode]): previous node or None if there is no previous node
+    """
+    __slots__ = ('prev',)
+    prev: Optional['DoublyNode']
+
+    def __init__(self, value: Any) -> None:
+        """
+        Constructor for DoublyNode class
+
+        :param value: value stored in node
+        """
+        super().__init__(value)
+        self.prev = None
+
+
+class UnrolledNode:
+    """
+    Node used in unrolled linked lists, holding a chunk of consecutive values
+
+    Instance Attributes:
+     - values (list): values stored in the node, in list order
+     - next (Optional[UnrolledNode]): next node or None if there is no next node
+    """
+    __slots__ = ('values', 'next')
+    values: list
+    next: Optional['UnrolledNode']
+
+    def __init__(self, values: list) -> None:
+        """
+        Constructor for UnrolledNode class
+
+        :param values: values stored in node
+        """
+        self.values = values
+        self.next = None
+
+    def __str__(self) -> str:
+        """
+        String representation of node, prints the chunk of values it holds
+
+        :return: string representation of node values
+        """
+        return str(self.values)
+
+
 def is_list(other: Any) -> bool:
     """
     Checks if other is a valid list type
@@ -69,10 +126,23 @@ class LinkedList:
     Instance Attributes:
      - head: The head of the linked list
      - _length: The length of the linked list
+     - _indexed: Whether positional lookups use the checkpoint index, see build_index()
+     - _index_stride: Distance between checkpoints given to build_index(), or None to pick sqrt(len(self)) each time
+       the index is built
+     - _index_step: Distance between checkpoints the current index was built with
+     - _index: Checkpoint nodes of self, every _index_step-th node when built, or None when it must be rebuilt
+     - _index_positions: Current position in self of each checkpoint in _index, in increasing order
+     - _index_changes: Number of inserts and removals patched into the checkpoints since they were built
     """
     head: Optional[Node]
     last: Optional[Node]
     _length: int
+    _indexed: bool
+    _index_stride: Optional[int]
+    _index_step: int
+    _index: Optional[list]
+    _index_positions: Optional[list]
+    _index_changes: int
 
     def __init__(self, lst: Iterable = None):
         """
@@ -81,21 +151,18 @@ class LinkedList:
         :param lst: Optional list of elements to instantiate linked list
         """
         self._length = 0
+        self.head = None
+        self.last = None
+        self._indexed = False
+        self._index_stride = None
+        self._index_step = 1
+        self._index = None
+        self._index_positions = None
+        self._index_changes = 0
         if lst is None:
-            self.head = None
             return
-        curr = None
 
-        for item in lst:
-            node = Node(item)
-            if curr is None:
-                self.head = node
-                self._length += 1
-            else:
-                curr.next = node
-                self._length += 1
-            curr = node
-        self.last = curr
+        self.head, self.last, self._length = self._build_chain(lst)
 
     def __str__(self) -> str:
         """
@@ -105,7 +172,7 @@ class LinkedList:
         """
         if self.head is None:
             return "None"
-        elements = [str(element) for element in self]
+        elements = [str(element) for element in self._iter_values()]
         return ' -> '.join(elements)
 
     def __repr__(self) -> str:
@@ -116,7 +183,7 @@ class LinkedList:
         """
         if self.head is None:
             return "None"
-        elements = [str(element) for element in self]
+        elements = [str(element) for element in self._iter_values()]
         return ' -> '.join(elements)
 
     def __len__(self) -> int:
@@ -143,11 +210,7 @@ class LinkedList:
         if index == self._length - 1:
             return self.last.value
 
-        i = 0
-        for item in self:
-            if i == index:
-                return item
-            i += 1
+        return self._node_at(index).value
 
     def __setitem__(self, index: int, value: Any) -> None:
         """
@@ -160,47 +223,63 @@ class LinkedList:
         if index < 0 or index >= self._length:
             raise IndexError
 
-        if index == 0:
-            if self.head is None:
-                self.head = Node(value)
-            else:
-                node = Node(value)
-                node.next = self.head.next
-                self.head = node
-            return
-
-        i = 0
-        prev = None
-        curr = self.head
-        for _ in self:
-            if i == index:
-                node = Node(value)
-                prev.next = node
-                if curr.next is not None:
-                    node.next = curr.next
-                else:
-                    node.next = None
-
-            prev = curr
-            curr = curr.next
-            i += 1
+        self._node_at(index).value = value
 
-    def __iter__(self, return_nodes: bool = False, return_prev: bool = False) -> 'LinkedListIterator':
+    def __iter__(self, return_nodes: bool = False, return_prev: bool = False) -> Iterator:
         """
         Iterates through self, used in for loops
         for element in linked_list():
 
-        if return_nodes is True, the value returned is the nodes of self
+        if return_nodes is True, the value returned is the nodes of self, same as iter_nodes()
         for node in linked_list.__iter__(return_nodes=True):
 
-        if return_prev is True, the value returned is a tuple containing (curr, prev) nodes
+        if return_prev is True, the value returned is a tuple containing (curr, prev) nodes, same as iter_node_pairs()
         for curr, prev in linked_list.__iter__(return_prev=True):
 
         :param return_nodes: whether to return the nodes of self instead of the values
         :param return_prev: whether to also return the previous node in self
-        :return: returns a linked list iterator that iterates through the linked list
+        :return: returns a generator that iterates through the linked list
+        """
+        if return_prev:
+            return self.iter_node_pairs()
+        if return_nodes:
+            return self.iter_nodes()
+        return self._iter_values()
+
+    def iter_nodes(self) -> Iterator:
+        """
+        Iterates through the nodes of self
+
+        :return: generator over the nodes of self
+        """
+        curr = self.head
+        while curr is not None:
+            yield curr
+            curr = curr.next
+
+    def iter_node_pairs(self) -> Iterator:
+        """
+        Iterates through the nodes of self along with the node before each of them
+
+        :return: generator over (curr, prev) node pairs of self, prev is None for the head
+        """
+        prev = None
+        curr = self.head
+        while curr is not None:
+            yield curr, prev
+            prev = curr
+            curr = curr.next
+
+    def _iter_values(self) -> Iterator:
+        """
+        Helper generator over the values of self
+
+        :return: generator over the values of self
         """
-        return LinkedListIterator(self.head, return_nodes, return_prev)
+        curr = self.head
+        while curr is not None:
+            yield curr.value
+            curr = curr.next
 
     def __contains__(self, item: Any) -> bool:
         """
@@ -209,9 +288,11 @@ class LinkedList:
         :param item: item to search for in linked list
         :return: whether the given item is in the linked list
         """
-        for element in self:
-            if element == item:
+        curr = self.head
+        while curr is not None:
+            if curr.value == item:
                 return True
+            curr = curr.next
         return False
 
     def __eq__(self, other: Any) -> bool:
@@ -221,13 +302,13 @@ class LinkedList:
         :param other: other list to compare to
         :return: whether self and other are equal
         """
-        if not isinstance(other, LinkedList) and not isinstance(other, list):
+        if not is_list(other):
             return False
         if len(self) != len(other):
             return False
 
-        for i in range(len(self)):
-            if self[i] != other[i]:
+        for item, other_item in zip(self._iter_values(), other):
+            if item != other_item:
                 return False
         return True
 
@@ -238,15 +319,7 @@ class LinkedList:
         :param other: other list to compare to
         :return: whether self and other are not equal
         """
-        if not isinstance(other, LinkedList) and not isinstance(other, list):
-            return True
-        if len(self) != len(other):
-            return True
-
-        for i in range(len(self)):
-            if self[i] != other[i]:
-                return True
-        return False
+        return not self == other
 
     def __lt__(self, other: Any) -> bool:
         """
@@ -258,13 +331,10 @@ class LinkedList:
         if not is_list(other):
             raise TypeError(f"'<' not supported between instances of {type(self).__name__} and {type(other).__name__}")
 
-        if len(self) == len(other) == 0:
-            return False
-        if len(self) == 0:
-            return True
-        if len(other) == 0:
-            return False
-        return self[0] < other[0]
+        difference = self._first_difference(other)
+        if difference is None:
+            return len(self) < len(other)
+        return difference[0] < difference[1]
 
     def __le__(self, other: Any) -> bool:
         """
@@ -276,13 +346,10 @@ class LinkedList:
         if not is_list(other):
             raise TypeError(f"'<=' not supported between instances of {type(self).__name__} and {type(other).__name__}")
 
-        if len(self) == len(other) == 0:
-            return True
-        if len(self) == 0:
-            return True
-        if len(other) == 0:
-            return False
-        return self[0] <= other[0]
+        difference = self._first_difference(other)
+        if difference is None:
+            return len(self) <= len(other)
+        return difference[0] <= difference[1]
 
     def __gt__(self, other: Any) -> bool:
         """
@@ -294,13 +361,10 @@ class LinkedList:
         if not is_list(other):
             raise TypeError(f"'>' not supported between instances of {type(self).__name__} and {type(other).__name__}")
 
-        if len(self) == len(other) == 0:
-            return False
-        if len(self) == 0:
-            return False
-        if len(other) == 0:
-            return True
-        return self[0] > other[0]
+        difference = self._first_difference(other)
+        if difference is None:
+            return len(self) > len(other)
+        return difference[0] > difference[1]
 
     def __ge__(self, other: Any) -> bool:
         """
@@ -313,13 +377,57 @@ class LinkedList:
         if not is_list(other):
             raise TypeError(f"'>=' not supported between instances of {type(self).__name__} and {type(other).__name__}")
 
-        if len(self) == len(other) == 0:
-            return True
-        if len(self) == 0:
-            return False
-        if len(other) == 0:
-            return True
-        return self[0] >= other[0]
+        difference = self._first_difference(other)
+        if difference is None:
+            return len(self) >= len(other)
+        return difference[0] >= difference[1]
+
+    def _build_chain(self, values: Iterable) -> tuple:
+        """
+        Helper that builds a detached chain of nodes holding values in a single pass
+
+        :param values: values to store in the chain
+        :return: tuple (first node or None, last node or None, number of nodes)
+        """
+        sentinel = last = Node(None)
+        count = 0
+        for count, item in enumerate(values, 1):
+            node = Node(item)
+            last.next = node
+            last = node
+        if count == 0:
+            return None, None, 0
+        return sentinel.next, last, count
+
+    def _link_chain(self, head: Optional[Node], last: Optional[Node], count: int) -> None:
+        """
+        Helper that links a detached chain of nodes after the last node of self
+
+        :param head: first node of the chain, or None if the chain is empty
+        :param last: last node of the chain
+        :param count: number of nodes in the chain
+        :return: None
+        """
+        if head is None:
+            return
+        if self.last is None:
+            self.head = head
+        else:
+            self.last.next = head
+        self.last = last
+        self._length += count
+
+    def _first_difference(self, other: Iterable) -> Optional[tuple]:
+        """
+        Helper that walks self and other in lockstep to find the first pair of values that differ
+
+        :param other: list type to compare self to
+        :return: tuple (value in self, value in other) of the first difference, or None if one is a prefix of the other
+        """
+        for item, other_item in zip(self._iter_values(), other):
+            if item != other_item:
+                return item, other_item
+        return None
 
     def insert(self, index: int, value: Any) -> None:
         """
@@ -330,8 +438,8 @@ class LinkedList:
         this value is clamped at 0
 
         Running time:
-         - O(index)
-         - O(1) at the beginning of the linked list
+         - O(index), or amortised O(sqrt(n)) with build_index()
+         - O(1) at the end of the linked list, and at the beginning without build_index()
 
         :param index: int index to insert into the linked
         :param value: value to be inserted
@@ -343,13 +451,15 @@ class LinkedList:
         if self.head is None or index == 0:
             new_node.next = self.head
             self.head = new_node
+            if new_node.next is None:
+                self.last = new_node
+            self._index_inserted(0)
             return
 
-        curr = self.head
-        # Case index larger than list
-        if index >= len(self):
+        # Case index larger than list (self._length already counts new_node)
+        if index >= self._length - 1:
             self.last.next = new_node
-            self.last = self.last.next
+            self.last = new_node
             return
 
         # Case index smaller than 0
@@ -359,17 +469,17 @@ class LinkedList:
             return
 
         # Default case index in bounds
-        for _ in range(index - 1):
-            curr = curr.next
+        curr = self._node_at(index - 1)
         new_node.next = curr.next
         curr.next = new_node
+        self._index_inserted(index)
 
     def append(self, value: Any) -> None:
         """
         Appends a value to the end of self
 
         Running time:
-         - O(n) where n = len(self)
+         - O(1)
 
         :param value: value to be appended
         :return: None
@@ -389,21 +499,25 @@ class LinkedList:
         """
         curr = self.head
         prev = None
+        index = 0
         while curr is not None:
             if prev is None and curr.value == value:
                 self.head = curr.next
                 if curr is self.last:
                     self.last = None
                 self._length -= 1
+                self._index_removed(0, curr.next)
                 return
             if curr.value == value:
                 prev.next = curr.next
                 if curr is self.last:
                     self.last = prev
                 self._length -= 1
+                self._index_removed(index, curr.next)
                 return
             prev = curr
             curr = curr.next
+            index += 1
         raise ValueError("LinkedList.remove(value): value not in list")
 
     def pop(self, index: int = None) -> Any:
@@ -413,8 +527,8 @@ class LinkedList:
         Index is len(self) - 1 by default removing from the beginning of the list.
 
         Running Time:
-         - O(index)
-         - O(1) at the beginning of the linked lit
+         - O(index), or amortised O(sqrt(n)) with build_index()
+         - O(1) at the beginning of the linked lit without build_index()
 
         :raises IndexError: if self is empty or index is out of range
         :param index: index to pop from self
@@ -427,30 +541,25 @@ class LinkedList:
             raise IndexError("pop from empty list")
         if index >= len(self) or -index > len(self):
             raise IndexError("pop index out of range")
+        if index < 0:
+            index += len(self)
         if index == 0:
             if len(self) == 1:
                 self.last = None
             popped = self.head.value
             self.head = self.head.next
             self._length -= 1
+            self._index_removed(0, self.head)
             return popped
 
-        if index < 0:
-            index += len(self)
-        i = 0
-        curr = self.head
-        prev = None
-        while curr is not None:
-            if i == index:
-                if index == len(self) - 1:
-                    self.last = prev
-                popped = curr.value
-                prev.next = curr.next
-                self._length -= 1
-                return popped
-            prev = curr
-            curr = curr.next
-            i += 1
+        prev = self._node_at(index - 1)
+        curr = prev.next
+        if curr is self.last:
+            self.last = prev
+        prev.next = curr.next
+        self._length -= 1
+        self._index_removed(index, curr.next)
+        return curr.value
 
     def clear(self) -> None:
         """
@@ -461,6 +570,7 @@ class LinkedList:
         self.head = None
         self.last = None
         self._length = 0
+        self._invalidate_index()
 
     def index(self, value: Any, start: int = 0, end: int = None) -> int:
         """
@@ -492,9 +602,11 @@ class LinkedList:
         :return: number of occurrences of value in self
         """
         count = 0
-        for item in self:
-            if item == value:
+        curr = self.head
+        while curr is not None:
+            if curr.value == value:
                 count += 1
+            curr = curr.next
         return count
 
     def extend(self, other: Iterable) -> None:
@@ -508,29 +620,28 @@ class LinkedList:
         if not is_iterable(other):
             raise TypeError(f"'{type(other).__name__}' object is not iterable")
 
-        if self.head is None:
-            i = 0
-            curr = None
-            for item in other:
-                node = Node(item)
-                if i == 0:
-                    self.head = node
-                    curr = node
-                else:
-                    curr.next = node
-                    curr = node
-                    self._length += 1
-            return
+        self._link_chain(*self._build_chain(other))
 
-        curr = self.head
-        while curr.next is not None:
-            curr = curr.next
+    def splice(self, other: 'LinkedList') -> None:
+        """
+        Move every node of other to the end of self without copying, leaving other empty
 
-        for item in other:
-            node = Node(item)
-            curr.next = node
-            curr = node
-            self._length += 1
+        Running time:
+         - O(1)
+
+        :raises TypeError: if other is not the same type of linked list as self
+        :raises ValueError: if other is self
+        :param other: linked list whose nodes are moved to self
+        :return: None
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"can only splice {type(self).__name__} (not \"{type(other).__name__}\") into "
+                            f"{type(self).__name__}")
+        if other is self:
+            raise ValueError("cannot splice a linked list into itself")
+
+        self._link_chain(other.head, other.last, other._length)
+        other.clear()
 
     def reverse(self) -> None:
         """
@@ -543,12 +654,14 @@ class LinkedList:
 
         curr = self.head
         prev = None
+        self.last = curr
         while curr is not None:
             next_curr = curr.next
             curr.next = prev
             prev = curr
             curr = next_curr
         self.head = prev
+        self._invalidate_index()
 
     def copy(self) -> 'LinkedList':
         """
@@ -570,11 +683,8 @@ class LinkedList:
             raise TypeError(f"Can only concatenate list or {type(self).__name__} (not \"{type(other).__name__}\") to "
                             f"{type(self).__name__}")
 
-        new_linked_list = LinkedList()
-        for item in self:
-            new_linked_list.append(item)
-        for item in other:
-            new_linked_list.append(item)
+        new_linked_list = LinkedList(self)
+        new_linked_list.extend(other)
         return new_linked_list
 
     def __sub__(self, other: Any) -> None:
@@ -595,11 +705,7 @@ class LinkedList:
         if not isinstance(other, int):
             raise TypeError(f"can't multiply sequence by non-int of type '{type(other).__name__}'")
 
-        new_linked_list = LinkedList()
-        for _ in range(other):
-            for item in self:
-                new_linked_list.append(item)
-        return new_linked_list
+        return LinkedList(chain.from_iterable(repeat(list(self._iter_values()), other)))
 
     def __truediv__(self, other: Any) -> None:
         """
@@ -671,127 +777,1060 @@ class LinkedList:
         stop = len(self) if stop is None else stop
         step = 1 if step is None else step
 
-        new_list = LinkedList()
-        i = 0
-        curr = None
-
         if step < 0:
             new_list = self._get_slice(start, stop, 1)
             new_list.reverse()
             return new_list._get_slice(None, None, abs(step))
 
-        for item in self:
-            if i < start or (i - start) % step != 0:
-                i += 1
-                continue
+        # Values are read through _iter_values so subclasses that store several values per node slice the same way
+        new_list = LinkedList()
+        last = None
+        for i, value in enumerate(self._iter_values()):
             if i >= stop:
                 break
-            node = Node(item)
-            if curr is None:
-                new_list.head = node
-                new_list._length += 1
-            else:
-                curr.next = node
+            if i >= start and (i - start) % step == 0:
+                node = Node(value)
+                if last is None:
+                    new_list.head = node
+                else:
+                    last.next = node
+                last = node
                 new_list._length += 1
-            curr = node
-            i += 1
+        new_list.last = last
 
         return new_list
 
-    def _merge_sort(self, head: Node, key: Callable, reverse) -> None:
+    @staticmethod
+    def _find_runs(head: Node, less: Callable) -> list:
+        """
+        Static helper that cuts a chain of nodes into sorted runs
+
+        Non-descending runs are kept as they are and strictly descending runs are reversed in place, which keeps equal
+        values in their original order.
+
+        :param head: head node of the chain to cut
+        :param less: callable returning whether its first value must be placed before its second
+        :return: list of (head, tail) node pairs of the runs, in chain order
+        """
+        runs = []
+        curr = head
+        while curr is not None:
+            run_head = curr
+            following = curr.next
+            if following is not None and less(following.value, curr.value):
+                prev = curr
+                curr = following
+                run_head.next = None
+                while True:
+                    following = curr.next
+                    curr.next = prev
+                    prev = curr
+                    if following is None or not less(following.value, curr.value):
+                        break
+                    curr = following
+                runs.append((prev, run_head))
+            else:
+                while following is not None and not less(following.value, curr.value):
+                    curr = following
+                    following = curr.next
+                curr.next = None
+                runs.append((run_head, curr))
+            curr = following
+        return runs
+
+    @staticmethod
+    def _merge(left: tuple, right: tuple, less: Callable) -> tuple:
+        """
+        Static helper to merge two sorted runs into one sorted run by relinking their nodes
+        Ties are taken from left first, so the merge is stable when left came before right
+
+        :param left: (head, tail) node pair of the first run
+        :param right: (head, tail) node pair of the second run
+        :param less: callable returning whether its first value must be placed before its second
+        :return: (head, tail) node pair of the merged run
+        """
+        left_head, left_tail = left
+        right_head, right_tail = right
+        if not less(right_head.value, left_tail.value):
+            left_tail.next = right_head
+            return left_head, right_tail
+
+        sentinel = tail = Node(None)
+        while left_head is not None and right_head is not None:
+            if less(right_head.value, left_head.value):
+                tail.next = right_head
+                tail = right_head
+                right_head = right_head.next
+            else:
+                tail.next = left_head
+                tail = left_head
+                left_head = left_head.next
+        if left_head is not None:
+            tail.next = left_head
+            return sentinel.next, left_tail
+        tail.next = right_head
+        return sentinel.next, right_tail
+
+    def sort(self, key: Callable = None, reverse: bool = False) -> None:
         """
-        Helper that uses merge sort to sort the linked list in ascending order.
+        Sort the list in ascending order.
 
         If a key function is given, apply it once to each node value and sort them.
 
         The reverse flag can be set to sort in descending order.
 
-        :param head: head of list to sort
+        The sort is stable and relinks nodes instead of moving values. Already sorted runs in self are found first and
+        merged pairwise, so sorted, reverse sorted and nearly sorted lists are sorted in close to linear time.
+
+        If key or a comparison raises, self is left in its original order and the exception is propagated.
+
+        Running time:
+         - O(n log r) where r is the number of sorted runs in self, at most O(n log n)
+
         :param key: callable to sort values by
         :param reverse: flag to sort in descending order
         :return: None
         """
-        if head is None or head.next is None:
+        if self.head is None or self.head.next is None:
             return
-        middle = self._find_middle(head)
-        left = head
-        right = middle.next
-        middle.next = None
-
-        self._merge_sort(left, key, reverse)
-        self._merge_sort(right, key, reverse)
 
-        curr = left
-        if self.head is None:
-            self.head = left
+        nodes = list(self.iter_nodes())
+        if key is not None:
+            # All keys are computed before any node is touched, so a failing key leaves self as it was
+            keys = [key(node.value) for node in nodes]
+            for node, node_key in zip(nodes, keys):
+                node.value = (node_key, node.value)
+            if reverse:
+                def less(a, b):
+                    return b[0] < a[0]
+            else:
+                def less(a, b):
+                    return a[0] < b[0]
+        elif reverse:
+            def less(a, b):
+                return b < a
         else:
-            while curr.next:
-                curr = curr.next
-            curr.next = right
+            less = lt
+
+        try:
+            runs = self._find_runs(self.head, less)
+            while len(runs) > 1:
+                merged = [self._merge(runs[i], runs[i + 1], less) for i in range(0, len(runs) - 1, 2)]
+                if len(runs) % 2 == 1:
+                    merged.append(runs[-1])
+                runs = merged
+            self.head, self.last = runs[0]
+        except BaseException:
+            # A failed comparison leaves the chain partly relinked, so restore the original order
+            for node, following in zip(nodes, nodes[1:]):
+                node.next = following
+            nodes[-1].next = None
+            self.head = nodes[0]
+            self.last = nodes[-1]
+            raise
+        finally:
+            if key is not None:
+                for node in nodes:
+                    node.value = node.value[1]
+            self._invalidate_index()
+
+    def build_index(self, stride: int = None) -> None:
+        """
+        Turn on positional indexing, so indexing, __setitem__, insert and pop find a position in O(stride)
+
+        Every stride-th node is remembered as a checkpoint along with its position. Appending keeps the checkpoints
+        valid and insert, pop and remove patch the positions of the checkpoints after the change in O(n / stride).
+        Each patch lets a gap between checkpoints grow by one node, so after stride of them the checkpoints are
+        dropped and rebuilt in O(n) by the next positional lookup, amortised O(n / stride) per change. reverse and
+        sort move every node and always drop the checkpoints.
+
+        :raises ValueError: if stride is smaller than 1
+        :param stride: distance between checkpoints, sqrt(len(self)) by default
+        :return: None
+        """
+        if stride is not None and stride < 1:
+            raise ValueError("stride must be at least 1")
+        self._indexed = True
+        self._index_stride = stride
+        self._invalidate_index()
 
-        self._merge(left, right, key, reverse)
+    def drop_index(self) -> None:
+        """
+        Turn off positional indexing and release the checkpoints
 
-    @staticmethod
-    def _merge(left: Node, right: Node, key: Callable, reverse: bool) -> None:
+        :return: None
         """
-        Static helper to merge two sorted linked lists into one sorted linked list
-        Note this method takes in nodes and not linked list as the sorting is in-place
+        self._indexed = False
+        self._index_stride = None
+        self._invalidate_index()
+
+    def _invalidate_index(self) -> None:
+        """
+        Helper that discards the checkpoints after the positions of nodes in self changed
 
-        :param left: left head node
-        :param right: right head node
-        :param key: key to sort values by
-        :param reverse: flag to sort in descending order
         :return: None
         """
-        while left is not None and right is not None:
-            if key:
-                if ((not reverse and key(left.value) <= key(right.value)) or
-                        (reverse and key(left.value) >= key(right.value))):
-                    left = left.next
-                else:
-                    left.value, right.value = right.value, left.value
-                    right = right.next
-            else:
-                if ((not reverse and left.value <= right.value) or
-                        (reverse and left.value >= right.value)):
-                    left = left.next
-                else:
-                    left.value, right.value = right.value, left.value
-                    right = right.next
+        self._index = None
+        self._index_positions = None
+        self._index_changes = 0
 
-    def sort(self, key: Callable = None, reverse: bool = False) -> None:
+    def _index_inserted(self, index: int) -> None:
         """
-        Sort the list in ascending order.
+        Helper that patches the checkpoints after a node was inserted at index, every node from index on moved up
+        by one position
 
-        If a key function is given, apply it once to each node value and sort them.
+        :param index: position of the inserted node
+        :return: None
+        """
+        if self._index is None:
+            return
+        positions = self._index_positions
+        for k in range(bisect_left(positions, index), len(positions)):
+            positions[k] += 1
+        self._index_changed()
 
-        The reverse flag can be set to sort in descending order.
+    def _index_removed(self, index: int, successor: Optional[Node]) -> None:
+        """
+        Helper that patches the checkpoints after the node at index was removed, every later node moved down by one
+        position. A checkpoint on the removed node moves to its successor.
 
-        :param key: callable to sort values by
-        :param reverse: flag to sort in descending order
+        :param index: position the removed node had
+        :param successor: node that followed the removed node, now at index
         :return: None
         """
-        self._merge_sort(self.head, key=key, reverse=reverse)
+        if self._index is None:
+            return
+        positions = self._index_positions
+        k = bisect_left(positions, index)
+        if k < len(positions) and positions[k] == index:
+            if successor is None or (k + 1 < len(positions) and positions[k + 1] == index + 1):
+                del self._index[k]
+                del positions[k]
+            else:
+                self._index[k] = successor
+                k += 1
+        for k in range(k, len(positions)):
+            positions[k] -= 1
+        self._index_changed()
 
-    @staticmethod
-    def _find_middle(head: Node) -> Node:
+    def _index_changed(self) -> None:
+        """
+        Helper that counts a patch to the checkpoints and drops them once gaps may have grown to twice the stride
+
+        :return: None
+        """
+        self._index_changes += 1
+        if self._index_changes >= self._index_step:
+            self._invalidate_index()
+
+    def _node_at(self, index: int) -> Node:
+        """
+        Helper that returns the node at a non-negative index, starting from the nearest checkpoint when indexed
+
+        :param index: index of node in range [0, len(self))
+        :return: node at index
+        """
+        if not self._indexed:
+            curr = self.head
+            for _ in range(index):
+                curr = curr.next
+            return curr
+
+        # Without a fixed stride, checkpoints built while self was much shorter are too dense to patch cheaply
+        if self._index_stride is None and self._index is not None and self._length >= 4 * self._index_step ** 2:
+            self._invalidate_index()
+        if self._index is None:
+            stride = self._index_stride or max(1, isqrt(self._length))
+            self._index = [node for i, node in enumerate(self.iter_nodes()) if i % stride == 0]
+            self._index_positions = list(range(0, len(self._index) * stride, stride))
+            self._index_step = stride
+            self._index_changes = 0
+        stride = self._index_step
+        positions = self._index_positions
+
+        # Removing the head can leave no checkpoint before index, the walk then starts at the head
+        checkpoint = bisect_right(positions, index) - 1
+        if checkpoint < 0:
+            curr = self.head
+            position = 0
+        else:
+            curr = self._index[checkpoint]
+            position = positions[checkpoint]
+        # Only the last checkpoint can be more than two strides away, after appends grew the list
+        if checkpoint == len(positions) - 1:
+            while index - position >= stride:
+                for _ in range(stride):
+                    curr = curr.next
+                position += stride
+                self._index.append(curr)
+                positions.append(position)
+        for _ in range(index - position):
+            curr = curr.next
+        return curr
+
+
+class DoublyLinkedList(LinkedList):
+    """
+    A doubly linked list
+
+    Shares the interface of LinkedList, but every node also points to its predecessor so operations at the end of
+    the list and reverse iteration do not need to walk from the head.
+
+    Instance Attributes:
+     - head: The head of the linked list
+     - last: The last node of the linked list
+     - _length: The length of the linked list
+    """
+    head: Optional[DoublyNode]
+    last: Optional[DoublyNode]
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Index into linked list and return it
+
+        :param index: index to fetch element from
+        :return: returns value at index in the linked list
+        """
+        if isinstance(index, slice):
+            return self._get_slice(index.start, index.stop, index.step)
+        if index < 0 or index >= self._length:
+            raise IndexError
+        return self._node_at(index).value
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """
+        Sets value at index in the linked list to the given value
+
+        :param index: index of element to change
+        :param value: value to be set
+        :return: none
+        """
+        if index < 0 or index >= self._length:
+            raise IndexError
+        self._node_at(index).value = value
+
+    def __reversed__(self) -> Iterator:
+        """
+        Iterates through the values of self from the last to the first
+
+        :return: generator over the values of self in reverse order
         """
-        Static helper function to find the middle of a linked list given a head node to search from
+        curr = self.last
+        while curr is not None:
+            yield curr.value
+            curr = curr.prev
 
-        :param head: head node to search for middle from
-        :return: return node at index n // 2, where n is the length of the sub list self[head:]
+    def insert(self, index: int, value: Any) -> None:
         """
-        slow = head
-        fast = head
+        Inserts a value into self at index
+
+        When index is greater than or equal to len(self), value is appended to self
+        When index is negative the value is inserted at the abs(index)th position from the back of the list
+        this value is clamped at 0
+
+        Running time:
+         - O(min(index, n - index)), or amortised O(sqrt(n)) with build_index()
+         - O(1) at the end of the linked list, and at the beginning without build_index()
 
-        prev_slow = None
+        :param index: int index to insert into the linked
+        :param value: value to be inserted
+        :return: None
+        """
+        if index < 0:
+            index = max(0, index + self._length)
 
-        while fast is not None and fast.next is not None:
-            prev_slow = slow
-            slow = slow.next
-            fast = fast.next.next
+        new_node = DoublyNode(value)
+        if index >= self._length:
+            self._link_last(new_node)
+            return
 
-        return prev_slow if prev_slow else head
+        successor = self._node_at(index)
+        new_node.next = successor
+        new_node.prev = successor.prev
+        if successor.prev is None:
+            self.head = new_node
+        else:
+            successor.prev.next = new_node
+        successor.prev = new_node
+        self._length += 1
+        self._index_inserted(index)
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes a value from self
+
+        Running time:
+        - O(n) where n = len(self)
+
+        :raises ValueError: if the value is not in the list
+        :param value: value to be removed from self
+        :return: None
+        """
+        curr = self.head
+        index = 0
+        while curr is not None:
+            if curr.value == value:
+                self._unlink(curr, index)
+                return
+            curr = curr.next
+            index += 1
+        raise ValueError("DoublyLinkedList.remove(value): value not in list")
+
+    def pop(self, index: int = None) -> Any:
+        """
+        Remove and return item at index.
+
+        Index is len(self) - 1 by default removing from the end of the list.
+
+        Running Time:
+         - O(min(index, n - index)), or amortised O(sqrt(n)) with build_index()
+         - O(1) at the end of the linked list, and at the beginning without build_index()
+
+        :raises IndexError: if self is empty or index is out of range
+        :param index: index to pop from self
+        :return: item that was popped
+        """
+        if index is None:
+            index = self._length - 1
+
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        if index >= len(self) or -index > len(self):
+            raise IndexError("pop index out of range")
+        if index < 0:
+            index += len(self)
+
+        node = self._node_at(index)
+        self._unlink(node, index)
+        return node.value
+
+    def reverse(self) -> None:
+        """
+        Reverse self
+
+        :return: None
+        """
+        curr = self.head
+        while curr is not None:
+            curr.next, curr.prev = curr.prev, curr.next
+            curr = curr.prev
+        self.head, self.last = self.last, self.head
+        self._invalidate_index()
+
+    def copy(self) -> 'DoublyLinkedList':
+        """
+        Return a copy of self
+
+        :return: new doubly linked list identical to self
+        """
+        return DoublyLinkedList(self)
+
+    def __add__(self, other: Any) -> 'DoublyLinkedList':
+        """
+        Return a new doubly linked list with the values of self concatenated with other
+
+        :raises TypeError: if other is not a list type
+        :param other: list to add with self
+        :return: new doubly linked list with values of self concatenated with other
+        """
+        if not is_list(other):
+            raise TypeError(f"Can only concatenate list or {type(self).__name__} (not \"{type(other).__name__}\") to "
+                            f"{type(self).__name__}")
+
+        new_linked_list = DoublyLinkedList(self)
+        new_linked_list.extend(other)
+        return new_linked_list
+
+    def __mul__(self, other: Any) -> 'DoublyLinkedList':
+        """
+        Return a new doubly linked list with the values from self repeated other times.
+
+        :param other: Number of times to repeat self in the new list
+        :return: new doubly linked list with the values from self repeated other times
+        """
+        if not isinstance(other, int):
+            raise TypeError(f"can't multiply sequence by non-int of type '{type(other).__name__}'")
+
+        return DoublyLinkedList(chain.from_iterable(repeat(list(self._iter_values()), other)))
+
+    def _get_slice(self, start, stop, step) -> 'DoublyLinkedList':
+        """
+        Helper that returns a new doubly linked list sliced from self using start, stop and step.
+
+        :param start: index to start slice
+        :param stop: index to end slice (non-inclusive)
+        :param step: step of slice
+        :return: new doubly linked list sliced from self
+        """
+        return DoublyLinkedList(LinkedList._get_slice(self, start, stop, step))
+
+    def sort(self, key: Callable = None, reverse: bool = False) -> None:
+        """
+        Sort the list in ascending order.
+
+        If a key function is given, apply it once to each node value and sort them.
+
+        The reverse flag can be set to sort in descending order.
+
+        :param key: callable to sort values by
+        :param reverse: flag to sort in descending order
+        :return: None
+        """
+        super().sort(key=key, reverse=reverse)
+        prev = None
+        curr = self.head
+        while curr is not None:
+            curr.prev = prev
+            prev = curr
+            curr = curr.next
+        self.last = prev
+
+    def _node_at(self, index: int) -> DoublyNode:
+        """
+        Helper that returns the node at a non-negative index, walking from the nearest checkpoint when indexed and
+        from whichever end of self is closer otherwise
+
+        :param index: index of node in range [0, len(self))
+        :return: node at index
+        """
+        if self._indexed:
+            return super()._node_at(index)
+        if index <= self._length // 2:
+            curr = self.head
+            for _ in range(index):
+                curr = curr.next
+        else:
+            curr = self.last
+            for _ in range(self._length - 1 - index):
+                curr = curr.prev
+        return curr
+
+    def _build_chain(self, values: Iterable) -> tuple:
+        """
+        Helper that builds a detached chain of doubly linked nodes holding values in a single pass
+
+        :param values: values to store in the chain
+        :return: tuple (first node or None, last node or None, number of nodes)
+        """
+        sentinel = last = DoublyNode(None)
+        count = 0
+        for count, item in enumerate(values, 1):
+            node = DoublyNode(item)
+            node.prev = last
+            last.next = node
+            last = node
+        if count == 0:
+            return None, None, 0
+        head = sentinel.next
+        head.prev = None
+        return head, last, count
+
+    def _link_chain(self, head: Optional[DoublyNode], last: Optional[DoublyNode], count: int) -> None:
+        """
+        Helper that links a detached chain of nodes after the last node of self
+
+        :param head: first node of the chain, or None if the chain is empty
+        :param last: last node of the chain
+        :param count: number of nodes in the chain
+        :return: None
+        """
+        if head is not None:
+            head.prev = self.last
+        super()._link_chain(head, last, count)
+
+    def _link_last(self, node: DoublyNode) -> None:
+        """
+        Helper that links a detached node after the last node of self
+
+        :param node: node to append
+        :return: None
+        """
+        node.prev = self.last
+        if self.last is None:
+            self.head = node
+        else:
+            self.last.next = node
+        self.last = node
+        self._length += 1
+
+    def _unlink(self, node: DoublyNode, index: int) -> None:
+        """
+        Helper that detaches a node of self from its neighbours
+
+        :param node: node in self to remove
+        :param index: position of node in self
+        :return: None
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.last = node.prev
+        else:
+            node.next.prev = node.prev
+        successor = node.next
+        node.next = None
+        node.prev = None
+        self._length -= 1
+        self._index_removed(index, successor)
+
+
+class UnrolledLinkedList(LinkedList):
+    """
+    An unrolled linked list
+
+    Shares the interface of LinkedList, but every node stores a chunk of up to node_capacity values. Iteration only
+    chases one pointer per chunk and appending only allocates a node once the last chunk is full.
+
+    The node located by the most recent index lookup is remembered, so repeated indexing, insertion and popping
+    at or after that position do not walk from the head again.
+
+    Instance Attributes:
+     - head: The first chunk of the linked list
+     - last: The last chunk of the linked list
+     - node_capacity: The maximum number of values stored in a chunk
+     - _length: The length of the linked list
+     - _finger: (previous node, node, index of node's first value) of the last located node, or None
+    """
+    head: Optional[UnrolledNode]
+    last: Optional[UnrolledNode]
+    node_capacity: int
+    _finger: Optional[tuple]
+
+    def __init__(self, lst: Iterable = None, node_capacity: int = 64):
+        """
+        Constructor for UnrolledLinkedList class
+
+        :raises ValueError: if node_capacity is smaller than 2
+        :param lst: Optional list of elements to instantiate linked list
+        :param node_capacity: maximum number of values stored in each node
+        """
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.node_capacity = node_capacity
+        self._length = 0
+        self.head = None
+        self.last = None
+        self._indexed = False
+        self._index_stride = None
+        self._index_step = 1
+        self._index = None
+        self._index_positions = None
+        self._index_changes = 0
+        self._finger = None
+        if lst is not None:
+            self.extend(lst)
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Index into linked list and return it
+
+        :param index: index to fetch element from
+        :return: returns value at index in the linked list
+        """
+        if isinstance(index, slice):
+            return self._get_slice(index.start, index.stop, index.step)
+        if index < 0 or index >= self._length:
+            raise IndexError
+        _, node, offset = self._locate(index)
+        return node.values[offset]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """
+        Sets value at index in the linked list to the given value
+
+        :param index: index of element to change
+        :param value: value to be set
+        :return: none
+        """
+        if index < 0 or index >= self._length:
+            raise IndexError
+        _, node, offset = self._locate(index)
+        node.values[offset] = value
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Returns true if the given item is in self and false otherwise
+
+        :param item: item to search for in linked list
+        :return: whether the given item is in the linked list
+        """
+        node = self.head
+        while node is not None:
+            if item in node.values:
+                return True
+            node = node.next
+        return False
+
+    def __reversed__(self) -> Iterator:
+        """
+        Iterates through the values of self from the last to the first
+
+        :return: generator over the values of self in reverse order
+        """
+        nodes = list(self.iter_nodes())
+        for node in reversed(nodes):
+            yield from reversed(node.values)
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a value into self at index
+
+        When index is greater than or equal to len(self), value is appended to self
+        When index is negative the value is inserted at the abs(index)th position from the back of the list
+        this value is clamped at 0
+
+        Running time:
+         - O(index / node_capacity + node_capacity)
+         - O(node_capacity) at or after the most recently located index, and at the end of the linked list
+
+        :param index: int index to insert into the linked
+        :param value: value to be inserted
+        :return: None
+        """
+        if index < 0:
+            index = max(0, index + self._length)
+        if index >= self._length:
+            self._append_value(value)
+            return
+
+        _, node, offset = self._locate(index)
+        if len(node.values) >= self.node_capacity:
+            self._split(node)
+            if offset > len(node.values):
+                offset -= len(node.values)
+                node = node.next
+                self._finger = None
+        node.values.insert(offset, value)
+        self._length += 1
+
+    def append(self, value: Any) -> None:
+        """
+        Appends a value to the end of self
+
+        Running time:
+         - O(1)
+
+        :param value: value to be appended
+        :return: None
+        """
+        self._append_value(value)
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes a value from self
+
+        Running time:
+        - O(n) where n = len(self)
+
+        :raises ValueError: if the value is not in the list
+        :param value: value to be removed from self
+        :return: None
+        """
+        prev = None
+        node = self.head
+        while node is not None:
+            for offset, item in enumerate(node.values):
+                if item == value:
+                    self._finger = None
+                    self._delete(prev, node, offset)
+                    return
+            prev = node
+            node = node.next
+        raise ValueError("UnrolledLinkedList.remove(value): value not in list")
+
+    def pop(self, index: int = None) -> Any:
+        """
+        Remove and return item at index.
+
+        Index is len(self) - 1 by default removing from the end of the list.
+
+        Running Time:
+         - O(index / node_capacity + node_capacity)
+         - O(1) at the end of the linked list unless the last node is emptied
+
+        :raises IndexError: if self is empty or index is out of range
+        :param index: index to pop from self
+        :return: item that was popped
+        """
+        if index is None:
+            index = self._length - 1
+
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        if index >= len(self) or -index > len(self):
+            raise IndexError("pop index out of range")
+        if index < 0:
+            index += len(self)
+
+        if index == self._length - 1 and len(self.last.values) > 1:
+            self._length -= 1
+            return self.last.values.pop()
+
+        prev, node, offset = self._locate(index)
+        return self._delete(prev, node, offset)
+
+    def clear(self) -> None:
+        """
+        Clear the linked
+
+        :return: None
+        """
+        self.head = None
+        self.last = None
+        self._length = 0
+        self._finger = None
+
+    def index(self, value: Any, start: int = 0, end: int = None) -> int:
+        """
+        Return the index of value in self[start:end]
+
+        :raises ValueError: if value is not in self[start:end]
+        :param value: value to search for
+        :param start: starting index to look from
+        :param end: ending index to stop searching from (non-inclusive)
+        :return: index of value
+        """
+        if end is None:
+            end = len(self)
+
+        for index, item in enumerate(self._iter_values()):
+            if index >= end:
+                break
+            if index >= start and item == value:
+                return index
+        raise ValueError(f"{value} is not in list")
+
+    def count(self, value: Any) -> int:
+        """
+        Return the number of occurrences of value in self
+
+        :param value: value to count in self
+        :return: number of occurrences of value in self
+        """
+        count = 0
+        node = self.head
+        while node is not None:
+            count += node.values.count(value)
+            node = node.next
+        return count
+
+    def extend(self, other: Iterable) -> None:
+        """
+        Extend the linked list with the values of other
+
+        :raises TypeError: if other is not iterable
+        :param other: iterable to extend self by
+        :return: None
+        """
+        if not is_iterable(other):
+            raise TypeError(f"'{type(other).__name__}' object is not iterable")
+
+        values = list(other)
+        capacity = self.node_capacity
+        start = 0
+        if self.last is not None:
+            start = capacity - len(self.last.values)
+            self.last.values.extend(values[:start])
+        for i in range(start, len(values), capacity):
+            node = UnrolledNode(values[i:i + capacity])
+            if self.last is None:
+                self.head = node
+            else:
+                self.last.next = node
+            self.last = node
+        self._length += len(values)
+
+    def reverse(self) -> None:
+        """
+        Reverse self
+
+        :return: None
+        """
+        prev = None
+        node = self.head
+        self.last = node
+        while node is not None:
+            node.values.reverse()
+            next_node = node.next
+            node.next = prev
+            prev = node
+            node = next_node
+        self.head = prev
+        self._finger = None
+
+    def copy(self) -> 'UnrolledLinkedList':
+        """
+        Return a copy of self
+
+        :return: new unrolled linked list identical to self
+        """
+        return UnrolledLinkedList(self, self.node_capacity)
+
+    def __add__(self, other: Any) -> 'UnrolledLinkedList':
+        """
+        Return a new unrolled linked list with the values of self concatenated with other
+
+        :raises TypeError: if other is not a list type
+        :param other: list to add with self
+        :return: new unrolled linked list with values of self concatenated with other
+        """
+        if not is_list(other):
+            raise TypeError(f"Can only concatenate list or {type(self).__name__} (not \"{type(other).__name__}\") to "
+                            f"{type(self).__name__}")
+
+        new_linked_list = UnrolledLinkedList(self, self.node_capacity)
+        new_linked_list.extend(other)
+        return new_linked_list
+
+    def __mul__(self, other: Any) -> 'UnrolledLinkedList':
+        """
+        Return a new unrolled linked list with the values from self repeated other times.
+
+        :param other: Number of times to repeat self in the new list
+        :return: new unrolled linked list with the values from self repeated other times
+        """
+        if not isinstance(other, int):
+            raise TypeError(f"can't multiply sequence by non-int of type '{type(other).__name__}'")
+
+        return UnrolledLinkedList(list(self) * other, self.node_capacity)
+
+    def _get_slice(self, start, stop, step) -> 'UnrolledLinkedList':
+        """
+        Helper that returns a new unrolled linked list sliced from self using start, stop and step.
+
+        :param start: index to start slice
+        :param stop: index to end slice (non-inclusive)
+        :param step: step of slice
+        :return: new unrolled linked list sliced from self
+        """
+        return UnrolledLinkedList(LinkedList._get_slice(self, start, stop, step), self.node_capacity)
+
+    def sort(self, key: Callable = None, reverse: bool = False) -> None:
+        """
+        Sort the list in ascending order.
+
+        If a key function is given, apply it once to each node value and sort them.
+
+        The reverse flag can be set to sort in descending order.
+
+        :param key: callable to sort values by
+        :param reverse: flag to sort in descending order
+        :return: None
+        """
+        values = list(self._iter_values())
+        values.sort(key=key, reverse=reverse)
+        node = self.head
+        i = 0
+        while node is not None:
+            size = len(node.values)
+            node.values[:] = values[i:i + size]
+            i += size
+            node = node.next
+
+    def build_index(self, stride: int = None) -> None:
+        """
+        Accepted for compatibility with LinkedList and does nothing
+
+        Positional lookups in self already skip whole chunks and resume from the last located node, so checkpoints
+        would save little. Lookups stay O(n / node_capacity) whatever the stride.
+
+        :raises ValueError: if stride is smaller than 1
+        :param stride: ignored
+        :return: None
+        """
+        if stride is not None and stride < 1:
+            raise ValueError("stride must be at least 1")
+
+    def drop_index(self) -> None:
+        """
+        Accepted for compatibility with LinkedList and does nothing, see build_index
+
+        :return: None
+        """
+
+    def _iter_values(self) -> Iterator:
+        """
+        Helper generator over the values of self
+
+        :return: generator over the values of self
+        """
+        node = self.head
+        while node is not None:
+            yield from node.values
+            node = node.next
+
+    def _locate(self, index: int) -> tuple:
+        """
+        Helper that finds the node holding a non-negative index, starting from the remembered node when possible
+
+        :param index: index in range [0, len(self))
+        :return: tuple (previous node, node, offset of index within node.values)
+        """
+        prev, node, start = None, self.head, 0
+        if self._finger is not None and self._finger[2] <= index:
+            prev, node, start = self._finger
+        while index - start >= len(node.values):
+            start += len(node.values)
+            prev = node
+            node = node.next
+        self._finger = (prev, node, start)
+        return prev, node, index - start
+
+    def _split(self, node: UnrolledNode) -> None:
+        """
+        Helper that moves the second half of a node's values into a new node linked after it
+
+        :param node: node to split
+        :return: None
+        """
+        half = len(node.values) // 2
+        new_node = UnrolledNode(node.values[half:])
+        del node.values[half:]
+        new_node.next = node.next
+        node.next = new_node
+        if node is self.last:
+            self.last = new_node
+
+    def _append_value(self, value: Any) -> None:
+        """
+        Helper that appends a value to the last node of self, adding a node if it is full
+
+        :param value: value to be appended
+        :return: None
+        """
+        if self.last is None or len(self.last.values) >= self.node_capacity:
+            node = UnrolledNode([value])
+            if self.last is None:
+                self.head = node
+            else:
+                self.last.next = node
+            self.last = node
+        else:
+            self.last.values.append(value)
+        self._length += 1
+
+    def _delete(self, prev: Optional[UnrolledNode], node: UnrolledNode, offset: int) -> Any:
+        """
+        Helper that removes and returns the value at offset in node, unlinking node if it becomes empty
+
+        :param prev: node before node, or None if node is the head
+        :param node: node holding the value
+        :param offset: offset of the value within node.values
+        :return: removed value
+        """
+        value = node.values.pop(offset)
+        self._length -= 1
+        if not node.values:
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node is self.last:
+                self.last = prev
+            self._finger = None
+        return value
 
 
 class LinkedListIterator:
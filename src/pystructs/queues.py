@@ -1,5 +1,10 @@
 from linked_list import LinkedList
-from typing import Any, List
+from heaps import MinHeap, HeapNode
+from typing import Any, Dict, List, Optional, Tuple
+from queue import Empty, Full
+from collections import deque
+import asyncio
+import threading
 
 
 class Stack:
@@ -22,23 +27,248 @@ class Stack:
 
 
 class Queue:
+    # Items enter at self.queue.last and leave from self.queue.head, both O(1)
     queue: LinkedList
 
     def __init__(self):
         self.queue = LinkedList()
 
     def enqueue(self, item):
-        self.queue.insert(0, item)
+        self.queue.append(item)
 
     def dequeue(self):
-        return self.queue.pop()
+        return self.queue.pop(0)
 
     def peek(self) -> Any:
-        return self.queue[len(self.queue) - 1]
+        if self.queue.head is None:
+            raise IndexError("peek from empty queue")
+        return self.queue.head.value
 
     def is_empty(self) -> bool:
         return len(self.queue) == 0
 
+    def __len__(self):
+        return len(self.queue)
+
+
 class PriorityQueue(Queue):
-    queue: LinkedList
+    # Smallest priority first, items with equal priorities leave in the order they were enqueued. The heap holds
+    # handles keyed on (priority, handle), handles are taken from an increasing counter so they break ties FIFO.
+    queue: MinHeap
+    items: Dict[int, Any]
+
+    _counter: int
+
+    def __init__(self) -> None:
+        self.queue = MinHeap()
+        self.items = {}
+        self._counter = 0
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self.items
+
+    def enqueue(self, item: Any, priority: Any = 0) -> int:
+        # Returns a handle that can be passed to update and cancel while the item is queued
+        handle = self._counter
+        self._counter += 1
+        self.items[handle] = item
+        self.queue.insert(handle, (priority, handle))
+        return handle
+
+    def dequeue(self) -> Any:
+        if not self.items:
+            raise IndexError("dequeue from empty queue")
+        return self.items.pop(self.queue.extract_min())
+
+    def peek(self) -> Any:
+        if not self.items:
+            raise IndexError("peek from empty queue")
+        return self.items[self.queue.min().value]
+
+    def priority(self, handle: int) -> Any:
+        return self._entry(handle).priority[0]
+
+    def update(self, handle: int, priority: Any) -> None:
+        # The item keeps its place among items of equal priority that were enqueued after it
+        self._entry(handle)
+        self.queue.set_priority(handle, (priority, handle))
+
+    def cancel(self, handle: int) -> Any:
+        self._entry(handle)
+        self.queue.remove(handle)
+        return self.items.pop(handle)
+
+    def _entry(self, handle: int) -> HeapNode:
+        if handle not in self.items:
+            raise ValueError("Handle is not in queue")
+        return self.queue.heap[self.queue.positions[handle]]
+
+
+class ConcurrentQueue:
+    # Queue shared between threads. One lock guards self.queue, consumers wait on not_empty and, when maxsize is
+    # positive, producers wait on not_full so a slow consumer pushes back on producers. Empty and Full are the
+    # exceptions of the standard library queue module.
+    queue: Queue
+    maxsize: int
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.queue = self._make_queue()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.queue)
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        self._put((item,), block, timeout)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        with self._not_empty:
+            self._wait_for_items(block, timeout)
+            item = self.queue.dequeue()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, max_items: int, block: bool = True, timeout: Optional[float] = None) -> List[Any]:
+        # Waits like get for the first item, then takes up to max_items that are already queued
+        with self._not_empty:
+            self._wait_for_items(block, timeout)
+            items = [self.queue.dequeue() for _ in range(min(max_items, len(self.queue)))]
+            self._not_full.notify(len(items))
+            return items
+
+    def _make_queue(self) -> Queue:
+        return Queue()
+
+    def _put(self, args: Tuple, block: bool, timeout: Optional[float]) -> None:
+        with self._not_full:
+            if 0 < self.maxsize <= len(self.queue):
+                if not block or not self._not_full.wait_for(lambda: len(self.queue) < self.maxsize, timeout):
+                    raise Full
+            self.queue.enqueue(*args)
+            self._not_empty.notify()
+
+    def _wait_for_items(self, block: bool, timeout: Optional[float]) -> None:
+        if self.queue.is_empty():
+            if not block or not self._not_empty.wait_for(lambda: not self.queue.is_empty(), timeout):
+                raise Empty
+
+
+class ConcurrentPriorityQueue(ConcurrentQueue):
+    # put takes block and timeout in the same positions as ConcurrentQueue.put, priority comes after them
+    queue: PriorityQueue
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None, priority: Any = 0) -> None:
+        self._put((item, priority), block, timeout)
+
+    def _make_queue(self) -> PriorityQueue:
+        return PriorityQueue()
+
+
+class AsyncQueue:
+    # Queue shared between tasks on one asyncio event loop, with the same backpressure as ConcurrentQueue. Everything
+    # runs on the loop thread so no lock is needed, tasks that have to wait park a future in _getters or _putters
+    # and the other side resolves the oldest one. A cancelled task takes its future back out, so waits abandoned by
+    # asyncio.wait_for do not pile up. Waits have no timeout argument, wrap them in asyncio.wait_for instead. The
+    # nowait methods raise asyncio.QueueEmpty and asyncio.QueueFull.
+    queue: Queue
+    maxsize: int
+
+    _getters: deque
+    _putters: deque
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.queue = self._make_queue()
+        self.maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def is_empty(self) -> bool:
+        return self.queue.is_empty()
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self.queue)
+
+    async def put(self, item: Any) -> None:
+        await self._put((item,))
+
+    def put_nowait(self, item: Any) -> None:
+        self._put_nowait((item,))
+
+    async def get(self) -> Any:
+        while self.queue.is_empty():
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        if self.queue.is_empty():
+            raise asyncio.QueueEmpty
+        item = self.queue.dequeue()
+        self._wake_next(self._putters)
+        return item
+
+    async def get_many(self, max_items: int) -> List[Any]:
+        while self.queue.is_empty():
+            await self._wait(self._getters)
+        items = [self.queue.dequeue() for _ in range(min(max_items, len(self.queue)))]
+        for _ in items:
+            self._wake_next(self._putters)
+        return items
+
+    def _make_queue(self) -> Queue:
+        return Queue()
+
+    async def _put(self, args: Tuple) -> None:
+        while self.full():
+            await self._wait(self._putters)
+        self._put_nowait(args)
+
+    def _put_nowait(self, args: Tuple) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self.queue.enqueue(*args)
+        self._wake_next(self._getters)
+
+    async def _wait(self, waiters: deque) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # Already taken out by _wake_next, pass the wake up on so it is not lost
+                self._wake_next(waiters)
+            raise
+
+    @staticmethod
+    def _wake_next(waiters: deque) -> None:
+        # Waiters cancelled in the same loop iteration have not removed themselves yet and are skipped here
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class AsyncPriorityQueue(AsyncQueue):
+    queue: PriorityQueue
+
+    async def put(self, item: Any, priority: Any = 0) -> None:
+        await self._put((item, priority))
+
+    def put_nowait(self, item: Any, priority: Any = 0) -> None:
+        self._put_nowait((item, priority))
 
+    def _make_queue(self) -> PriorityQueue:
+        return PriorityQueue()
@@ -0,0 +1,72 @@
+from typing import Dict, List
+from array import array
+
+
+class DisjointSet:
+    # Disjoint sets over the integer ids 0..n-1. parent[i] == i marks the root that names a set, rank[i] bounds the
+    # height of the tree under a root. Union by rank keeps the trees shallow and find points every vertex it
+    # passes straight at the root, together making both operations near O(1) amortised.
+    parent: array
+    rank: bytearray
+    count: int  # number of sets
+
+    def __init__(self, n: int = 0) -> None:
+        self.parent = array('q', range(n))
+        self.rank = bytearray(n)
+        self.count = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        # New singleton set, returns its id
+        i = len(self.parent)
+        self.parent.append(i)
+        self.rank.append(0)
+        self.count += 1
+        return i
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i: int, j: int) -> bool:
+        # Merge the sets containing i and j, returns False if they were already the same set
+        i = self.find(i)
+        j = self.find(j)
+        if i == j:
+            return False
+        rank = self.rank
+        if rank[i] < rank[j]:
+            i, j = j, i
+        self.parent[j] = i
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        self.count -= 1
+        return True
+
+    def same(self, i: int, j: int) -> bool:
+        return self.find(i) == self.find(j)
+
+    def groups(self) -> Dict[int, List[int]]:
+        # Members of every set keyed by root, members in increasing id order
+        parent = self.parent
+        groups = {}
+        for i in range(len(parent)):
+            # find(i), inlined as this runs once per element
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            j = i
+            while parent[j] != root:
+                parent[j], j = root, parent[j]
+            if root in groups:
+                groups[root].append(i)
+            else:
+                groups[root] = [i]
+        return groups
@@ -0,0 +1,147 @@
+from src.pystructs.graph import Graph, FrozenGraph
+import os
+import random
+import tempfile
+import unittest
+
+
+class TestFrozenGraph(unittest.TestCase):
+    @staticmethod
+    def random_graph(n: int, m: int, directed: bool, seed: int) -> Graph:
+        rng = random.Random(seed)
+        g = Graph(directed=directed)
+        for i in range(n):
+            g.add_vertex(f"v{i}")
+        for _ in range(m):
+            g.add_edge(f"v{rng.randrange(n)}", f"v{rng.randrange(n)}")
+        return g
+
+    def test_frozen_graph_structure(self):
+        g = self.random_graph(30, 60, directed=True, seed=1)
+        frozen = g.freeze()
+        self.assertEqual(len(frozen), 30)
+        self.assertEqual(frozen.edge_count(), len(g.edges))
+        self.assertFalse(frozen.weighted)
+        for value, vertex in g.vertices.items():
+            self.assertEqual(sorted(frozen.neighbours(value)), sorted(u.value for u in g.adj[vertex]))
+
+    def test_frozen_graph_bfs_matches_graph(self):
+        for directed in (False, True):
+            g = self.random_graph(50, 70, directed, seed=2)
+            frozen = g.freeze()
+            g.bfs('v0')
+            distance, parent = frozen.bfs('v0')
+            for value, vertex in g.vertices.items():
+                i = frozen.ids[value]
+                if vertex.distance == float('inf'):
+                    self.assertEqual(distance[i], -1)
+                else:
+                    self.assertEqual(distance[i], vertex.distance)
+                    if parent[i] != -1:
+                        self.assertEqual(distance[parent[i]], distance[i] - 1)
+
+    def test_frozen_graph_dfs_and_topological_sort(self):
+        g = Graph(directed=True)
+        for i in range(6):
+            g.add_vertex(i)
+        for v, u in [(0, 1), (1, 2), (0, 3), (3, 2), (4, 5)]:
+            g.add_edge(v, u)
+        frozen = g.freeze()
+        discovery, finish, parent = frozen.dfs()
+        self.assertEqual(sorted(list(discovery) + list(finish)), list(range(1, 13)))
+        for v, u in [(0, 1), (1, 2), (0, 3), (3, 2), (4, 5)]:
+            self.assertGreater(finish[frozen.ids[v]], finish[frozen.ids[u]])
+        self.assertFalse(frozen.has_cycle())
+        order = list(frozen.topological_sort())
+        for v, u in [(0, 1), (1, 2), (0, 3), (3, 2), (4, 5)]:
+            self.assertLess(order.index(v), order.index(u))
+
+        g.add_edge(2, 0)
+        frozen = g.freeze()
+        self.assertTrue(frozen.has_cycle())
+        self.assertTrue(frozen.topological_sort() == [])
+
+    def test_frozen_graph_is_bipartite(self):
+        even_cycle = Graph()
+        for i in range(6):
+            even_cycle.add_vertex(i)
+        for i in range(6):
+            even_cycle.add_edge(i, (i + 1) % 6)
+        self.assertTrue(even_cycle.freeze().is_bipartite())
+        even_cycle.add_edge(0, 2)
+        self.assertFalse(even_cycle.freeze().is_bipartite())
+
+        directed = Graph(directed=True)
+        for i in range(3):
+            directed.add_vertex(i)
+        directed.add_edge(2, 0)
+        directed.add_edge(1, 0)
+        self.assertTrue(directed.freeze().is_bipartite())
+        directed.add_edge(2, 1)
+        self.assertFalse(directed.freeze().is_bipartite())
+
+    def test_frozen_graph_snapshot_round_trip(self):
+        weighted = Graph(directed=True, weighted=True)
+        for value in ['a', 'b', 'c', (1, 2)]:
+            weighted.add_vertex(value)
+        for v, u, weight in [('a', 'b', 1.5), ('b', 'c', 2), ('c', (1, 2), 0.25), ((1, 2), 'a', 4)]:
+            weighted.add_edge(v, u, weight)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.pysg')
+            for g in (self.random_graph(40, 80, directed=False, seed=3), weighted):
+                frozen = g.freeze()
+                frozen.save(path)
+                for use_mmap in (True, False):
+                    loaded = FrozenGraph.load(path, use_mmap=use_mmap)
+                    self.assertEqual(loaded.values, frozen.values)
+                    self.assertEqual(loaded.directed, frozen.directed)
+                    self.assertEqual(list(loaded.offsets), list(frozen.offsets))
+                    self.assertEqual(list(loaded.targets), list(frozen.targets))
+                    self.assertEqual(loaded.weights and list(loaded.weights), frozen.weights and list(frozen.weights))
+                    self.assertEqual(loaded.bfs(frozen.values[0]), frozen.bfs(frozen.values[0]))
+                    self.assertEqual(loaded.dfs(), frozen.dfs())
+                    self.assertEqual(loaded.is_bipartite(), frozen.is_bipartite())
+                    del loaded
+
+    def test_frozen_graph_snapshot_save_over_mapped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.pysg')
+            frozen = self.random_graph(40, 80, directed=True, seed=4).freeze()
+            frozen.save(path)
+            mapped = FrozenGraph.load(path)
+            reader = FrozenGraph.load(path)
+            # Saving a mapped snapshot back to its own path, and replacing it while another reader has it mapped
+            mapped.save(path)
+            self.random_graph(10, 5, directed=True, seed=5).freeze().save(path)
+            self.assertEqual(list(reader.targets), list(frozen.targets))
+            self.assertEqual(reader.bfs(frozen.values[0]), frozen.bfs(frozen.values[0]))
+            self.assertEqual(len(FrozenGraph.load(path).values), 10)
+            self.assertEqual(os.listdir(directory), ['graph.pysg'])
+            del mapped, reader
+
+    def test_frozen_graph_snapshot_invalid(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.pysg')
+            with open(path, 'wb') as file:
+                file.write(b'not a graph snapshot at all, just some text')
+            self.assertRaises(ValueError, FrozenGraph.load, path, use_mmap=False)
+            self.random_graph(5, 5, directed=True, seed=1).freeze().save(path)
+            with open(path, 'r+b') as file:
+                file.truncate(48)
+            self.assertRaises(ValueError, FrozenGraph.load, path, use_mmap=False)
+
+    def test_frozen_graph_condensation(self):
+        g = self.random_graph(60, 90, directed=True, seed=4)
+        frozen = g.freeze()
+        component, count = frozen.strongly_connected_components()
+        self.assertEqual(sorted(set(component)), list(range(count)))
+        self.assertEqual(count, len(g.strongly_connected_components()))
+        dag, dag_component = frozen.condensation()
+        self.assertEqual(list(dag_component), list(component))
+        self.assertEqual(len(dag), count)
+        self.assertFalse(dag.has_cycle())
+        expected = {(component[frozen.ids[v.value]], component[frozen.ids[u.value]]) for v, u in g.edges}
+        self.assertEqual({(c, d) for c in range(count) for d in dag.neighbours(c)},
+                         {(c, d) for c, d in expected if c != d})
+        for c, d in expected:
+            self.assertLessEqual(c, d)
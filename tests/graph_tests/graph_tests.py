@@ -0,0 +1,442 @@
+from src.pystructs.graph import Graph, CycleError
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import io
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+
+class TestGraph(unittest.TestCase):
+    def setUp(self):
+        self.dag = Graph(directed=True)
+        for clothing in ['underwear', 'pants', 'belt', 'socks', 'shoes', 'watch', 'shirt', 'tie', 'jacket']:
+            self.dag.add_vertex(clothing)
+        for v, u in [('pants', 'shoes'), ('shirt', 'tie'), ('underwear', 'pants'), ('pants', 'belt'),
+                     ('belt', 'jacket'), ('shirt', 'belt'), ('underwear', 'shoes'), ('tie', 'jacket'),
+                     ('socks', 'shoes')]:
+            self.dag.add_edge(v, u)
+
+    @staticmethod
+    def chain(n: int, directed: bool = True) -> Graph:
+        g = Graph(directed=directed)
+        for i in range(n):
+            g.add_vertex(i)
+        for i in range(1, n):
+            g.add_edge(i - 1, i)
+        return g
+
+    def assert_topological(self, g: Graph, order) -> None:
+        order = list(order)
+        self.assertEqual(sorted(order, key=str), sorted(g.vertices, key=str))
+        position = {value: i for i, value in enumerate(order)}
+        for v, u in g.edges:
+            self.assertLess(position[v.value], position[u.value])
+
+    def test_graph_dfs_times(self):
+        self.dag.dfs()
+        times = []
+        for vertex in self.dag.vertices.values():
+            self.assertEqual(vertex.colour, 'black')
+            self.assertLess(vertex.distance, vertex.finish_time)
+            times.extend([vertex.distance, vertex.finish_time])
+        self.assertEqual(sorted(times), list(range(1, 2 * len(self.dag.vertices) + 1)))
+        for v, u in self.dag.edges:
+            self.assertGreater(v.finish_time, u.finish_time)
+        for vertex in self.dag.vertices.values():
+            if vertex.parent is not None:
+                self.assertLess(vertex.parent.distance, vertex.distance)
+                self.assertGreater(vertex.parent.finish_time, vertex.finish_time)
+
+    def test_graph_dfs_deep_chain(self):
+        g = self.chain(20000)
+        self.assertFalse(g.has_cycle())
+        self.assertEqual(g.vertices[19999].parent.value, 19998)
+        self.assertEqual(list(g.topological_sort()), list(range(20000)))
+        g.add_edge(19999, 0)
+        self.assertTrue(g.has_cycle())
+        self.assertTrue(g.topological_sort() == [])
+
+    def test_graph_topological_sort(self):
+        self.assert_topological(self.dag, self.dag.topological_sort())
+
+    def test_graph_has_cycle_undirected(self):
+        g = self.chain(5, directed=False)
+        self.assertFalse(g.has_cycle())
+        g.add_edge(4, 0)
+        self.assertTrue(g.has_cycle())
+
+    def test_graph_topological_order(self):
+        self.assert_topological(self.dag, self.dag.topological_order())
+
+    def test_graph_topological_waves(self):
+        waves = list(self.dag.topological_waves())
+        self.assert_topological(self.dag, [value for wave in waves for value in wave])
+        self.assertEqual(set(waves[0]), {'underwear', 'socks', 'watch', 'shirt'})
+        wave_of = {value: i for i, wave in enumerate(waves) for value in wave}
+        for v, u in self.dag.edges:
+            self.assertLess(wave_of[v.value], wave_of[u.value])
+
+    def test_graph_topological_order_reports_cycle(self):
+        g = self.chain(6)
+        g.add_edge(4, 2)
+        g.add_vertex('after')
+        g.add_edge(3, 'after')
+        yielded = []
+        with self.assertRaises(CycleError) as context:
+            for value in g.topological_order():
+                yielded.append(value)
+        self.assertEqual(yielded, [0, 1])
+        cycle = context.exception.cycle
+        self.assertEqual(sorted(cycle), [2, 3, 4])
+        for i, value in enumerate(cycle):
+            self.assertIn(g.vertices[cycle[(i + 1) % len(cycle)]], g.adj[g.vertices[value]])
+        self.assertRaises(CycleError, list, g.topological_waves())
+        self.assertRaises(ValueError, list, self.chain(3, directed=False).topological_order())
+
+    def test_graph_breadth_first_search(self):
+        g = self.chain(6, directed=False)
+        g.add_vertex('island')
+        result = g.breadth_first_search(2)
+        self.assertEqual(result.distance, {0: 2, 1: 1, 2: 0, 3: 1, 4: 2, 5: 3})
+        self.assertNotIn('island', result)
+        self.assertEqual(list(result.path_to(5)), [2, 3, 4, 5])
+        self.assertEqual(list(result.path_to(2)), [2])
+        self.assertIsNone(result.path_to('island'))
+        for vertex in g.vertices.values():
+            self.assertIsNone(vertex.colour)
+
+        g.bfs(2)
+        for value, vertex in g.vertices.items():
+            if value in result:
+                self.assertEqual(result.distance[value], vertex.distance)
+
+    def test_graph_depth_first_search(self):
+        result = self.dag.depth_first_search()
+        self.assertFalse(result.has_cycle)
+        self.assertEqual(sorted(list(result.discovery.values()) + list(result.finish.values())),
+                         list(range(1, 2 * len(self.dag.vertices) + 1)))
+        for v, u in self.dag.edges:
+            self.assertGreater(result.finish[v.value], result.finish[u.value])
+        for vertex in self.dag.vertices.values():
+            self.assertIsNone(vertex.colour)
+
+        self.assertFalse(self.chain(5, directed=False).depth_first_search().has_cycle)
+        cyclic = self.chain(5)
+        cyclic.add_edge(4, 1)
+        self.assertTrue(cyclic.depth_first_search().has_cycle)
+
+    def test_graph_concurrent_searches(self):
+        g = self.chain(300, directed=False)
+        for i in range(0, 300, 7):
+            g.add_edge(i, (i * 13) % 300)
+        expected = {source: g.breadth_first_search(source).distance for source in range(0, 300, 10)}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(g.breadth_first_search, expected)
+            for result in results:
+                self.assertEqual(result.distance, expected[result.source])
+
+    def test_graph_k_hop(self):
+        g = self.chain(10, directed=False)
+        result = g.k_hop(5, 2)
+        self.assertEqual(result.distance, {3: 2, 4: 1, 5: 0, 6: 1, 7: 2})
+        self.assertEqual(list(result.path_to(7)), [5, 6, 7])
+        self.assertEqual(g.k_hop(5, 0).distance, {5: 0})
+        self.assertEqual(self.chain(10).k_hop(5, 2).distance, {5: 0, 6: 1, 7: 2})
+        self.assertEqual(self.chain(10).breadth_first_search(0, max_depth=3).distance, {0: 0, 1: 1, 2: 2, 3: 3})
+
+    def test_graph_shortest_path(self):
+        for directed in (False, True):
+            g = self.chain(10, directed=directed)
+            g.add_edge(2, 7)
+            self.assertEqual(list(g.shortest_path(0, 9)), [0, 1, 2, 7, 8, 9])
+            self.assertEqual(list(g.shortest_path(4, 4)), [4])
+            self.assertIsNone(g.shortest_path(0, 9, max_hops=4))
+            self.assertEqual(len(g.shortest_path(0, 9, max_hops=5)), 6)
+            self.assertTrue(g.within_hops(0, 8, 4))
+            self.assertFalse(g.within_hops(0, 8, 3))
+        self.assertIsNone(self.chain(10).shortest_path(9, 0))
+        self.assertEqual(list(self.chain(10, directed=False).shortest_path(9, 0)), list(range(9, -1, -1)))
+
+    def test_graph_shortest_path_matches_breadth_first_search(self):
+        rng = random.Random(3)
+        for directed in (False, True):
+            g = Graph(directed=directed)
+            for i in range(60):
+                g.add_vertex(i)
+            for _ in range(90):
+                g.add_edge(rng.randrange(60), rng.randrange(60))
+            for source in range(0, 60, 6):
+                result = g.breadth_first_search(source)
+                for target in range(60):
+                    path = g.shortest_path(source, target)
+                    if target not in result:
+                        self.assertIsNone(path)
+                        continue
+                    self.assertEqual(len(path) - 1, result.distance[target])
+                    path = list(path)
+                    self.assertEqual((path[0], path[-1]), (source, target))
+                    for v, u in zip(path, path[1:]):
+                        self.assertIn(g.vertices[u], g.adj[g.vertices[v]])
+
+    @staticmethod
+    def weighted_graph(n: int, m: int, directed: bool, seed: int) -> Graph:
+        rng = random.Random(seed)
+        g = Graph(directed=directed, weighted=True)
+        for i in range(n):
+            g.add_vertex(i)
+        for _ in range(m):
+            g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(0, 20))
+        return g
+
+    def test_graph_dijkstra(self):
+        for directed in (False, True):
+            g = self.weighted_graph(60, 150, directed, seed=5)
+            result = g.dijkstra(0)
+            # Bellman-Ford style relaxation as the reference
+            expected = {0: 0}
+            for _ in range(len(g.vertices)):
+                for v, neighbours in g.adj.items():
+                    if v.value in expected:
+                        for u, weight in neighbours.items():
+                            if expected[v.value] + weight < expected.get(u.value, float('inf')):
+                                expected[u.value] = expected[v.value] + weight
+            self.assertEqual(result.distance, expected)
+            for target in result.distance:
+                path = list(result.path_to(target))
+                self.assertEqual(sum(g.adj[g.vertices[v]][g.vertices[u]] for v, u in zip(path, path[1:])),
+                                 expected[target])
+
+    def test_graph_dijkstra_target(self):
+        g = self.chain(10, directed=False)
+        g.add_edge(0, 9, 3)
+        result = g.dijkstra(0, 8)
+        self.assertEqual(result.distance[8], 4)
+        self.assertEqual(list(result.path_to(8)), [0, 9, 8])
+        self.assertNotIn(5, result)
+        g.add_edge(4, 5, -1)
+        with self.assertRaises(ValueError):
+            g.dijkstra(0)
+
+    def test_graph_a_star(self):
+        w = 20
+        g = Graph(weighted=True)
+        for x in range(w):
+            for y in range(w):
+                g.add_vertex((x, y))
+        rng = random.Random(2)
+        for x in range(w):
+            for y in range(w):
+                if x + 1 < w:
+                    g.add_edge((x, y), (x + 1, y), rng.randint(1, 9))
+                if y + 1 < w:
+                    g.add_edge((x, y), (x, y + 1), rng.randint(1, 9))
+        target = (w - 1, w - 1)
+        result = g.a_star((0, 0), target, lambda v: abs(target[0] - v[0]) + abs(target[1] - v[1]))
+        self.assertEqual(result.distance[target], g.dijkstra((0, 0)).distance[target])
+        self.assertLess(len(result.distance), len(g.vertices))
+
+    def test_graph_freeze_weights(self):
+        g = self.weighted_graph(20, 40, directed=True, seed=1)
+        frozen = g.freeze()
+        for vertex, neighbours in g.adj.items():
+            i = frozen.ids[vertex.value]
+            stored = {frozen.values[frozen.targets[j]]: frozen.weights[j]
+                      for j in range(frozen.offsets[i], frozen.offsets[i + 1])}
+            self.assertEqual(stored, {u.value: weight for u, weight in neighbours.items()})
+        self.assertIsNone(self.chain(5).freeze().weights)
+
+    def test_graph_from_edge_list(self):
+        text = "# road network\na b 2.5\nb c 1\n\nc a 4\nb a 7\nd e 1\n"
+        for source in (io.StringIO(text), io.BytesIO(text.encode())):
+            g = Graph.from_edge_list(source, weighted=True)
+            self.assertEqual(sorted(g.vertices), ['a', 'b', 'c', 'd', 'e'])
+            self.assertEqual(len(g.edges), 4)
+            self.assertEqual(g.adj[g.vertices['a']][g.vertices['b']], 7)
+            self.assertEqual(g.adj[g.vertices['b']][g.vertices['a']], 7)
+            self.assertEqual(g.dijkstra('a').distance['c'], 4)
+        g = Graph.from_edge_list(io.StringIO(text), weighted=True, duplicates='first')
+        self.assertEqual(g.adj[g.vertices['b']][g.vertices['a']], 2.5)
+        g = Graph.from_edge_list(io.StringIO(text), directed=True, duplicates='min')
+        self.assertEqual(len(g.edges), 5)
+        with self.assertRaises(ValueError):
+            Graph.from_edge_list(io.StringIO("a\n"))
+
+    def test_graph_from_edge_list_file(self):
+        rng = random.Random(6)
+        names = [f"städte-{i}" for i in range(50)]
+        lines = [(rng.choice(names), rng.choice(names)) for _ in range(300)]
+        reference = Graph(directed=True)
+        for name in names:
+            reference.add_vertex(name)
+        for v, u in lines:
+            reference.add_edge(v, u)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'edges.txt')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(''.join(f"{v},{u}\n" for v, u in lines))
+            for use_mmap in (False, True):
+                # A small chunk size splits lines and multi-byte characters between chunks
+                g = Graph.from_edge_list(path, directed=True, delimiter=',', use_mmap=use_mmap, chunk_size=7)
+                self.assertEqual(set(g.vertices), {value for line in lines for value in line})
+                for value, v in g.vertices.items():
+                    self.assertEqual({u.value for u in g.adj[v]},
+                                     {u.value for u in reference.adj[reference.vertices[value]]})
+                self.assertEqual({(v.value, u.value) for v, u in g.edges}, set(lines))
+            open(path, 'w').close()
+            self.assertEqual(len(Graph.from_edge_list(path, use_mmap=True).vertices), 0)
+        g = Graph.from_edge_list(io.StringIO("1 2\n2 3"), vertex_type=int)
+        self.assertEqual(list(g.shortest_path(1, 3)), [1, 2, 3])
+
+    def test_graph_from_edge_list_line_endings_and_encoding(self):
+        # Only '\n' ends a line, a '\r' before it is dropped and other separators stay part of the vertex
+        text = "a,b\r\nb,c\x0cd\r\nc\u2028e,a\n"
+        for source in (io.StringIO(text), io.BytesIO(text.encode())):
+            g = Graph.from_edge_list(source, delimiter=',')
+            self.assertEqual(sorted(g.vertices), ['a', 'b', 'c\x0cd', 'c\u2028e'])
+            self.assertEqual(len(g.edges), 3)
+        g = Graph.from_edge_list(io.StringIO("a,b\n\n  \t\r\nb,c\n"), delimiter=',')
+        self.assertEqual(sorted(g.vertices), ['a', 'b', 'c'])
+        g = Graph.from_edge_list(io.BytesIO("müller maier\n".encode('latin-1')), encoding='latin-1')
+        self.assertEqual(sorted(g.vertices), ['maier', 'müller'])
+
+    def test_graph_connected_components(self):
+        g = Graph()
+        for i in range(8):
+            g.add_vertex(i)
+        for v, u in [(0, 1), (1, 2), (3, 4), (6, 6)]:
+            g.add_edge(v, u)
+        self.assertEqual(sorted(g.connected_components()), [[0, 1, 2], [3, 4], [5], [6], [7]])
+        self.assertEqual(g.component_count(), 5)
+        self.assertTrue(g.same_component(0, 2))
+        self.assertFalse(g.same_component(2, 3))
+        self.assertEqual(sorted(self.dag.connected_components(), key=len)[-1][0], 'underwear')
+        self.assertEqual(self.dag.component_count(), 2)
+
+    def test_graph_same_component_incremental(self):
+        rng = random.Random(11)
+        g = Graph()
+        for i in range(100):
+            g.add_vertex(i)
+        self.assertFalse(g.same_component(0, 1))
+        for step in range(300):
+            if step % 10 == 0:
+                g.add_vertex(100 + step)
+            values = list(g.vertices)
+            v, u = rng.choice(values), rng.choice(values)
+            g.add_edge(v, u)
+            a, b = rng.choice(values), rng.choice(values)
+            self.assertEqual(g.same_component(a, b), b in g.breadth_first_search(a))
+        components = g.connected_components()
+        self.assertEqual(len(components), g.component_count())
+        for component in components:
+            self.assertEqual(sorted(g.breadth_first_search(component[0]).distance), sorted(component))
+
+    def test_graph_same_component_concurrent_readers(self):
+        rng = random.Random(13)
+        for _ in range(5):
+            g = Graph()
+            for i in range(2000):
+                g.add_vertex(i)
+            for i in range(0, 2000, 2):
+                g.add_edge(i, rng.randrange(0, 2000, 2))
+            queries = [(rng.randrange(2000), rng.randrange(2000)) for _ in range(200)]
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(lambda query: g.same_component(*query), queries))
+            for (v, u), result in zip(queries, results):
+                self.assertEqual(result, u in g.breadth_first_search(v))
+            self.assertEqual(g.component_count(), len(g.connected_components()))
+
+    def test_graph_pickle_and_deepcopy(self):
+        g = Graph()
+        for i in range(6):
+            g.add_vertex(i)
+        g.add_edge(0, 1)
+        g.add_edge(2, 3)
+        self.assertTrue(g.same_component(0, 1))
+        for clone in (pickle.loads(pickle.dumps(g)), copy.deepcopy(g)):
+            self.assertEqual(clone.component_count(), 4)
+            clone.add_edge(1, 2)
+            self.assertTrue(clone.same_component(0, 3))
+            self.assertFalse(g.same_component(0, 3))
+        self.assertEqual(pickle.loads(pickle.dumps(self.dag)).component_count(), 2)
+
+    def test_graph_strongly_connected_components(self):
+        rng = random.Random(12)
+        for _ in range(5):
+            g = Graph(directed=True)
+            for i in range(40):
+                g.add_vertex(i)
+            for _ in range(60):
+                g.add_edge(rng.randrange(40), rng.randrange(40))
+            components = g.strongly_connected_components()
+            self.assertEqual(sorted(value for component in components for value in component), list(range(40)))
+            position = {value: c for c, component in enumerate(components) for value in component}
+            reach = {value: g.breadth_first_search(value) for value in g.vertices}
+            for v in g.vertices:
+                for u in g.vertices:
+                    self.assertEqual(position[v] == position[u], u in reach[v] and v in reach[u])
+            for v, u in g.edges:
+                self.assertLessEqual(position[v.value], position[u.value])
+        self.assertRaises(ValueError, self.chain(3, directed=False).strongly_connected_components)
+
+    def test_graph_condensation(self):
+        g = Graph(directed=True)
+        for value in 'abcdefg':
+            g.add_vertex(value)
+        for v, u in ['ab', 'ba', 'bc', 'cd', 'dc', 'de', 'ae', 'fg', 'gf', 'fa']:
+            g.add_edge(v, u)
+        dag, component = g.condensation()
+        self.assertEqual(len(dag.vertices), 4)
+        self.assertEqual(component['a'], component['b'])
+        self.assertEqual(component['c'], component['d'])
+        self.assertEqual(component['f'], component['g'])
+        self.assertFalse(dag.has_cycle())
+        for v, u in g.edges:
+            if component[v.value] != component[u.value]:
+                self.assertIn(dag.vertices[component[u.value]], dag.adj[dag.vertices[component[v.value]]])
+        self.assertEqual(len(dag.edges), 4)
+        self.assertEqual(list(dag.topological_order()), [0, 1, 2, 3])
+
+    def test_graph_strongly_connected_components_deep(self):
+        g = self.chain(100_000)
+        g.add_edge(99_999, 0)
+        self.assertEqual(len(g.strongly_connected_components()), 1)
+        g = self.chain(100_000)
+        self.assertEqual(len(g.strongly_connected_components()), 100_000)
+
+    def assert_spanning_forest(self, g: Graph, tree, total) -> None:
+        self.assertEqual(len(tree), len(g.vertices) - g.component_count())
+        self.assertEqual(total, sum(weight for _, _, weight in tree))
+        forest = Graph()
+        for value in g.vertices:
+            forest.add_vertex(value)
+        for v, u, weight in tree:
+            self.assertEqual(g.adj[g.vertices[v]][g.vertices[u]], weight)
+            self.assertFalse(forest.same_component(v, u))
+            forest.add_edge(v, u, weight)
+
+    def test_graph_minimum_spanning_tree(self):
+        g = Graph(weighted=True)
+        for value in 'abcdefghi':
+            g.add_vertex(value)
+        for v, u, weight in [('a', 'b', 4), ('a', 'h', 8), ('b', 'c', 8), ('b', 'h', 11), ('c', 'd', 7),
+                             ('c', 'f', 4), ('c', 'i', 2), ('d', 'e', 9), ('d', 'f', 14), ('e', 'f', 10),
+                             ('f', 'g', 2), ('g', 'h', 1), ('g', 'i', 6), ('h', 'i', 7)]:
+            g.add_edge(v, u, weight)
+        for tree, total in (g.kruskal(), g.prim()):
+            self.assertEqual(total, 37)
+            self.assert_spanning_forest(g, tree, total)
+        self.assertRaises(ValueError, self.dag.kruskal)
+        self.assertRaises(ValueError, self.dag.prim)
+
+    def test_graph_minimum_spanning_forest_random(self):
+        for seed in range(5):
+            g = self.weighted_graph(50, 70 + 40 * seed, directed=False, seed=seed)
+            kruskal_tree, kruskal_total = g.kruskal()
+            prim_tree, prim_total = g.prim()
+            self.assertEqual(kruskal_total, prim_total)
+            self.assert_spanning_forest(g, kruskal_tree, kruskal_total)
+            self.assert_spanning_forest(g, prim_tree, prim_total)
@@ -0,0 +1,248 @@
+from src.pystructs.heaps import MaxHeap, MinHeap, DaryHeap, ArrayMinHeap, ArrayMaxHeap, nlargest, nsmallest
+import random
+import unittest
+
+
+class TestMaxHeap(unittest.TestCase):
+    def test_max_heap_extract_order(self):
+        values = random.Random(0).sample(range(1000), 200)
+        heap = MaxHeap(values)
+        self.assertEqual([heap.extract_max() for _ in range(200)], sorted(values, reverse=True))
+        self.assertEqual(heap.positions, {})
+        with self.assertRaises(IndexError):
+            heap.extract_max()
+
+    def test_max_heap_positions(self):
+        heap = MaxHeap()
+        for i in range(50):
+            heap.insert(f"v{i}", i % 7)
+        heap.set_priority("v3", 100)
+        self.assertEqual(heap.extract_max(), "v3")
+        for _ in range(20):
+            heap.extract_max()
+            for item, i in heap.positions.items():
+                self.assertEqual(heap.heap[i].value, item)
+
+
+class TestMinHeap(unittest.TestCase):
+    def assert_positions(self, heap) -> None:
+        self.assertEqual(len(heap.positions), len(heap.heap))
+        for item, i in heap.positions.items():
+            self.assertEqual(heap.heap[i].value, item)
+
+    def test_min_heap_extract_order(self):
+        values = random.Random(1).sample(range(1000), 200)
+        for heap in (MinHeap(values), DaryHeap(values), DaryHeap(values, d=3), DaryHeap(values, d=8)):
+            self.assert_positions(heap)
+            self.assertEqual(heap.min().value, min(values))
+            self.assertEqual([heap.extract_min() for _ in range(200)], sorted(values))
+            with self.assertRaises(IndexError):
+                heap.extract_min()
+
+    def test_min_heap_decrease_key(self):
+        rng = random.Random(2)
+        for heap in (MinHeap(), DaryHeap(), DaryHeap(d=5)):
+            priorities = {}
+            for i in range(300):
+                priorities[i] = rng.randrange(10_000)
+                heap.insert(i, priorities[i])
+            for i in rng.sample(range(300), 100):
+                priorities[i] -= rng.randrange(10_000)
+                heap.set_priority(i, priorities[i])
+            self.assert_positions(heap)
+            order = [heap.extract_min() for _ in range(300)]
+            self.assertEqual([priorities[i] for i in order], sorted(priorities.values()))
+
+    def test_dary_heap_str(self):
+        self.assertEqual(str(DaryHeap(range(6), d=4)), "  4\n  3\n0\n  2\n  1\n    5\n")
+        self.assertEqual(str(MinHeap(range(4))), "  2\n0\n  1\n    3\n")
+        self.assertEqual(str(DaryHeap(d=3)), "Heap is empty")
+
+    def test_dary_heap_invalid_d(self):
+        with self.assertRaises(ValueError):
+            DaryHeap(d=1)
+
+
+class TestHeapBulk(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(4)
+        self.pairs = [(f"item{i}", rng.randrange(500)) for i in range(400)]
+
+    def assert_ordered(self, heap, items, reverse=False) -> None:
+        priorities = dict(self.pairs)
+        self.assertEqual(sorted(items), sorted(item for item, _ in self.pairs))
+        got = [priorities[item] for item in items]
+        self.assertEqual(got, sorted(got, reverse=reverse))
+
+    def test_heap_heapify(self):
+        for heap in (MinHeap(), DaryHeap(d=3)):
+            heap.heapify(self.pairs)
+            self.assertEqual(len(heap), 400)
+            self.assert_ordered(heap, heap.pop_many(500))
+        heap = MaxHeap()
+        heap.heapify(self.pairs)
+        self.assert_ordered(heap, heap.pop_many(400), reverse=True)
+
+    def test_heap_push_many(self):
+        for batches in ([400], [1] * 400, [300, 50, 50], [10, 390]):
+            heap = DaryHeap()
+            start = 0
+            for size in batches:
+                heap.push_many(self.pairs[start:start + size])
+                start += size
+            for item, i in heap.positions.items():
+                self.assertEqual(heap.heap[i].value, item)
+            first = heap.pop_many(100)
+            self.assert_ordered(heap, first + heap.pop_many(300))
+            self.assertEqual(heap.pop_many(3), [])
+
+    def test_heap_pushpop(self):
+        heap = MinHeap([5, 3, 8])
+        self.assertEqual(heap.pushpop(1), 1)
+        self.assertEqual(heap.pushpop(4), 3)
+        self.assertEqual(heap.pop_many(3), [4, 5, 8])
+        self.assertEqual(heap.pushpop(2), 2)
+
+    def test_heap_nlargest_nsmallest(self):
+        priorities = dict(self.pairs)
+        largest = nlargest(10, iter(self.pairs))
+        self.assertEqual([priorities[item] for item in largest],
+                         sorted(priorities.values(), reverse=True)[:10])
+        smallest = nsmallest(10, iter(self.pairs))
+        self.assertEqual([priorities[item] for item in smallest], sorted(priorities.values())[:10])
+        self.assertEqual(nlargest(0, self.pairs), [])
+        self.assertEqual(len(nsmallest(1000, self.pairs)), 400)
+
+
+class TestHeapUpdates(unittest.TestCase):
+    def assert_heap(self, heap, expected) -> None:
+        self.assertEqual(len(heap.positions), len(heap.heap))
+        for item, i in heap.positions.items():
+            self.assertEqual(heap.heap[i].value, item)
+        for i in range(1, len(heap.heap)):
+            parent, child = heap.heap[(i - 1) // heap.d].priority, heap.heap[i].priority
+            if isinstance(heap, MaxHeap):
+                self.assertGreaterEqual(parent, child)
+            else:
+                self.assertLessEqual(parent, child)
+        self.assertEqual({node.value: node.priority for node in heap.heap}, expected)
+
+    def test_heap_remove(self):
+        heap = MaxHeap(list(range(20)))
+        for item in (0, 19, 7, 12):
+            heap.remove(item)
+            self.assertNotIn(item, heap)
+        self.assertEqual(heap.pop_many(16), [18, 17, 16, 15, 14, 13, 11, 10, 9, 8, 6, 5, 4, 3, 2, 1])
+        with self.assertRaises(ValueError):
+            heap.remove(3)
+
+    def test_heap_set_priority_both_ways(self):
+        heap = MaxHeap(list(range(10)))
+        heap.set_priority(9, -1)
+        heap.set_priority(0, 100)
+        self.assertEqual(heap.pop_many(10), [0, 8, 7, 6, 5, 4, 3, 2, 1, 9])
+
+    def test_heap_random_operations(self):
+        rng = random.Random(7)
+        for heap in (MaxHeap(), MinHeap(), DaryHeap(d=3)):
+            expected = {}
+            next_item = 0
+            for step in range(20_000):
+                operation = rng.random()
+                if operation < 0.35 or not expected:
+                    expected[next_item] = rng.randrange(1000)
+                    heap.insert(next_item, expected[next_item])
+                    next_item += 1
+                elif operation < 0.65:
+                    item = rng.choice(list(expected)) if len(expected) < 50 else next_item - rng.randint(1, 50)
+                    if item in expected:
+                        expected[item] = rng.randrange(1000)
+                        heap.set_priority(item, expected[item])
+                elif operation < 0.85:
+                    item = next_item - rng.randint(1, 50)
+                    if item in expected:
+                        del expected[item]
+                        heap.remove(item)
+                else:
+                    [top] = heap.pop_many(1)
+                    best = max(expected.values()) if isinstance(heap, MaxHeap) else min(expected.values())
+                    self.assertEqual(expected.pop(top), best)
+                if step % 1000 == 0:
+                    self.assert_heap(heap, expected)
+            self.assert_heap(heap, expected)
+
+
+class TestArrayHeap(unittest.TestCase):
+    def assert_heap(self, heap, expected) -> None:
+        self.assertEqual(len(heap.items), len(heap.priorities))
+        self.assertEqual(len(heap.positions), len(heap.items))
+        for item, i in heap.positions.items():
+            self.assertEqual(heap.items[i], item)
+        for i in range(1, len(heap.items)):
+            self.assertGreaterEqual(heap.priorities[i], heap.priorities[(i - 1) // heap.d])
+        self.assertEqual({item: heap.priority(item) for item in heap.items}, expected)
+
+    def test_array_heap_order(self):
+        pairs = [(f"item{i}", p) for i, p in enumerate(random.Random(5).sample(range(1000), 300))]
+        priorities = dict(pairs)
+        for heap in (ArrayMinHeap(pairs=pairs), ArrayMinHeap(d=4, pairs=pairs)):
+            self.assertEqual(heap.min().priority, min(priorities.values()))
+            self.assertEqual([priorities[item] for item in heap.pop_many(300)], sorted(priorities.values()))
+            with self.assertRaises(IndexError):
+                heap.extract_min()
+        heap = ArrayMaxHeap()
+        heap.push_many(pairs[:100])
+        heap.push_many(pairs[100:])
+        self.assertEqual(heap.max().priority, max(priorities.values()))
+        self.assertEqual([priorities[heap.extract_max()] for _ in range(300)],
+                         sorted(priorities.values(), reverse=True))
+
+    def test_array_heap_matches_node_heap_api(self):
+        values = [3, 1, 2, 5, 4]
+        pairs = [('c', 3), ('a', 1), ('b', 2)]
+        for node_heap, array_heap in ((MinHeap(values), ArrayMinHeap(values)), (MaxHeap(values), ArrayMaxHeap(values)),
+                                      (DaryHeap(values, d=3), ArrayMinHeap(values, d=3)),
+                                      (MinHeap(pairs=pairs), ArrayMinHeap(pairs=pairs)),
+                                      (MaxHeap(pairs=pairs), ArrayMaxHeap(pairs=pairs))):
+            top = node_heap.max() if isinstance(node_heap, MaxHeap) else node_heap.min()
+            array_top = array_heap.max() if isinstance(array_heap, ArrayMaxHeap) else array_heap.min()
+            self.assertEqual((array_top.value, array_top.priority), (top.value, top.priority))
+            self.assertEqual(array_heap.pop_many(5), node_heap.pop_many(5))
+        with self.assertRaises(ValueError):
+            ArrayMinHeap(values, pairs=pairs)
+
+    def test_array_heap_random_operations(self):
+        rng = random.Random(8)
+        for heap in (ArrayMinHeap(), ArrayMinHeap(d=3), ArrayMaxHeap()):
+            expected = {}
+            for step in range(10_000):
+                operation = rng.random()
+                item = rng.randrange(500)
+                if operation < 0.4:
+                    if item not in heap:
+                        expected[item] = float(rng.randrange(1000))
+                        heap.insert(item, expected[item])
+                elif operation < 0.7:
+                    if item in heap:
+                        expected[item] = float(rng.randrange(1000))
+                        heap.set_priority(item, expected[item])
+                elif operation < 0.85:
+                    if item in heap:
+                        del expected[item]
+                        heap.remove(item)
+                elif expected:
+                    [top] = heap.pop_many(1)
+                    best = max(expected.values()) if isinstance(heap, ArrayMaxHeap) else min(expected.values())
+                    self.assertEqual(expected.pop(top), best)
+                if step % 500 == 0:
+                    self.assert_heap(heap, expected)
+            self.assert_heap(heap, expected)
+
+    def test_array_heap_nlargest(self):
+        heap = ArrayMinHeap()
+        for i in range(100):
+            if len(heap) < 5:
+                heap.insert(i, (i * 37) % 101)
+            else:
+                heap.pushpop(i, (i * 37) % 101)
+        self.assertEqual(sorted(heap.priority(item) for item in heap.items), [96, 97, 98, 99, 100])
@@ -0,0 +1,88 @@
+from src.pystructs.linked_list import DoublyLinkedList
+import unittest
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def setUp(self):
+        self.test_list = [1, 2, 3, 4, 5]
+        self.linked_list = DoublyLinkedList(self.test_list)
+
+    def assert_links(self, linked_list):
+        """Walk the list in both directions and check every prev pointer mirrors a next pointer"""
+        forward = list(linked_list)
+        self.assertEqual(list(reversed(linked_list)), forward[::-1])
+        self.assertEqual(len(linked_list), len(forward))
+        if linked_list.head is not None:
+            self.assertIsNone(linked_list.head.prev)
+            self.assertIsNone(linked_list.last.next)
+
+    def test_doubly_linked_list_initialization(self):
+        self.assertTrue(self.linked_list == self.test_list)
+        self.assert_links(self.linked_list)
+        self.assert_links(DoublyLinkedList())
+
+    def test_doubly_linked_list_get_set_item(self):
+        for i in range(len(self.test_list)):
+            self.assertEqual(self.linked_list[i], self.test_list[i])
+        self.linked_list[3] = 99
+        self.assertTrue(self.linked_list == [1, 2, 3, 99, 5])
+        self.assertRaises(IndexError, self.linked_list.__getitem__, 5)
+
+    def test_doubly_linked_list_slice(self):
+        sliced_list = self.linked_list[1:4]
+        self.assertIsInstance(sliced_list, DoublyLinkedList)
+        self.assertTrue(sliced_list == [2, 3, 4])
+        self.assert_links(sliced_list)
+        self.assertTrue(self.linked_list[::-2] == [5, 3, 1])
+
+    def test_doubly_linked_list_insert(self):
+        self.linked_list.insert(0, 0)
+        self.linked_list.insert(100, 6)
+        self.linked_list.insert(3, 99)
+        self.linked_list.insert(-1, 98)
+        self.assertTrue(self.linked_list == [0, 1, 2, 99, 3, 4, 5, 98, 6])
+        self.assert_links(self.linked_list)
+
+    def test_doubly_linked_list_append(self):
+        empty_linked_list = DoublyLinkedList()
+        empty_linked_list.append(1)
+        empty_linked_list.append(2)
+        self.assertTrue(empty_linked_list == [1, 2])
+        self.assert_links(empty_linked_list)
+
+    def test_doubly_linked_list_pop(self):
+        self.assertRaises(IndexError, DoublyLinkedList().pop)
+        self.assertRaises(IndexError, self.linked_list.pop, 5)
+        self.assertEqual(self.linked_list.pop(), 5)
+        self.assertEqual(self.linked_list.pop(-1), 4)
+        self.assertEqual(self.linked_list.pop(0), 1)
+        self.assertEqual(self.linked_list.pop(1), 3)
+        self.assertTrue(self.linked_list == [2])
+        self.assertEqual(self.linked_list.pop(), 2)
+        self.assertIsNone(self.linked_list.head)
+        self.assertIsNone(self.linked_list.last)
+
+    def test_doubly_linked_list_remove(self):
+        self.assertRaises(ValueError, self.linked_list.remove, 10)
+        self.linked_list.remove(5)
+        self.linked_list.remove(1)
+        self.linked_list.remove(3)
+        self.assertTrue(self.linked_list == [2, 4])
+        self.assert_links(self.linked_list)
+
+    def test_doubly_linked_list_reverse(self):
+        self.linked_list.reverse()
+        self.assertTrue(self.linked_list == [5, 4, 3, 2, 1])
+        self.assert_links(self.linked_list)
+
+    def test_doubly_linked_list_concatenation(self):
+        added = self.linked_list + [6, 7]
+        self.assertIsInstance(added, DoublyLinkedList)
+        self.assertTrue(added == [1, 2, 3, 4, 5, 6, 7])
+        self.assert_links(added)
+        repeated = DoublyLinkedList([1, 2]) * 3
+        self.assertTrue(repeated == [1, 2, 1, 2, 1, 2])
+        self.assert_links(repeated)
+        self.linked_list.extend(self.linked_list)
+        self.assertTrue(self.linked_list == self.test_list * 2)
+        self.assert_links(self.linked_list)
@@ -0,0 +1,54 @@
+from src.pystructs.linked_list import LinkedList, DoublyLinkedList, UnrolledLinkedList
+import unittest
+
+
+class TestLinkedListBulk(unittest.TestCase):
+    def check_links(self, linked_list, expected):
+        self.assertTrue(linked_list == expected)
+        self.assertEqual(len(linked_list), len(expected))
+        if expected:
+            self.assertEqual(linked_list[len(expected) - 1], expected[-1])
+            linked_list.append('end')
+            self.assertEqual(list(linked_list)[-1], 'end')
+            linked_list.pop()
+
+    def test_linked_list_extend(self):
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            linked_list = linked_list_type()
+            linked_list.extend([1, 2])
+            self.check_links(linked_list, [1, 2])
+            linked_list.extend(linked_list_type([3, 4]))
+            self.check_links(linked_list, [1, 2, 3, 4])
+            linked_list.extend(linked_list)
+            self.check_links(linked_list, [1, 2, 3, 4, 1, 2, 3, 4])
+            linked_list.extend(())
+            self.check_links(linked_list, [1, 2, 3, 4, 1, 2, 3, 4])
+            self.assertRaises(TypeError, linked_list.extend, 1)
+
+    def test_linked_list_add_and_mul(self):
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            linked_list = linked_list_type([1, 2, 3])
+            self.check_links(linked_list + linked_list_type([4]), [1, 2, 3, 4])
+            self.check_links(linked_list + [], [1, 2, 3])
+            self.check_links(linked_list * 3, [1, 2, 3] * 3)
+            self.check_links(linked_list * 0, [])
+            self.check_links(linked_list.copy(), [1, 2, 3])
+
+    def test_linked_list_splice(self):
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            linked_list = linked_list_type([1, 2])
+            other = linked_list_type([3, 4, 5])
+            linked_list.splice(other)
+            self.check_links(linked_list, [1, 2, 3, 4, 5])
+            self.check_links(other, [])
+            self.assertIsNone(other.head)
+
+            empty_linked_list = linked_list_type()
+            empty_linked_list.splice(linked_list)
+            self.check_links(empty_linked_list, [1, 2, 3, 4, 5])
+            empty_linked_list.splice(linked_list_type())
+            self.check_links(empty_linked_list, [1, 2, 3, 4, 5])
+
+            self.assertRaises(ValueError, linked_list.splice, linked_list)
+        self.assertRaises(TypeError, LinkedList().splice, DoublyLinkedList())
+        self.assertRaises(TypeError, LinkedList().splice, [1, 2])
@@ -0,0 +1,94 @@
+from src.pystructs.linked_list import LinkedList, DoublyLinkedList
+import random
+import unittest
+
+
+class TestLinkedListIndex(unittest.TestCase):
+    def check_random_operations(self, linked_list_type, stride):
+        rng = random.Random(stride)
+        expected = list(range(50))
+        linked_list = linked_list_type(expected)
+        linked_list.build_index(stride)
+        for _ in range(1000):
+            operation = rng.random()
+            if operation < 0.3:
+                index = rng.randrange(len(expected) + 1)
+                expected.insert(index, -index)
+                linked_list.insert(index, -index)
+            elif operation < 0.45:
+                expected.append(operation)
+                linked_list.append(operation)
+            elif operation < 0.65 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(linked_list.pop(index), expected.pop(index))
+            elif operation < 0.8 and expected:
+                index = rng.randrange(len(expected))
+                expected[index] = operation
+                linked_list[index] = operation
+            elif expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(linked_list[index], expected[index])
+        self.assertTrue(linked_list == expected)
+
+    def test_linked_list_indexed_random_operations(self):
+        for stride in (None, 1, 3, 16):
+            self.check_random_operations(LinkedList, stride)
+            self.check_random_operations(DoublyLinkedList, stride)
+
+    def test_linked_list_index_survives_structural_changes(self):
+        linked_list = LinkedList(range(10))
+        linked_list.build_index(2)
+        self.assertEqual(linked_list[7], 7)
+        linked_list.reverse()
+        self.assertEqual(linked_list[7], 2)
+        linked_list.reverse()
+        self.assertEqual(linked_list[7], 7)
+        linked_list.remove(0)
+        self.assertEqual(linked_list[7], 8)
+        linked_list.drop_index()
+        self.assertEqual(linked_list[7], 8)
+        self.assertRaises(ValueError, linked_list.build_index, 0)
+
+    def test_linked_list_index_not_rebuilt_after_mutation(self):
+        for cls in (LinkedList, DoublyLinkedList):
+            linked_list = cls(range(100))
+            linked_list.build_index(10)
+            self.assertEqual(linked_list[50], 50)
+            index = linked_list._index
+            linked_list.insert(30, "a")
+            linked_list.pop(70)
+            linked_list.remove(5)
+            linked_list.pop(0)
+            self.assertIs(linked_list._index, index)
+            expected = list(range(100))
+            expected.insert(30, "a")
+            expected.pop(70)
+            expected.remove(5)
+            expected.pop(0)
+            for position in (0, 28, 29, 50, len(expected) - 1):
+                self.assertEqual(linked_list[position], expected[position])
+            self.assertIs(linked_list._index, index)
+
+    def test_linked_list_default_stride_follows_length(self):
+        linked_list = LinkedList(range(4))
+        linked_list.build_index()
+        self.assertEqual(linked_list[2], 2)
+        linked_list.extend(range(4, 10_000))
+        linked_list.insert(5000, 'a')
+        self.assertEqual(linked_list[5001], 5000)
+        self.assertEqual(linked_list._index_step, 100)
+        self.assertIsNone(linked_list._index_stride)
+        linked_list.build_index(7)
+        self.assertEqual(linked_list[5001], 5000)
+        self.assertEqual(linked_list._index_step, 7)
+
+    def test_linked_list_lexicographic_comparison(self):
+        for left, right in (([1, 2, 3], [1, 2, 4]), ([1, 2], [1, 2, 0]), ([2], [1, 9, 9]), ([], []), ([1], [1])):
+            linked_list = LinkedList(left)
+            for other in (right, LinkedList(right)):
+                self.assertEqual(linked_list < other, left < right)
+                self.assertEqual(linked_list <= other, left <= right)
+                self.assertEqual(linked_list > other, left > right)
+                self.assertEqual(linked_list >= other, left >= right)
+                self.assertEqual(linked_list == other, left == right)
+                self.assertEqual(linked_list != other, left != right)
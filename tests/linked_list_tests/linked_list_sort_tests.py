@@ -0,0 +1,74 @@
+from src.pystructs.linked_list import LinkedList, DoublyLinkedList, UnrolledLinkedList
+import random
+import unittest
+
+
+class TestLinkedListSort(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        shuffled = [rng.randrange(50) for _ in range(300)]
+        self.inputs = [
+            [], [1], [2, 1], shuffled, sorted(shuffled), sorted(shuffled, reverse=True),
+            list(range(100)) + list(range(50)), [3, 2, 1] * 20,
+        ]
+
+    def check_sorted(self, linked_list_type, values, **kwargs):
+        linked_list = linked_list_type(values)
+        linked_list.sort(**kwargs)
+        expected = sorted(values, **kwargs)
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(len(linked_list), len(expected))
+        if expected:
+            self.assertEqual(linked_list[len(expected) - 1], expected[-1])
+            if linked_list_type is DoublyLinkedList:
+                self.assertEqual(list(reversed(linked_list)), expected[::-1])
+
+    def test_linked_list_sort(self):
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            for values in self.inputs:
+                self.check_sorted(linked_list_type, values)
+                self.check_sorted(linked_list_type, values, reverse=True)
+
+    def test_linked_list_sort_is_stable_with_key(self):
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            for values in self.inputs:
+                pairs = [(value % 7, i) for i, value in enumerate(values)]
+                self.check_sorted(linked_list_type, pairs, key=lambda pair: pair[0])
+                self.check_sorted(linked_list_type, pairs, key=lambda pair: pair[0], reverse=True)
+
+    def test_linked_list_sort_calls_key_once_per_value(self):
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return -value
+
+        linked_list = LinkedList(range(100))
+        linked_list.sort(key=key)
+        self.assertEqual(len(calls), 100)
+        self.assertTrue(linked_list == list(range(99, -1, -1)))
+
+    def test_linked_list_sort_keeps_order_when_comparison_fails(self):
+        values = [3, 1, 'a', 2, 0]
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            linked_list = linked_list_type(values)
+            self.assertRaises(TypeError, linked_list.sort)
+            self.assertEqual(list(linked_list), values)
+            self.assertEqual(len(linked_list), len(values))
+            self.assertEqual(linked_list[4], 0)
+            if linked_list_type is DoublyLinkedList:
+                self.assertEqual(list(reversed(linked_list)), values[::-1])
+
+    def test_linked_list_sort_keeps_values_when_key_fails(self):
+        def key(value):
+            if value == 2:
+                raise KeyError(value)
+            return value
+
+        values = [3, 1, 4, 2, 0]
+        for linked_list_type in (LinkedList, DoublyLinkedList, UnrolledLinkedList):
+            linked_list = linked_list_type(values)
+            self.assertRaises(KeyError, linked_list.sort, key=key)
+            self.assertEqual(list(linked_list), values)
+            linked_list.sort()
+            self.assertEqual(list(linked_list), sorted(values))
@@ -0,0 +1,97 @@
+from src.pystructs.linked_list import UnrolledLinkedList
+from tests.linked_list_tests import linked_list_string_tests
+import random
+
+
+class TestUnrolledLinkedList(linked_list_string_tests.TestLinkedList):
+    """Runs the LinkedList suite against an UnrolledLinkedList with tiny chunks so every operation crosses nodes"""
+    def setUp(self):
+        self.test_list = [1, 2, 3]
+        self.linked_list = UnrolledLinkedList(self.test_list, node_capacity=2)
+
+    def test_linked_list_initialization(self):
+        self.assertEqual(len(self.linked_list), len(self.test_list))
+
+        values = []
+        curr = self.linked_list.head
+        while curr is not None:
+            self.assertLessEqual(len(curr.values), self.linked_list.node_capacity)
+            values.extend(curr.values)
+            curr = curr.next
+        self.assertEqual(values, self.test_list)
+
+    def test_linked_list_iterator(self):
+        self.assertEqual(list(self.linked_list), self.test_list)
+
+        nodes = list(self.linked_list.__iter__(return_nodes=True))
+        self.assertEqual([value for node in nodes for value in node.values], self.test_list)
+
+        for curr, prev in self.linked_list.__iter__(return_prev=True):
+            if prev is not None:
+                self.assertIs(prev.next, curr)
+
+    def test_linked_list_get_slice(self):
+        self.linked_list.extend([4, 5, 6, 7, 8, 9])
+
+        sliced_list = self.linked_list[1:4]
+        self.assertIsInstance(sliced_list, UnrolledLinkedList)
+        self.assertTrue(sliced_list == [2, 3, 4])
+
+        sliced_list = self.linked_list[4:]
+        self.assertTrue(sliced_list == [5, 6, 7, 8, 9])
+
+        sliced_list = self.linked_list[::2]
+        self.assertTrue(sliced_list == [1, 3, 5, 7, 9])
+
+        sliced_list = self.linked_list[::-1]
+        self.assertTrue(sliced_list == [9, 8, 7, 6, 5, 4, 3, 2, 1])
+
+        sliced_list = self.linked_list[1:6:-2]
+        self.assertTrue(sliced_list == [6, 4, 2])
+
+        self.assertTrue(UnrolledLinkedList(range(10), 4)[2:7] == [2, 3, 4, 5, 6])
+
+    def test_unrolled_linked_list_random_operations(self):
+        rng = random.Random(0)
+        expected = []
+        unrolled = UnrolledLinkedList(node_capacity=4)
+        for _ in range(2000):
+            operation = rng.random()
+            if operation < 0.5 or not expected:
+                index = rng.randrange(len(expected) + 1)
+                value = rng.randrange(100)
+                expected.insert(index, value)
+                unrolled.insert(index, value)
+            elif operation < 0.8:
+                index = rng.randrange(len(expected))
+                self.assertEqual(unrolled.pop(index), expected.pop(index))
+            elif operation < 0.9:
+                value = rng.choice(expected)
+                expected.remove(value)
+                unrolled.remove(value)
+            else:
+                index = rng.randrange(len(expected))
+                self.assertEqual(unrolled[index], expected[index])
+        self.assertEqual(list(unrolled), expected)
+        self.assertEqual(list(reversed(unrolled)), expected[::-1])
+        self.assertEqual(len(unrolled), len(expected))
+
+    def test_unrolled_linked_list_sort_and_reverse(self):
+        values = [5, 3, 8, 1, 9, 2, 7]
+        unrolled = UnrolledLinkedList(values, node_capacity=3)
+        unrolled.sort()
+        self.assertEqual(list(unrolled), sorted(values))
+        unrolled.reverse()
+        self.assertEqual(list(unrolled), sorted(values, reverse=True))
+        unrolled.append(0)
+        self.assertEqual(unrolled[len(unrolled) - 1], 0)
+
+    def test_unrolled_linked_list_build_index_is_a_no_op(self):
+        unrolled = UnrolledLinkedList(range(20), node_capacity=3)
+        unrolled.build_index(4)
+        unrolled.insert(5, 'a')
+        self.assertEqual(unrolled[5], 'a')
+        self.assertEqual(unrolled.pop(10), 9)
+        unrolled.drop_index()
+        self.assertEqual(list(unrolled), [0, 1, 2, 3, 4, 'a', 5, 6, 7, 8] + list(range(10, 20)))
+        self.assertRaises(ValueError, unrolled.build_index, 0)
@@ -0,0 +1,154 @@
+from src.pystructs.queues import ConcurrentQueue, ConcurrentPriorityQueue, AsyncQueue, AsyncPriorityQueue
+from queue import Empty, Full
+import asyncio
+import threading
+import time
+import unittest
+
+
+class TestConcurrentQueue(unittest.TestCase):
+    def test_concurrent_queue_fifo(self):
+        queue = ConcurrentQueue()
+        for i in range(5):
+            queue.put(i)
+        self.assertEqual(len(queue), 5)
+        self.assertEqual([queue.get() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(queue.is_empty())
+
+    def test_concurrent_queue_empty(self):
+        queue = ConcurrentQueue()
+        self.assertRaises(Empty, queue.get, block=False)
+        start = time.perf_counter()
+        self.assertRaises(Empty, queue.get, timeout=0.05)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        self.assertRaises(Empty, queue.get_many, 3, timeout=0.01)
+
+    def test_concurrent_queue_bounded(self):
+        queue = ConcurrentQueue(maxsize=2)
+        queue.put(1)
+        queue.put(2)
+        self.assertRaises(Full, queue.put, 3, block=False)
+        self.assertRaises(Full, queue.put, 3, timeout=0.01)
+        threading.Timer(0.05, queue.get).start()
+        queue.put(3, timeout=5)
+        self.assertEqual(queue.get_many(10), [2, 3])
+
+    def test_concurrent_queue_blocking_get(self):
+        queue = ConcurrentQueue()
+        threading.Timer(0.05, queue.put, ('late',)).start()
+        self.assertEqual(queue.get(timeout=5), 'late')
+
+    def test_concurrent_queue_producers_consumers(self):
+        queue = ConcurrentQueue(maxsize=16)
+        received = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for i in range(start, start + 1000):
+                queue.put(i)
+
+        def consume():
+            while True:
+                items = queue.get_many(8)
+                with lock:
+                    received.extend(item for item in items if item is not None)
+                if None in items:
+                    # Hand back stop markers meant for the other consumers
+                    for _ in range(items.count(None) - 1):
+                        queue.put(None)
+                    return
+
+        producers = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        for _ in consumers:
+            queue.put(None)
+        for thread in consumers:
+            thread.join()
+        self.assertEqual(sorted(received), list(range(4000)))
+
+    def test_concurrent_priority_queue(self):
+        queue = ConcurrentPriorityQueue(maxsize=3)
+        queue.put('low', priority=5)
+        queue.put('high', priority=1)
+        queue.put('mid', priority=3)
+        self.assertRaises(Full, queue.put, 'more', False, priority=0)
+        self.assertEqual(queue.get(), 'high')
+        self.assertEqual(queue.get_many(5), ['mid', 'low'])
+
+
+class TestAsyncQueue(unittest.TestCase):
+    def test_async_queue_producers_consumers(self):
+        async def run():
+            queue = AsyncQueue(maxsize=4)
+            received = []
+
+            async def produce(start):
+                for i in range(start, start + 200):
+                    await queue.put(i)
+
+            async def consume():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    received.append(item)
+
+            consumers = [asyncio.create_task(consume()) for _ in range(3)]
+            await asyncio.gather(*(produce(i * 200) for i in range(3)))
+            self.assertLessEqual(len(queue), 4)
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+            return received
+
+        self.assertEqual(sorted(asyncio.run(run())), list(range(600)))
+
+    def test_async_queue_nowait_and_cancel(self):
+        async def run():
+            queue = AsyncQueue(maxsize=1)
+            self.assertRaises(asyncio.QueueEmpty, queue.get_nowait)
+            queue.put_nowait(1)
+            self.assertRaises(asyncio.QueueFull, queue.put_nowait, 2)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.put(2), 0.01)
+            self.assertEqual(queue.get_nowait(), 1)
+
+            waiting = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            getter = asyncio.create_task(queue.get_many(5))
+            await asyncio.sleep(0)
+            queue.put_nowait(3)
+            self.assertEqual(await asyncio.wait_for(getter, 1), [3])
+
+        asyncio.run(run())
+
+    def test_async_queue_timeouts_do_not_leak_waiters(self):
+        async def run():
+            for queue in (AsyncQueue(maxsize=1), AsyncPriorityQueue(maxsize=1)):
+                for _ in range(50):
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await asyncio.wait_for(queue.get(), 0.01)
+                    self.assertEqual(len(queue._getters), 0)
+                queue.put_nowait(1)
+                for _ in range(50):
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await asyncio.wait_for(queue.put(2), 0.01)
+                    self.assertEqual(len(queue._putters), 0)
+                self.assertEqual(await queue.get(), 1)
+
+        asyncio.run(run())
+
+    def test_async_priority_queue(self):
+        async def run():
+            queue = AsyncPriorityQueue()
+            await queue.put('low', 5)
+            queue.put_nowait('high', 1)
+            await queue.put('mid', 3)
+            return [await queue.get() for _ in range(3)]
+
+        self.assertEqual(asyncio.run(run()), ['high', 'mid', 'low'])
@@ -0,0 +1,90 @@
+from src.pystructs.queues import Queue, PriorityQueue
+import random
+import unittest
+
+
+class TestQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = Queue()
+        for i in range(5):
+            self.queue.enqueue(i)
+
+    def test_queue_fifo_order(self):
+        self.assertEqual([self.queue.dequeue() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(self.queue.is_empty())
+
+    def test_queue_peek(self):
+        self.assertEqual(self.queue.peek(), 0)
+        self.queue.dequeue()
+        self.assertEqual(self.queue.peek(), 1)
+        self.assertRaises(IndexError, Queue().peek)
+
+    def test_queue_interleaved(self):
+        self.assertEqual(self.queue.dequeue(), 0)
+        self.queue.enqueue(5)
+        while len(self.queue) > 1:
+            self.queue.dequeue()
+        self.assertEqual(self.queue.dequeue(), 5)
+        self.queue.enqueue(6)
+        self.assertEqual(self.queue.peek(), 6)
+        self.assertEqual(len(self.queue), 1)
+
+    def test_queue_dequeue_empty(self):
+        self.assertRaises(IndexError, Queue().dequeue)
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = PriorityQueue()
+        self.handles = {}
+        for job, priority in [('backup', 5), ('email', 1), ('deploy', 3), ('report', 5), ('alert', 0), ('log', 3)]:
+            self.handles[job] = self.queue.enqueue(job, priority)
+
+    def test_priority_queue_order(self):
+        self.assertEqual(len(self.queue), 6)
+        self.assertEqual([self.queue.dequeue() for _ in range(6)],
+                         ['alert', 'email', 'deploy', 'log', 'backup', 'report'])
+        self.assertTrue(self.queue.is_empty())
+        self.assertRaises(IndexError, self.queue.dequeue)
+
+    def test_priority_queue_peek(self):
+        self.assertEqual(self.queue.peek(), 'alert')
+        self.assertEqual(self.queue.peek(), 'alert')
+        self.queue.dequeue()
+        self.assertEqual(self.queue.peek(), 'email')
+        self.assertRaises(IndexError, PriorityQueue().peek)
+
+    def test_priority_queue_update(self):
+        self.queue.update(self.handles['report'], 0)
+        self.queue.update(self.handles['alert'], 4)
+        self.queue.update(self.handles['deploy'], 3)
+        self.assertEqual(self.queue.priority(self.handles['alert']), 4)
+        self.assertEqual([self.queue.dequeue() for _ in range(6)],
+                         ['report', 'email', 'deploy', 'log', 'alert', 'backup'])
+        self.assertRaises(ValueError, self.queue.update, self.handles['report'], 1)
+
+    def test_priority_queue_cancel(self):
+        self.assertEqual(self.queue.cancel(self.handles['alert']), 'alert')
+        self.assertEqual(self.queue.cancel(self.handles['deploy']), 'deploy')
+        self.assertNotIn(self.handles['deploy'], self.queue)
+        self.assertRaises(ValueError, self.queue.cancel, self.handles['deploy'])
+        self.assertEqual([self.queue.dequeue() for _ in range(4)], ['email', 'log', 'backup', 'report'])
+
+    def test_priority_queue_random(self):
+        rng = random.Random(9)
+        queue = PriorityQueue()
+        expected = {}
+        for step in range(5000):
+            if rng.random() < 0.6 or not expected:
+                priority = rng.randrange(20)
+                handle = queue.enqueue(step, priority)
+                expected[handle] = (priority, handle, step)
+            elif rng.random() < 0.5:
+                handle = rng.choice(list(expected))
+                del expected[handle]
+                queue.cancel(handle)
+            else:
+                best = min(expected, key=expected.get)
+                self.assertEqual(queue.dequeue(), expected.pop(best)[2])
+        self.assertEqual([queue.dequeue() for _ in range(len(queue))],
+                         [expected[handle][2] for handle in sorted(expected, key=expected.get)])
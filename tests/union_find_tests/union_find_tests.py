@@ -0,0 +1,43 @@
+from src.pystructs.union_find import DisjointSet
+import random
+import unittest
+
+
+class TestDisjointSet(unittest.TestCase):
+    def test_disjoint_set_union_find(self):
+        sets = DisjointSet(10)
+        self.assertEqual(sets.count, 10)
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(2, 3))
+        self.assertTrue(sets.union(1, 3))
+        self.assertFalse(sets.union(0, 2))
+        self.assertTrue(sets.same(0, 3))
+        self.assertFalse(sets.same(0, 4))
+        self.assertEqual(sets.count, 7)
+        self.assertEqual(sorted(sets.groups().values()), [[0, 1, 2, 3], [4], [5], [6], [7], [8], [9]])
+
+    def test_disjoint_set_add(self):
+        sets = DisjointSet()
+        self.assertEqual(len(sets), 0)
+        self.assertEqual([sets.add() for _ in range(3)], [0, 1, 2])
+        sets.union(0, 2)
+        self.assertEqual(sets.count, 2)
+        self.assertEqual(sets.find(2), sets.find(0))
+
+    def test_disjoint_set_matches_reference(self):
+        rng = random.Random(10)
+        n = 500
+        sets = DisjointSet(n)
+        label = list(range(n))
+        for _ in range(400):
+            i, j = rng.randrange(n), rng.randrange(n)
+            sets.union(i, j)
+            old, new = label[i], label[j]
+            label = [new if x == old else x for x in label]
+            a, b = rng.randrange(n), rng.randrange(n)
+            self.assertEqual(sets.same(a, b), label[a] == label[b])
+        self.assertEqual(sets.count, len(set(label)))
+        # Path compression leaves every vertex at most one step from its root after a find
+        for i in range(n):
+            sets.find(i)
+            self.assertEqual(sets.parent[i], sets.find(i))